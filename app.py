@@ -1,5 +1,9 @@
 from flask import Flask, render_template, request, jsonify
+from collections import OrderedDict
+import hashlib
+import json
 import logging
+import threading
 
 app = Flask(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -29,9 +33,9 @@ def _lazy_load_analizador():
     """Carga módulos de análisis solo cuando se necesitan"""
     global _analizador_loaded
     if not _analizador_loaded:
-        global CerebroTonal, crear_cerebro_tonal, RulesEngine
+        global CerebroTonal, crear_cerebro_tonal, get_engine, ContextAnalyzer, VoiceLeadingUtils
         from analizador_tonal import CerebroTonal, crear_cerebro_tonal
-        from harmonic_rules import RulesEngine
+        from harmonic_rules import get_engine, ContextAnalyzer, VoiceLeadingUtils
         _analizador_loaded = True
         logger.info("Módulos de análisis cargados (lazy loading)")
 
@@ -41,6 +45,43 @@ cerebro_tonal = None
 # Motor de reglas armónicas (se configura por request)
 harmonic_engine = None
 
+# ============================================================================
+# CACHÉ DE RESULTADOS: misma partitura y tonalidad → misma respuesta
+# ============================================================================
+# El análisis es determinista. Al editar, el cliente reenvía a menudo la
+# misma partitura; se guardan en memoria (LRU acotada, sin disco: el de
+# Render Free es efímero) las últimas respuestas correctas. Solo se guardan
+# análisis completos: si algún par de acordes falló, no se cachea.
+# ============================================================================
+
+_RESULT_CACHE_SIZE = 64
+_result_cache = OrderedDict()
+_result_cache_lock = threading.Lock()  # gunicorn puede servir con hilos
+
+
+def _result_cache_key(partitura, tonalidad):
+    """Hash SHA-1 del JSON canónico de (partitura, tonalidad)"""
+    payload = json.dumps([partitura, tonalidad], sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def _result_cache_get(key):
+    """Respuesta en caché para la clave (la marca como la más reciente) o None"""
+    with _result_cache_lock:
+        respuesta = _result_cache.pop(key, None)
+        if respuesta is not None:
+            _result_cache[key] = respuesta
+        return respuesta
+
+
+def _result_cache_put(key, respuesta):
+    """Guarda la respuesta, descartando la menos usada si se supera el tamaño"""
+    with _result_cache_lock:
+        _result_cache[key] = respuesta
+        _result_cache.move_to_end(key)
+        while len(_result_cache) > _RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
 @app.route('/')
 def pagina_inicio():
     return render_template('index.html')
@@ -77,12 +118,13 @@ def crear_error(compas, tiempo_global, voces_implicadas, mensaje, color='#FF0000
     }
 
 # --- MOTOR DE ANÁLISIS ---
-def analizar_par_acordes(n_compas, n_tiempo, notas_actual, notas_siguiente, idx_tiempo_actual, analisis_actual=None, analisis_siguiente=None):
+def analizar_par_acordes(n_compas, n_tiempo, notas_actual, notas_siguiente, idx_tiempo_actual, analisis_actual=None, analisis_siguiente=None, incidencias=None):
     """Analiza dos acordes consecutivos aplicando todas las reglas de armonía
     
     Args:
         analisis_actual: Dict opcional con análisis funcional del acorde actual (desde analizador_tonal)
         analisis_siguiente: Dict opcional con análisis funcional del acorde siguiente
+        incidencias: Lista opcional donde anotar las excepciones capturadas
     """
     errores = []
     nombres = {'S': 'Soprano', 'A': 'Contralto', 'T': 'Tenor', 'B': 'Bajo'}
@@ -106,7 +148,7 @@ def analizar_par_acordes(n_compas, n_tiempo, notas_actual, notas_siguiente, idx_
         
         # Detectar consonancias perfectas con motor robusto (incluye excepciones)
         # Motor nuevo detecta: Quintas y Octavas (paralelas/consecutivas)
-        _analizar_conduccion_voces(acorde_act, acorde_sig, n_compas, idx_tiempo_actual, errores, analisis_actual, analisis_siguiente)
+        _analizar_conduccion_voces(acorde_act, acorde_sig, n_compas, idx_tiempo_actual, errores, analisis_actual, analisis_siguiente, incidencias)
         
         # NOTA: _analizar_septimas fue ELIMINADO
         # La resolución de séptimas ya está cubierta por SeventhResolutionRule en el motor
@@ -115,11 +157,13 @@ def analizar_par_acordes(n_compas, n_tiempo, notas_actual, notas_siguiente, idx_
     
     except Exception as e:
         logger.warning(f"Error analizando compás {n_compas}: {str(e)}")
+        if incidencias is not None:
+            incidencias.append(e)
     
     return errores
 
 
-def _analizar_conduccion_voces(acorde_act, acorde_sig, n_compas, idx_tiempo_actual, errores, analisis_actual=None, analisis_siguiente=None):
+def _analizar_conduccion_voces(acorde_act, acorde_sig, n_compas, idx_tiempo_actual, errores, analisis_actual=None, analisis_siguiente=None, incidencias=None):
     """
     Detecta errores de conducción usando el motor de reglas armónicas.
     
@@ -136,6 +180,7 @@ def _analizar_conduccion_voces(acorde_act, acorde_sig, n_compas, idx_tiempo_actu
         n_compas: Número de compás
         idx_tiempo_actual: Índice global del tiempo
         errores: Lista donde añadir errores detectados
+        incidencias: Lista opcional donde anotar las excepciones capturadas
     """
     global harmonic_engine
     
@@ -204,6 +249,8 @@ def _analizar_conduccion_voces(acorde_act, acorde_sig, n_compas, idx_tiempo_actu
     
     except Exception as e:
         logger.error(f"Error en motor de reglas armónicas: {e}")
+        if incidencias is not None:
+            incidencias.append(e)
         # No propagar el error, continuar con análisis
 
 
@@ -227,15 +274,6 @@ def analizar_partitura():
         partitura = datos.get('partitura', [])
         tonalidad = datos.get('tonalidad', {'tonica': 'C', 'modo': 'major'})
         
-        # Inicializar/actualizar el Cerebro Tonal con la tonalidad
-        cerebro_tonal = crear_cerebro_tonal(tonalidad['tonica'], tonalidad['modo'])
-        logger.info(f"Analizando en tonalidad: {tonalidad['tonica']} {tonalidad['modo']}")
-        
-        # Inicializar motor de reglas armónicas
-        global harmonic_engine
-        harmonic_engine = RulesEngine(key=tonalidad['tonica'], mode=tonalidad['modo'])
-        logger.info(f"Motor de reglas armónicas inicializado")
-        
         # Validar formato de partitura
         if not isinstance(partitura, list) or len(partitura) == 0:
             return jsonify({'errores': [], 'mensaje': 'Error: partitura inválida'}), 400
@@ -245,6 +283,21 @@ def analizar_partitura():
             if not isinstance(tiempo, dict) or not all(k in ['S', 'A', 'T', 'B'] for k in tiempo.keys()):
                 return jsonify({'errores': [], 'mensaje': f'Error: tiempo {i} con formato inválido'}), 400
         
+        cache_key = _result_cache_key(partitura, tonalidad)
+        cached = _result_cache_get(cache_key)
+        if cached is not None:
+            logger.info("Partitura ya analizada: respuesta en caché")
+            return jsonify(cached), 200
+        
+        # Inicializar/actualizar el Cerebro Tonal con la tonalidad
+        cerebro_tonal = crear_cerebro_tonal(tonalidad['tonica'], tonalidad['modo'])
+        logger.info(f"Analizando en tonalidad: {tonalidad['tonica']} {tonalidad['modo']}")
+        
+        # Motor de reglas armónicas (compartido por tonalidad entre peticiones)
+        global harmonic_engine
+        harmonic_engine = get_engine(tonalidad['tonica'], tonalidad['modo'])
+        logger.info(f"Motor de reglas armónicas inicializado")
+        
         # ===== ANÁLISIS FUNCIONAL (FASE 2.1) =====
         analisis_acordes = []
         for i, tiempo in enumerate(partitura):
@@ -257,6 +310,7 @@ def analizar_partitura():
         
         # ===== ANÁLISIS DE CONDUCCIÓN DE VOCES =====
         errores = []
+        incidencias = []  # Excepciones capturadas: el resultado no se cachea
         for i in range(len(partitura) - 1):
             if any(partitura[i].values()) and any(partitura[i+1].values()):
                 try:
@@ -271,7 +325,8 @@ def analizar_partitura():
                         partitura[i+1], 
                         i,                   # índice global
                         analisis_act,        # análisis funcional actual
-                        analisis_sig         # análisis funcional siguiente
+                        analisis_sig,        # análisis funcional siguiente
+                        incidencias
                     ))
                 except Exception as e:
                     logger.error(f"Error analizando compás {(i//4)+1}: {str(e)}")
@@ -290,7 +345,8 @@ def analizar_partitura():
                     {}, 
                     ult,
                     analisis_ult,  # análisis funcional del último acorde
-                    None           # no hay siguiente
+                    None,          # no hay siguiente
+                    incidencias
                 ))
             except Exception as e:
                 logger.error(f"Error analizando último acorde: {str(e)}")
@@ -301,13 +357,18 @@ def analizar_partitura():
         
         logger.info(f"Enviando respuesta con {len(analisis_acordes)} grados analizados")
         
-        return jsonify({
+        respuesta = {
             'errores': errores, 
             'mensaje': msg,
             'success': len(errores) == 0,
             'analisis_funcional': analisis_acordes,
             'tonalidad': tonalidad
-        }), 200
+        }
+        
+        if not incidencias:
+            _result_cache_put(cache_key, respuesta)
+        
+        return jsonify(respuesta), 200
         
     except Exception as e:
         logger.error(f"Error en /analizar_partitura: {str(e)}")
@@ -315,6 +376,11 @@ def analizar_partitura():
             'errores': [], 
             'mensaje': f'Error de servidor: {str(e)}'
         }), 500
+    
+    finally:
+        # Fin de la pieza (también si falló): liberar cachés de contexto
+        ContextAnalyzer.clear_progression_cache()
+        VoiceLeadingUtils.clear_progression_cache()
 
 
 @app.errorhandler(404)
@@ -45,8 +45,10 @@ Fecha: 2025-12-28
 #
 # =============================================================================
 
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Dict, List, Mapping, Optional, Tuple, Set
 from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
 import music21
 import logging
 
@@ -404,6 +406,13 @@ CHORD_DEFINITIONS = {
     }
 }
 
+# Solo lectura: Chord guarda referencias a estas definiciones (_definition),
+# compartidas entre todos los acordes e hilos
+CHORD_DEFINITIONS = MappingProxyType({
+    chord_type: MappingProxyType(definition)
+    for chord_type, definition in CHORD_DEFINITIONS.items()
+})
+
 
 # Mapa inverso: music21 quality → chord_type
 QUALITY_TO_CHORD_TYPE = {
@@ -418,6 +427,29 @@ QUALITY_TO_CHORD_TYPE = {
 }
 
 
+# Factores requeridos según el número de factores del acorde
+_TRIAD_FACTORS = frozenset({'1', '3', '5'})
+_SEVENTH_FACTORS = frozenset({'1', '3', '5', '7'})
+
+
+# =============================================================================
+# NOTAS → MIDI - Tabla precalculada
+# =============================================================================
+
+# Semitono de cada letra y de cada alteración (notación music21: '#' sostenido,
+# '-' bemol). La octava pertenece a la letra, como en music21: B#3 = C4 = 60
+_STEP_SEMITONES = {'C': 0, 'D': 2, 'E': 4, 'F': 5, 'G': 7, 'A': 9, 'B': 11}
+_ACCIDENTAL_SEMITONES = {'': 0, '#': 1, '##': 2, '-': -1, '--': -2}
+
+# 'G4' → 67 para todas las notas con alteración simple o doble, octavas 0-8
+NOTE_TO_MIDI: Dict[str, int] = {
+    f"{step}{accidental}{octave}": 12 * (octave + 1) + semitone + alter
+    for step, semitone in _STEP_SEMITONES.items()
+    for accidental, alter in _ACCIDENTAL_SEMITONES.items()
+    for octave in range(9)
+}
+
+
 # =============================================================================
 # CHORD CLASS - Representación de un acorde SATB
 # =============================================================================
@@ -459,6 +491,7 @@ class Chord:
         
         if not self.root and self.quality:
             logger.warning("Chord created without root - factor analysis will be incomplete")
+            self._cache_analysis()
             return
         
         # Determinar tipo de acorde
@@ -474,16 +507,32 @@ class Chord:
         
         # Verificar si tiene séptima
         self.has_seventh = '7' in self.voice_factors.values()
+        
+        self._cache_analysis()
+    
+    def _cache_analysis(self):
+        """
+        Guarda la definición y el recuento de factores una sola vez.
+        
+        Las consultas verticales (has_factor, is_complete, factores
+        duplicados/omitidos, cifrado) leen estas estructuras en lugar de
+        recorrer voice_factors y CHORD_DEFINITIONS en cada llamada.
+        """
+        self._definition = CHORD_DEFINITIONS.get(self.chord_type) if self.chord_type else None
+        
+        # {factor: nº de voces}, en el orden de aparición en voice_factors
+        counts: Dict[str, int] = {}
+        for factor in self.voice_factors.values():
+            counts[factor] = counts.get(factor, 0) + 1
+        self._factor_counts = counts
     
     def _analyze_factors(self):
         """Calcula automáticamente qué factor tiene cada voz."""
         from harmonic_rules import VoiceLeadingUtils
         
-        for voice in ['S', 'A', 'T', 'B']:
-            note = self.voices.get(voice)
-            if note and self.root:
-                factor = VoiceLeadingUtils.get_chord_factor(note, self.root)
-                self.voice_factors[voice] = factor
+        if self.root:
+            # Copia: el resultado cacheado es compartido entre acordes
+            self.voice_factors = dict(VoiceLeadingUtils.voice_factors(self.voices, self.root))
     
     # =========================================================================
     # CONSULTAS VERTICALES
@@ -499,61 +548,73 @@ class Chord:
     
     def has_factor(self, factor: str) -> bool:
         """Verifica si el acorde contiene un factor específico."""
-        return factor in self.voice_factors.values()
+        return factor in self._factor_counts
     
     def is_complete(self) -> bool:
         """Verifica si el acorde está completo (tiene 1, 3, y 5)."""
-        factors_present = set(self.voice_factors.values())
-        required = {'1', '3', '5'}
-        return required.issubset(factors_present)
+        return _TRIAD_FACTORS <= self._factor_counts.keys()
     
     def get_doubled_factors(self) -> List[str]:
         """Retorna qué factores están duplicados."""
-        factor_counts = {}
-        for factor in self.voice_factors.values():
-            if factor != '?':
-                factor_counts[factor] = factor_counts.get(factor, 0) + 1
-        return [f for f, count in factor_counts.items() if count > 1]
+        return [f for f, count in self._factor_counts.items() if count > 1 and f != '?']
     
     def get_missing_factors(self) -> List[str]:
         """Retorna qué factores faltan (para triadas/cuatriadas)."""
-        factors_present = set(self.voice_factors.values())
+        return list(self.missing_factors)
+    
+    @cached_property
+    def missing_factors(self) -> Tuple[str, ...]:
+        """
+        Factores que faltan, memoizados en la instancia.
+        
+        Los Chord se comparten entre reglas (caché por contenido en
+        harmonic_rules), así que el análisis se hace una sola vez.
+        """
+        return tuple(self._compute_missing_factors())
+    
+    def _compute_missing_factors(self) -> List[str]:
+        """Calcula los factores que faltan a partir del recuento de factores."""
+        definition = self._definition
         
-        if self.chord_type and self.chord_type in CHORD_DEFINITIONS:
-            definition = CHORD_DEFINITIONS[self.chord_type]
+        if definition:
             num_factors = definition['num_factors']
             
             if num_factors == 3:
-                required = {'1', '3', '5'}
+                required = _TRIAD_FACTORS
             elif num_factors == 4:
-                required = {'1', '3', '5', '7'}
+                required = _SEVENTH_FACTORS
             else:
                 return []
             
-            missing = required - factors_present
+            missing = required - self._factor_counts.keys()
             return list(missing)
         
         return []
     
     def get_intervals_from_root(self) -> List[int]:
+        """Retorna intervalos en semitonos desde la fundamental (ver intervals_from_root)."""
+        return list(self.intervals_from_root)
+    
+    @cached_property
+    def intervals_from_root(self) -> Tuple[int, ...]:
         """
-        Retorna intervalos en semitonos desde la fundamental.
+        Intervalos en semitonos desde la fundamental, memoizados en la instancia.
         
         Usado para detectar acordes cromáticos como 6ª Aumentada
         que tienen intervalos característicos (ej: 10 semitonos = 6ª Aug).
         
         Returns:
-            Lista de intervalos únicos en semitonos [0, 4, 7, 10]
-            Ejemplo: 6ª Aug Alemana: [0, 4, 6, 10]
+            Tupla de intervalos únicos en semitonos (0, 4, 7, 10)
+            Ejemplo: 6ª Aug Alemana: (0, 4, 6, 10)
                      (root, 3ª Mayor, 4ª Aug, 6ª Aug)
         
         Example:
             >>> chord = Chord(root='Ab', notes=['Ab3', 'C4', 'Eb4', 'Gb4'])
-            >>> chord.get_intervals_from_root()
-            [0, 4, 7, 10]  # Ab-C-Eb-Gb
+            >>> chord.intervals_from_root
+            (0, 4, 7, 10)  # Ab-C-Eb-Gb
         """
         if not self.root or not self.notes:
-            return []
+            return ()
         
         try:
             from music21 import interval
@@ -561,7 +622,7 @@ class Chord:
             # Encontrar la nota fundamental en la lista de notas
             root_pitch = next((n for n in self.notes if n.name == self.root.name), None)
             if not root_pitch:
-                return []
+                return ()
             
             intervals_st = []
             for note in self.notes:
@@ -574,18 +635,16 @@ class Chord:
                     intervals_st.append(semitones)
             
             # Eliminar duplicados y ordenar
-            return sorted(set(intervals_st))
+            return tuple(sorted(set(intervals_st)))
             
         except Exception as e:
             logger.debug(f"Error calculando intervalos: {e}")
-            return []
+            return ()
 
     
-    def get_definition(self) -> Optional[Dict]:
+    def get_definition(self) -> Optional[Mapping]:
         """Retorna la definición completa del tipo de acorde."""
-        if self.chord_type and self.chord_type in CHORD_DEFINITIONS:
-            return CHORD_DEFINITIONS[self.chord_type]
-        return None
+        return self._definition
     
     def get_figured_bass(self) -> str:
         """Retorna el cifrado barroco según inversión."""
@@ -631,19 +690,31 @@ class Progression:
     
     def get_voices_with_movement(self, from_factor: str, to_factor: str) -> List[str]:
         """Retorna voces que hacen un movimiento específico de factor."""
-        voices = []
-        for voice in ['S', 'A', 'T', 'B']:
-            movement = self.get_factor_movement(voice)
-            if movement == (from_factor, to_factor):
-                voices.append(voice)
-        return voices
+        return list(self.voices_by_movement.get((from_factor, to_factor), ()))
     
     def get_all_factor_movements(self) -> Dict[str, Tuple[str, str]]:
         """Retorna diccionario completo de movimientos."""
-        movements = {}
-        for voice in ['S', 'A', 'T', 'B']:
-            movements[voice] = self.get_factor_movement(voice)
-        return movements
+        return dict(self.factor_movements)
+    
+    @cached_property
+    def factor_movements(self) -> Dict[str, Tuple[str, str]]:
+        """
+        {voz: (factor_inicial, factor_final)} en orden SATB, calculado una
+        sola vez por progresión. Compartido: no modificar.
+        """
+        return {voice: self.get_factor_movement(voice) for voice in ['S', 'A', 'T', 'B']}
+    
+    @cached_property
+    def voices_by_movement(self) -> Dict[Tuple[str, str], Tuple[str, ...]]:
+        """
+        Índice inverso {(factor_inicial, factor_final): (voz, ...)} en orden
+        SATB: consultar un movimiento no recorre las cuatro voces.
+        Compartido: no modificar.
+        """
+        index: Dict[Tuple[str, str], List[str]] = {}
+        for voice, movement in self.factor_movements.items():
+            index.setdefault(movement, []).append(voice)
+        return {movement: tuple(voices) for movement, voices in index.items()}
     
     def __repr__(self) -> str:
         """Representación legible de la progresión."""
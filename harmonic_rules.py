@@ -22,11 +22,15 @@ Versión: 3.0 (Phase 3A)
 """
 
 from enum import Enum
-from typing import List, Dict, Callable, Optional, Any
+from typing import List, Dict, Callable, Optional, Any, Tuple, NamedTuple, ClassVar
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 import music21
 import logging
 
+from chord_knowledge import NOTE_TO_MIDI
+
 logger = logging.getLogger(__name__)
 
 
@@ -49,6 +53,13 @@ class RuleTier(Enum):
     ADVANCED = 3      # Tier 3: Refinamientos (modulaciones, acordes especiales)
 
 
+# Colores de error en la interfaz (por gravedad)
+_COLOR_RED = '#FF0000'
+_COLOR_ORANGE = '#FFA500'
+_COLOR_DARK_ORANGE = '#FF8C00'
+_COLOR_YELLOW = '#FFFF00'
+
+
 # =============================================================================
 # ANALIZADOR DE CONTEXTO
 # =============================================================================
@@ -69,6 +80,23 @@ class ContextAnalyzer:
         """
         Detecta si dos acordes son el mismo acorde con diferente disposición.
         
+        Memoizado por contenido (root, quality, inversion, S/A/T/B): varias
+        reglas consultan la misma transición. Ver _compute_voicing_change.
+        """
+        try:
+            return _voicing_change_cached(
+                _context_key(chord1, _VOICING_FIELDS),
+                _context_key(chord2, _VOICING_FIELDS)
+            )
+        except TypeError:
+            # Valores no hashables: calcular sin caché
+            return ContextAnalyzer._compute_voicing_change(chord1, chord2)
+    
+    @staticmethod
+    def _compute_voicing_change(chord1: Dict, chord2: Dict) -> bool:
+        """
+        Detecta si dos acordes son el mismo acorde con diferente disposición.
+        
         Detecta si dos acordes son el mismo acorde con diferente disposición (voicing).
         
         Un cambio de disposición ocurre cuando:
@@ -84,19 +112,20 @@ class ContextAnalyzer:
         Returns:
             True si es cambio de disposición válido, False si no
         """
-        from music21 import pitch
-        
         # DEBUG: Log para ver qué llega
-        logger.debug(f"=== is_voicing_change DEBUG ===")
-        logger.debug(f"chord1: root={chord1.get('root')}, quality={chord1.get('quality')}, inv={chord1.get('inversion')}")
-        logger.debug(f"chord2: root={chord2.get('root')}, quality={chord2.get('quality')}, inv={chord2.get('inversion')}")
+        logger.debug("=== is_voicing_change DEBUG ===")
+        logger.debug("chord1: root=%s, quality=%s, inv=%s",
+                     chord1.get('root'), chord1.get('quality'), chord1.get('inversion'))
+        logger.debug("chord2: root=%s, quality=%s, inv=%s",
+                     chord2.get('root'), chord2.get('quality'), chord2.get('inversion'))
         
         # Verificar que sean el mismo acorde básico
         same_root = chord1.get('root') == chord2.get('root')
         same_quality = chord1.get('quality') == chord2.get('quality')
         same_inversion = chord1.get('inversion') == chord2.get('inversion')
         
-        logger.debug(f"same_root={same_root}, same_quality={same_quality}, same_inversion={same_inversion}")
+        logger.debug("same_root=%s, same_quality=%s, same_inversion=%s",
+                     same_root, same_quality, same_inversion)
         
         if not (same_root and same_quality and same_inversion):
             logger.debug("NO es mismo acorde básico → False")
@@ -113,21 +142,19 @@ class ContextAnalyzer:
             Esto permite comparar "C4" y "C5" como la misma nota (pitch class 0)
             """
             pitch_classes = set()
-            for voice in ['S', 'A', 'T', 'B']:
+            for voice in _SATB:
                 note_str = chord_dict.get(voice)
                 if note_str:
-                    try:
-                        p = pitch.Pitch(note_str)
-                        pitch_classes.add(p.pitchClass)  # 0-11
-                    except:
-                        # Si falla parseo, ignorar esta nota
-                        pass
+                    # pitch_class cacheada; None si falla el parseo (se ignora la nota)
+                    pc = VoiceLeadingUtils.pitch_class(note_str)
+                    if pc is not None:
+                        pitch_classes.add(pc)  # 0-11
             return pitch_classes
         
         pc1 = get_pitch_classes(chord1)
         pc2 = get_pitch_classes(chord2)
         
-        logger.debug(f"pitch_classes1={pc1}, pitch_classes2={pc2}")
+        logger.debug("pitch_classes1=%s, pitch_classes2=%s", pc1, pc2)
         
         # Si NO tienen los mismos pitch classes, no es el mismo acorde
         if pc1 != pc2:
@@ -143,12 +170,12 @@ class ContextAnalyzer:
         voices1.discard(None)
         voices2.discard(None)
         
-        logger.debug(f"voices1={voices1}, voices2={voices2}")
+        logger.debug("voices1=%s, voices2=%s", voices1, voices2)
         
         if voices1 != voices2:
             # Mismas pitch classes, pero diferentes strings de notas
             # → Es un cambio de disposición válido
-            logger.info(f"✅ VOICING CHANGE DETECTADO: {pc1}")
+            logger.info("✅ VOICING CHANGE DETECTADO: %s", pc1)
             return True
         
         # Exactamente el mismo voicing (mismas notas, mismas octavas)
@@ -160,6 +187,34 @@ class ContextAnalyzer:
         """
         Detecta si una progresión es V-VII o VII-V (ambas direcciones).
         
+        Memoizado por contenido (degree_num, function/funcion) y tonalidad.
+        Ver _compute_V_VII_pair.
+        """
+        try:
+            return _V_VII_pair_cached(
+                _context_key(chord1, _V_VII_FIELDS),
+                _context_key(chord2, _V_VII_FIELDS),
+                key
+            )
+        except TypeError:
+            return ContextAnalyzer._compute_V_VII_pair(chord1, chord2, key)
+    
+    @staticmethod
+    def clear_progression_cache() -> None:
+        """
+        Vacía las cachés de contexto al terminar una progresión (fin de pieza).
+        
+        Los resultados no caducan (dependen solo del contenido de los acordes),
+        pero así la memoria no crece entre análisis independientes.
+        """
+        _voicing_change_cached.cache_clear()
+        _V_VII_pair_cached.cache_clear()
+    
+    @staticmethod
+    def _compute_V_VII_pair(chord1: Dict, chord2: Dict, key: str) -> bool:
+        """
+        Detecta si una progresión es V-VII o VII-V (ambas direcciones).
+        
         Razón pedagógica:
             Tanto V como VII tienen función dominante y comparten el tritono.
             La progresión V→VII o VII→V es aceptable armónicamente por esta razón.
@@ -198,18 +253,19 @@ class ContextAnalyzer:
             
             # Si ambos tienen función dominante explícita, aceptar
             if func1 == 'D' and func2 == 'D':
-                logger.debug(f"Excepción V-VII aplicada: grados {degree1}→{degree2} (ambos con función D)")
+                logger.debug("Excepción V-VII aplicada: grados %s→%s (ambos con función D)", degree1, degree2)
                 return True
             
             # FALLBACK: Si no hay campo function disponible,
             # asumir que V y VII son dominantes (pedagógicamente correcto)
             if not func1 or not func2:
-                logger.debug(f"Excepción V-VII aplicada: grados {degree1}→{degree2} (sin campo function, asumiendo dominantes)")
+                logger.debug("Excepción V-VII aplicada: grados %s→%s (sin campo function, asumiendo dominantes)",
+                             degree1, degree2)
                 return True
             
             # Si solo uno tiene función D, también considerarlo (caso edge)
             if 'D' in (func1, func2):
-                logger.debug(f"Excepción V-VII aplicada: grados {degree1}→{degree2} (al menos uno con función D)")
+                logger.debug("Excepción V-VII aplicada: grados %s→%s (al menos uno con función D)", degree1, degree2)
                 return True
             
             # No se cumplen criterios
@@ -252,6 +308,66 @@ class ContextAnalyzer:
         return False
 
 
+# Campos de los que depende cada análisis de contexto (clave de caché)
+_VOICING_FIELDS = ('root', 'quality', 'inversion', 'S', 'A', 'T', 'B')
+_V_VII_FIELDS = ('degree_num', 'function', 'funcion')
+
+
+def _context_key(chord: Dict, fields: Tuple[str, ...]) -> Tuple:
+    """Clave hashable con los campos PRESENTES del acorde (respeta .get con default)."""
+    return tuple((f, chord[f]) for f in fields if f in chord)
+
+
+@lru_cache(maxsize=1024)
+def _voicing_change_cached(key1: Tuple, key2: Tuple) -> bool:
+    """Caché de ContextAnalyzer.is_voicing_change por contenido de los acordes."""
+    return ContextAnalyzer._compute_voicing_change(dict(key1), dict(key2))
+
+
+@lru_cache(maxsize=1024)
+def _V_VII_pair_cached(key1: Tuple, key2: Tuple, key: str) -> bool:
+    """Caché de ContextAnalyzer.is_V_VII_pair por contenido de los acordes y tonalidad."""
+    return ContextAnalyzer._compute_V_VII_pair(dict(key1), dict(key2), key)
+
+
+# =============================================================================
+# EXCEPCIONES COMPARTIDAS ENTRE REGLAS
+# =============================================================================
+# Funciones con nombre (no lambdas): se registran una vez a nivel de clase
+# (HarmonicRule.EXCEPTIONS) y aparecen identificadas en los perfiles.
+
+def _exc_V_VII_pair(chord1: Dict, chord2: Dict, context: Dict) -> bool:
+    """Par V-VII o VII-V (misma función dominante)."""
+    return ContextAnalyzer.is_V_VII_pair(chord1, chord2, context.get('key', 'C major'))
+
+
+def _exc_voicing_change(chord1: Dict, chord2: Dict, context: Dict) -> bool:
+    """Cambio de disposición del mismo acorde."""
+    return ContextAnalyzer.is_voicing_change(chord1, chord2)
+
+
+def _exc_second_fifth_diminished(chord1: Dict, chord2: Dict, context: Dict) -> bool:
+    """Segunda quinta disminuida (P5→d5)."""
+    return ParallelFifthsRule._second_fifth_is_diminished(chord1, chord2)
+
+
+_V_VII_PAIR_EXCEPTION = {
+    'name': 'V_VII_pair',
+    'check': _exc_V_VII_pair,
+    'description': 'Permitido entre V-VII o VII-V: ambos tienen función dominante'
+}
+_VOICING_CHANGE_EXCEPTION = {
+    'name': 'voicing_change',
+    'check': _exc_voicing_change,
+    'description': 'Permitido en cambio de disposición del mismo acorde'
+}
+_SECOND_DIMINISHED_EXCEPTION = {
+    'name': 'second_diminished',
+    'check': _exc_second_fifth_diminished,
+    'description': 'Permitido cuando la segunda quinta es disminuida (P5→d5)'
+}
+
+
 # =============================================================================
 # CLASE BASE: HARMONIC RULE
 # =============================================================================
@@ -265,8 +381,10 @@ class HarmonicRule:
         - _calculate_confidence(): Nivel de confianza del error
         
     Sistema de excepciones:
-        Las excepciones se añaden con add_exception() y se verifican
-        automáticamente antes de reportar un error.
+        Las excepciones fijas de cada regla se declaran en la tupla de clase
+        EXCEPTIONS (compartida por todas las instancias); add_exception()
+        añade excepciones adicionales a una instancia concreta. Todas se
+        verifican automáticamente antes de reportar un error.
     
     Ejemplo de uso:
         rule = ParallelFifthsRule()
@@ -275,6 +393,22 @@ class HarmonicRule:
             print(f"Error: {error['short_msg']} ({error['confidence']}%)")
     """
     
+    # Excepciones comunes a todas las instancias de la regla (ver validate)
+    EXCEPTIONS: ClassVar[Tuple[Dict, ...]] = ()
+    
+    # True en las reglas resueltas por ParallelMotionDetector: el motor puede
+    # omitirlas cuando la transición no tiene ninguna quinta/octava candidata
+    USES_MOTION_DETECTOR: ClassVar[bool] = False
+    
+    # Confianza fija de la regla (ver _calculate_confidence): las reglas con
+    # confianza constante solo redefinen este valor
+    CONFIDENCE: ClassVar[int] = ConfidenceLevel.CERTAIN.value
+    
+    # Atributos de instancia fijos: sin __dict__ por regla (las subclases
+    # declaran __slots__ = ())
+    __slots__ = ('name', 'tier', 'color', 'short_msg', 'short_msg_contrary', 'full_msg',
+                 'exceptions', 'enabled')
+    
     def __init__(
         self,
         name: str,
@@ -297,8 +431,11 @@ class HarmonicRule:
         self.tier = tier
         self.color = color
         self.short_msg = short_msg
+        # Variante para movimiento contrario ("consecutivas"), calculada una vez
+        self.short_msg_contrary = short_msg.replace('paralelas', 'consecutivas')
         self.full_msg = full_msg
-        self.exceptions: List[Dict] = []
+        # Referencia a la tupla de clase: add_exception crea una nueva tupla
+        self.exceptions: Tuple[Dict, ...] = self.EXCEPTIONS
         self.enabled = True
     
     def add_exception(
@@ -315,11 +452,11 @@ class HarmonicRule:
             check: Función que retorna True si la excepción aplica
             description: Explicación pedagógica de la excepción
         """
-        self.exceptions.append({
+        self.exceptions = self.exceptions + ({
             'name': exception_name,
             'check': check,
             'description': description
-        })
+        },)
     
     def validate(
         self,
@@ -360,6 +497,24 @@ class HarmonicRule:
         # Detección básica (implementada por cada regla)
         violation = self._detect_violation(chord1, chord2)
         
+        return self._confirm_violation(chord1, chord2, context, violation)
+    
+    def _confirm_violation(
+        self,
+        chord1: Dict,
+        chord2: Dict,
+        context: Dict,
+        violation: Optional[Dict]
+    ) -> Optional[Dict]:
+        """
+        Pasos 3-4 de validate sobre una violación ya detectada.
+        
+        Compartido con RulesEngine.validate_progression_batch, que detecta
+        las violaciones de toda la progresión con detect_batch.
+        
+        Returns:
+            None si no hay violación o aplica excepción, dict del error si no
+        """
         if not violation:
             return None
         
@@ -368,7 +523,7 @@ class HarmonicRule:
             try:
                 if exc['check'](chord1, chord2, context):
                     # Excepción aplicada, no es error
-                    logger.debug(f"Excepción '{exc['name']}' aplicada a {self.name}")
+                    logger.debug("Excepción '%s' aplicada a %s", exc['name'], self.name)
                     return None
             except Exception as e:
                 logger.error(f"Error en excepción '{exc['name']}': {e}")
@@ -376,7 +531,12 @@ class HarmonicRule:
                 continue
         
         # Ninguna excepción aplica, es un error
-        confidence = self._calculate_confidence(chord1, chord2, context)
+        # Confianza constante (CONFIDENCE) salvo que la regla redefina
+        # _calculate_confidence; se le pasa la violación ya detectada
+        if type(self)._calculate_confidence is HarmonicRule._calculate_confidence:
+            confidence = self.CONFIDENCE
+        else:
+            confidence = self._calculate_confidence(chord1, chord2, context, violation=violation)
         
         # Determinar mensaje según tipo de movimiento
         motion_type = violation.get('motion_type', 'parallel')
@@ -387,8 +547,8 @@ class HarmonicRule:
         if motion_type == 'parallel':
             short_msg = self.short_msg  # Use el mensaje base (ej: "Quintas paralelas")
         else:  # contrary
-            # Cambiar "paralelas" por "consecutivas" en el mensaje
-            short_msg = self.short_msg.replace('paralelas', 'consecutivas')
+            # "paralelas" → "consecutivas" (precalculado en __init__)
+            short_msg = self.short_msg_contrary
         
         return {
             'rule': self.name,
@@ -414,31 +574,182 @@ class HarmonicRule:
         """
         raise NotImplementedError(f"Regla {self.name} debe implementar _detect_violation()")
     
-    def _calculate_confidence(self, chord1: Dict, chord2: Dict, context: Dict) -> int:
+    def detect_batch(self, progression: 'ChordProgression') -> List[Optional[Dict]]:
+        """
+        Detecta violaciones en todas las transiciones de una progresión.
+        
+        Solo detección (sin excepciones ni confianza, igual que
+        _detect_violation). Por defecto recorre las transiciones con la API
+        de dicts; las reglas con núcleo numérico la sobrescriben para leer
+        las columnas de ChordProgression directamente.
+        
+        Returns:
+            Lista de len(progression) - 1 elementos: violación o None
+            por cada transición t → t+1
+        """
+        chords = progression.chords
+        return [
+            self._detect_violation(chords[t], chords[t + 1])
+            for t in range(len(chords) - 1)
+        ]
+    
+    def _calculate_confidence(self, chord1: Dict, chord2: Dict, context: Dict, violation: Optional[Dict] = None) -> int:
         """
         Calcula el nivel de confianza del error detectado.
         
-        Por defecto retorna CERTAIN. Cada regla puede sobrescribir
-        para ajustar basándose en el contexto.
+        Por defecto retorna CONFIDENCE (CERTAIN salvo que la regla lo
+        redefina). Cada regla puede sobrescribir para ajustar basándose en
+        el contexto.
+        
+        Args:
+            violation: Resultado de _detect_violation() ya calculado por validate()
+                       (None si se llama directamente)
         
         Returns:
             Nivel de confianza (0-100)
         """
-        return ConfidenceLevel.CERTAIN.value
+        return self.CONFIDENCE
 
 
 # =============================================================================
 # UTILIDADES PARA REGLAS
 # =============================================================================
 
+# Nombres simples de intervalo (music21 simpleName) agrupados por categoría
+_OCTAVE_NAMES = frozenset({'P8', 'P1'})
+# Clase de quinta de un intervalo (VoiceLeadingUtils.fifth_kind)
+_FIFTH_NONE = 0
+_FIFTH_PERFECT = 1
+_FIFTH_DIMINISHED = 2
+_FIFTH_AUGMENTED = 3
+_FIFTH_KIND_TABLE = {'P5': _FIFTH_PERFECT, 'd5': _FIFTH_DIMINISHED, 'A5': _FIFTH_AUGMENTED}
+# 10as (y sus equivalentes simples, 3as) para la excepción de 10as paralelas B-S
+_TENTH_NAMES = frozenset({'M10', 'm10', 'M3', 'm3', 'A10', 'd10', 'A3'})
+
+# Voces SATB y pares de voces (constantes: no se reconstruyen en cada llamada)
+_SATB = ('S', 'A', 'T', 'B')
+_VOICE_INDEX = {voice: i for i, voice in enumerate(_SATB)}
+_VOICE_PAIRS = (
+    ('S', 'A'), ('S', 'T'), ('S', 'B'),
+    ('A', 'T'), ('A', 'B'),
+    ('T', 'B')
+)
+_BASS_PAIRS = (('B', 'S'), ('B', 'A'), ('B', 'T'))
+
+
+# Extrae (S, A, T, B) de un dict de acorde en una llamada (ver VoicedChord.from_dict)
+_PACK_SATB = itemgetter(*_SATB)
+
+
+class VoicedChord(NamedTuple):
+    """
+    Notas SATB de un acorde como tupla de 4 posiciones (S=0, A=1, T=2, B=3).
+    
+    Las rutinas internas de intervalos indexan por posición en lugar de hacer
+    chord.get('S') en cada par. Es hashable (clave de las cachés por acorde) y
+    se construye desde el dict de la API pública con VoicedChord.from_dict().
+    """
+    S: Optional[str]
+    A: Optional[str]
+    T: Optional[str]
+    B: Optional[str]
+    
+    @classmethod
+    def from_dict(cls, chord: Dict) -> 'VoicedChord':
+        """Extrae las voces de un dict de acorde (None si falta la voz)."""
+        try:
+            # Caso habitual (las 4 voces presentes): una sola extracción en C
+            return tuple.__new__(cls, _PACK_SATB(chord))
+        except KeyError:
+            return cls(chord.get('S'), chord.get('A'), chord.get('T'), chord.get('B'))
+
+# Bit de cada par de voces (en ambos órdenes) en las máscaras de IntervalCache
+_PAIR_BITS = {pair: 1 << i for i, pair in enumerate(_VOICE_PAIRS)}
+_PAIR_BITS.update({(v2, v1): bit for (v1, v2), bit in list(_PAIR_BITS.items())})
+_BASS_PAIRS_MASK = 0
+for _pair in _BASS_PAIRS:
+    _BASS_PAIRS_MASK |= _PAIR_BITS[_pair]
+
+# Recorrido del detector fusionado: (v1, v2, índice v1, índice v2, bit) por par,
+# en el orden de _VOICE_PAIRS (índices de VoicedChord: S=0, A=1, T=2, B=3)
+_VOICE_PAIR_ENTRIES = tuple(
+    (v1, v2, _VOICE_INDEX[v1], _VOICE_INDEX[v2], _PAIR_BITS[(v1, v2)])
+    for v1, v2 in _VOICE_PAIRS
+)
+
+# (pasos diatónicos mod 7, semitonos reducidos a una octava) → simpleName de music21
+# Cubre las especies habituales (dd..AA); el resto se delega en music21.interval
+_PERFECT_SEMITONES = {0: 0, 3: 5, 4: 7}          # 1ª, 4ª, 5ª justas
+_MAJOR_SEMITONES = {1: 2, 2: 4, 5: 9, 6: 11}     # 2ª, 3ª, 6ª, 7ª mayores
+_INTERVAL_NAME_TABLE = {}
+for _steps, _base in _PERFECT_SEMITONES.items():
+    for _offset, _spec in ((-2, 'dd'), (-1, 'd'), (0, 'P'), (1, 'A'), (2, 'AA')):
+        _INTERVAL_NAME_TABLE[(_steps, _base + _offset)] = f"{_spec}{_steps + 1}"
+for _steps, _base in _MAJOR_SEMITONES.items():
+    for _offset, _spec in ((-3, 'dd'), (-2, 'd'), (-1, 'm'), (0, 'M'), (1, 'A'), (2, 'AA')):
+        _INTERVAL_NAME_TABLE[(_steps, _base + _offset)] = f"{_spec}{_steps + 1}"
+
+# Letra de la nota → índice diatónico dentro de la octava (C=0 ... B=6)
+_STEP_INDEX = {step: i for i, step in enumerate('CDEFGAB')}
+
+# Semitonos desde la tónica (0-11) → grado de la escala (1-7)
+_DEGREE_LUT = (1, 2, 2, 3, 3, 4, 4, 5, 6, 6, 7, 7)
+
+# Semitonos desde la fundamental (0-11) → factor del acorde
+# 0=1, 1-2=9 (m9/M9), 3-4=3 (m3/M3), 6-8=5 (d5/P5/A5), 10-11=7 (m7/M7)
+# 5 = 4ªJ, 9 = 6ªM (no son factores típicos de triadas/cuatriadas)
+_FACTOR_LUT = ('1', '9', '9', '3', '3', '?', '5', '5', '5', '?', '7', '7')
+
+
+# Códigos enteros de tipo de movimiento (uso interno: comparaciones baratas)
+# PARALLEL y CONTRARY son los dos primeros: "motion <= _MOTION_CONTRARY"
+# equivale a motion in ['parallel', 'contrary']
+_MOTION_PARALLEL = 0
+_MOTION_CONTRARY = 1
+_MOTION_OBLIQUE = 2
+_MOTION_STATIC = 3
+_MOTION_UNKNOWN = 4
+_MOTION_NAMES = ('parallel', 'contrary', 'oblique', 'static', 'unknown')
+
+# Tabla 3x3 indexada por (signo(dir1) + 1) * 3 + (signo(dir2) + 1)
+_MOTION_TABLE = (
+    _MOTION_PARALLEL, _MOTION_OBLIQUE, _MOTION_CONTRARY,   # dir1 < 0
+    _MOTION_OBLIQUE, _MOTION_STATIC, _MOTION_OBLIQUE,      # dir1 == 0
+    _MOTION_CONTRARY, _MOTION_OBLIQUE, _MOTION_PARALLEL,   # dir1 > 0
+)
+
+
+def _motion_code(dir1: float, dir2: float) -> int:
+    """
+    Código de movimiento (_MOTION_*) a partir de los desplazamientos
+    (en semitonos) de dos voces: solo signos y una consulta a _MOTION_TABLE.
+    """
+    return _MOTION_TABLE[((dir1 > 0) - (dir1 < 0) + 1) * 3 + (dir2 > 0) - (dir2 < 0) + 1]
+
+
+def _classify_motion(dir1: float, dir2: float) -> str:
+    """
+    Tipo de movimiento a partir de los desplazamientos (en semitonos) de dos voces.
+    
+    Núcleo aritmético compartido por VoiceLeadingUtils.get_motion_type e
+    IntervalCache.motion: solo compara signos, sin objetos music21.
+    """
+    return _MOTION_NAMES[_motion_code(dir1, dir2)]
+
+
 class VoiceLeadingUtils:
     """Utilidades estáticas para análisis de conducción de voces"""
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def get_interval_object(note1: str, note2: str) -> Optional[music21.interval.Interval]:
         """
         Obtiene el objeto Interval de music21 entre dos notas.
         
+        Cacheado por (note1, note2): el mismo par de notas se consulta desde
+        varias reglas en la misma transición. El objeto devuelto es compartido,
+        solo lectura (no modificar).
+        
         Args:
             note1, note2: Notas en formato music21 ('C4', 'E4', etc.)
             
@@ -467,6 +778,149 @@ class VoiceLeadingUtils:
         interval = VoiceLeadingUtils.get_interval_object(note1, note2)
         return interval.semitones if interval else 0
     
+    @staticmethod
+    def clear_progression_cache() -> None:
+        """
+        Vacía la caché de objetos Interval al terminar una progresión.
+        
+        Las claves son las notas (no caducan), pero así la memoria no crece
+        entre análisis independientes.
+        """
+        VoiceLeadingUtils.get_interval_object.cache_clear()
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def parse_note(note: str) -> Optional[Tuple[float, int]]:
+        """
+        Parsea una nota una sola vez y devuelve sus coordenadas numéricas.
+        
+        Args:
+            note: Nota en formato music21 ('C4', 'F#3', etc.)
+            
+        Returns:
+            (ps, diatonicNoteNum) - altura en semitonos y número de paso diatónico,
+            o None si la nota no se puede parsear
+        """
+        midi = NOTE_TO_MIDI.get(note)
+        if midi is not None:
+            # Nota tabulada ('F#3'): paso diatónico = 7 * octava + letra + 1
+            return float(midi), 7 * int(note[-1]) + _STEP_INDEX[note[0]] + 1
+        try:
+            p = music21.pitch.Pitch(note)
+            return p.ps, p.diatonicNoteNum
+        except Exception:
+            return None
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def pitch_class(note: str) -> Optional[int]:
+        """
+        Pitch class (0-11) de una nota, o None si no se puede parsear.
+        
+        El parseo (y su posible excepción) solo ocurre en el primer acceso
+        a cada nota; las reglas comprueban None en lugar de usar try/except.
+        """
+        midi = NOTE_TO_MIDI.get(note)
+        if midi is not None:
+            return midi % 12
+        try:
+            return music21.pitch.Pitch(note).pitchClass
+        except Exception:
+            return None
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def pitch_name(note: str) -> Optional[str]:
+        """
+        Nombre sin octava de una nota ('F#4' → 'F#'), o None si no se puede parsear.
+        """
+        if note in NOTE_TO_MIDI:
+            return note[:-1]
+        try:
+            return music21.pitch.Pitch(note).name
+        except Exception:
+            return None
+    
+    @staticmethod
+    def semitones_between(note1: str, note2: str) -> Optional[float]:
+        """
+        Semitonos de note1 a note2 (+ sube, - baja), como Interval.semitones.
+        
+        Resta de alturas cacheadas (parse_note): no construye objetos Interval.
+        
+        Returns:
+            Diferencia en semitonos o None si alguna nota no se puede parsear
+        """
+        ps1 = VoiceLeadingUtils.note_to_ps(note1)
+        ps2 = VoiceLeadingUtils.note_to_ps(note2)
+        if ps1 is None or ps2 is None:
+            return None
+        return ps2 - ps1
+    
+    @staticmethod
+    def note_to_ps(note: str) -> Optional[float]:
+        """
+        Altura en pitch space (ps) de una nota, o None si no se puede parsear.
+        
+        Comparte la caché de parse_note: cada nota se parsea una sola vez
+        aunque la consulten varias reglas.
+        """
+        parsed = VoiceLeadingUtils.parse_note(note)
+        return parsed[0] if parsed else None
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def classify_interval(note1: str, note2: str) -> Optional[str]:
+        """
+        Obtiene el nombre simple del intervalo entre dos notas (P5, M3, P1...).
+        
+        Se calcula a partir de (diferencia diatónica, diferencia en semitonos)
+        con _INTERVAL_NAME_TABLE, sin construir un music21.interval.Interval.
+        Las especies no tabuladas (AAA, ddd, microtonos) se delegan en music21.
+        
+        El resultado se cachea por par de notas: todos los predicados
+        (is_fifth, is_octave, etc.) comparten un único cálculo de simpleName.
+        
+        Args:
+            note1, note2: Notas en formato music21 ('C4', 'E4', etc.)
+            
+        Returns:
+            simpleName de music21 (reduce a una octava: P12 -> P5) o None si hay error
+        """
+        parsed1 = VoiceLeadingUtils.parse_note(note1)
+        parsed2 = VoiceLeadingUtils.parse_note(note2)
+        
+        if parsed1 and parsed2:
+            steps = parsed2[1] - parsed1[1]
+            semitones = parsed2[0] - parsed1[0]
+            # simpleName no depende de la dirección (salvo en el unísono)
+            if steps < 0:
+                steps, semitones = -steps, -semitones
+            semitones -= 12 * (steps // 7)
+            name = _INTERVAL_NAME_TABLE.get((steps % 7, semitones))
+            if name:
+                return name
+        
+        interval = VoiceLeadingUtils.get_interval_object(note1, note2)
+        return interval.simpleName if interval else None
+    
+    @staticmethod
+    def fifth_kind(note1: str, note2: str) -> int:
+        """
+        Clasifica un intervalo como quinta en una sola consulta.
+        
+        Sustituye a encadenar is_perfect_fifth / is_diminished_fifth /
+        is_fifth sobre el mismo par de notas.
+        
+        Args:
+            note1, note2: Notas a comparar
+            
+        Returns:
+            _FIFTH_PERFECT (P5), _FIFTH_DIMINISHED (d5), _FIFTH_AUGMENTED (A5)
+            o _FIFTH_NONE si no es quinta (o hay error)
+        """
+        return _FIFTH_KIND_TABLE.get(VoiceLeadingUtils.classify_interval(note1, note2), _FIFTH_NONE)
+    
     @staticmethod
     def is_perfect_fifth(note1: str, note2: str) -> bool:
         """
@@ -481,14 +935,7 @@ class VoiceLeadingUtils:
         Returns:
             True si el intervalo es quinta justa (P5)
         """
-        interval = VoiceLeadingUtils.get_interval_object(note1, note2)
-        if not interval:
-            return False
-        
-        # Verificar nombre del intervalo (P5, P12, P19, etc.)
-        # music21 usa 'P' para perfecto (Perfect)
-        simple_name = interval.simpleName  # Reduce a una octava (P12 -> P5)
-        return simple_name == 'P5'
+        return VoiceLeadingUtils.fifth_kind(note1, note2) == _FIFTH_PERFECT
     
     @staticmethod
     def is_augmented_fifth(note1: str, note2: str) -> bool:
@@ -501,12 +948,7 @@ class VoiceLeadingUtils:
         Returns:
             True si el intervalo es quinta aumentada (A5)
         """
-        interval = VoiceLeadingUtils.get_interval_object(note1, note2)
-        if not interval:
-            return False
-        
-        simple_name = interval.simpleName
-        return simple_name == 'A5'
+        return VoiceLeadingUtils.fifth_kind(note1, note2) == _FIFTH_AUGMENTED
     
     @staticmethod
     def is_diminished_fifth(note1: str, note2: str) -> bool:
@@ -519,12 +961,7 @@ class VoiceLeadingUtils:
         Returns:
             True si el intervalo es quinta disminuida (d5)
         """
-        interval = VoiceLeadingUtils.get_interval_object(note1, note2)
-        if not interval:
-            return False
-        
-        simple_name = interval.simpleName
-        return simple_name == 'd5'
+        return VoiceLeadingUtils.fifth_kind(note1, note2) == _FIFTH_DIMINISHED
     
     @staticmethod
     def is_fifth(note1: str, note2: str) -> bool:
@@ -540,8 +977,7 @@ class VoiceLeadingUtils:
         Returns:
             True si es quinta justa (P5) o aumentada (A5)
         """
-        return (VoiceLeadingUtils.is_perfect_fifth(note1, note2) or
-                VoiceLeadingUtils.is_augmented_fifth(note1, note2))
+        return VoiceLeadingUtils.fifth_kind(note1, note2) in (_FIFTH_PERFECT, _FIFTH_AUGMENTED)
     
     @staticmethod
     def is_octave(note1: str, note2: str) -> bool:
@@ -554,12 +990,7 @@ class VoiceLeadingUtils:
         Returns:
             True si es octava justa (P8, P15, etc.)
         """
-        interval = VoiceLeadingUtils.get_interval_object(note1, note2)
-        if not interval:
-            return False
-        
-        simple_name = interval.simpleName
-        return simple_name == 'P8' or simple_name == 'P1'
+        return VoiceLeadingUtils.classify_interval(note1, note2) in _OCTAVE_NAMES
     
     @staticmethod
     def is_leap(note1: str, note2: str, threshold: int = 2) -> bool:
@@ -605,53 +1036,85 @@ class VoiceLeadingUtils:
         Returns:
             Tipo de movimiento como string
         """
-        try:
-            p1_1 = music21.pitch.Pitch(voice1_note1)
-            p1_2 = music21.pitch.Pitch(voice1_note2)
-            p2_1 = music21.pitch.Pitch(voice2_note1)
-            p2_2 = music21.pitch.Pitch(voice2_note2)
-            
-            # Calcular direcciones
-            dir1 = p1_2.ps - p1_1.ps  # pitch space (incluye octava)
-            dir2 = p2_2.ps - p2_1.ps
-            
-            if dir1 == 0 and dir2 == 0:
-                return 'static'
-            elif dir1 == 0 or dir2 == 0:
-                return 'oblique'
-            elif (dir1 > 0 and dir2 > 0) or (dir1 < 0 and dir2 < 0):
-                return 'parallel'
-            else:
-                return 'contrary'
-                
-        except Exception as e:
-            logger.warning(f"Error determinando tipo de movimiento: {e}")
+        parsed = [
+            VoiceLeadingUtils.parse_note(n)
+            for n in (voice1_note1, voice1_note2, voice2_note1, voice2_note2)
+        ]
+        if not all(parsed):
+            logger.warning(
+                f"Error determinando tipo de movimiento: "
+                f"{voice1_note1}, {voice1_note2}, {voice2_note1}, {voice2_note2}"
+            )
             return 'unknown'
+        
+        # Calcular direcciones en pitch space (incluye octava)
+        dir1 = parsed[1][0] - parsed[0][0]
+        dir2 = parsed[3][0] - parsed[2][0]
+        return _classify_motion(dir1, dir2)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def get_key_tonic_pc(key_str: str) -> int:
+        """Pitch class (0-11) de la tónica de una tonalidad (cacheado por key_str)"""
+        if 'major' not in key_str and 'minor' not in key_str:
+            k = music21.key.Key('C', 'major')
+        else:
+            try:
+                k = music21.key.Key(key_str)
+            except:
+                k = music21.key.Key('C', 'major')
+        return k.tonic.pitchClass
 
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def get_key_pcs(key_str: str) -> Optional[Tuple[int, int]]:
+        """
+        Pitch classes (tónica, sensible) de una tonalidad, cacheadas por key_str.
+        
+        La sensible está siempre un semitono bajo la tónica (grado 7 de la
+        escala mayor y de la menor armónica).
+        
+        Returns:
+            (tonic_pc, leading_tone_pc) o None si la tonalidad no es válida
+        """
+        try:
+            tonic_pc = VoiceLeadingUtils.get_key_tonic_pc(key_str)
+        except Exception:
+            return None
+        return tonic_pc, (tonic_pc + 11) % 12
+    
     @staticmethod
     def get_scale_degree_info(note_name: str, key_str: str) -> Dict:
         """Helper para obtener info de grado de escala"""
-        try:
-            if 'major' not in key_str and 'minor' not in key_str:
-                k = music21.key.Key('C', 'major')
-            else:
-                try:
-                    k = music21.key.Key(key_str)
-                except:
-                    k = music21.key.Key('C', 'major')
-
-            p = music21.pitch.Pitch(note_name)
-            tonic = k.tonic
-            interval = music21.interval.Interval(tonic, p)
-            semitones = interval.semitones % 12
-            
-            degree_map = {0:1, 1:2, 2:2, 3:3, 4:3, 5:4, 6:4, 7:5, 8:6, 9:6, 10:7, 11:7}
-            degree = degree_map.get(semitones, 0)
-            is_leading = (semitones == 11)
-            
-            return {'degree': degree, 'semitones_from_tonic': semitones, 'is_leading_tone': is_leading}
-        except:
+        key_pcs = VoiceLeadingUtils.get_key_pcs(key_str)
+        note_pc = VoiceLeadingUtils.pitch_class(note_name)
+        if key_pcs is None or note_pc is None:
             return {'degree': 0, 'semitones_from_tonic': 0, 'is_leading_tone': False}
+        
+        semitones = (note_pc - key_pcs[0]) % 12
+        
+        degree = _DEGREE_LUT[semitones]
+        is_leading = (semitones == 11)
+        
+        return {'degree': degree, 'semitones_from_tonic': semitones, 'is_leading_tone': is_leading}
+
+    @staticmethod
+    def get_leading_tone_voices(chord: Dict, key_str: str) -> List[str]:
+        """
+        Voces SATB del acorde que contienen la sensible (grado 7) de la tonalidad.
+        
+        Compara la pitch class de cada voz con la sensible precalculada de la
+        tonalidad (get_key_pcs), sin calcular el grado de cada nota.
+        """
+        key_pcs = VoiceLeadingUtils.get_key_pcs(key_str)
+        if key_pcs is None:
+            return []
+        
+        leading_pc = key_pcs[1]
+        return [
+            voice for voice in _SATB
+            if chord.get(voice) and VoiceLeadingUtils.pitch_class(chord[voice]) == leading_pc
+        ]
 
     @staticmethod
     def get_degree_from_chord(chord: Dict, key_str: str) -> str:
@@ -667,12 +1130,15 @@ class VoiceLeadingUtils:
             return '?'
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def get_chord_factor(note_name: str, root_name: str) -> str:
         """
         Determina qué factor es una nota respecto a la fundamental.
         
         Usa pitch classes (mod 12) para calcular el intervalo sin importar
-        la octava o dirección.
+        la octava o dirección. Cacheado por (nota, fundamental); cada nota
+        se parsea una sola vez (pitch_class) aunque aparezca con varias
+        fundamentales.
         
         Args:
             note_name: Nota a analizar (ej: 'E3', 'G4', 'B5')
@@ -686,104 +1152,636 @@ class VoiceLeadingUtils:
             if not note_name[-1].isdigit(): note_name += '4'
             if not root_name[-1].isdigit(): root_name += '4'
             
-            # Crear pitches y calcular diferencia en semitonos (mod 12)
-            p_root = music21.pitch.Pitch(root_name)
-            p_note = music21.pitch.Pitch(note_name)
+            # Pitch classes cacheadas y diferencia en semitonos (mod 12)
+            root_pc = VoiceLeadingUtils.pitch_class(root_name)
+            note_pc = VoiceLeadingUtils.pitch_class(note_name)
+            if root_pc is None or note_pc is None:
+                raise ValueError("nota no válida")
             
             # Diferencia en pitch class (0-11)
-            semitones = (p_note.pitchClass - p_root.pitchClass) % 12
+            semitones = (note_pc - root_pc) % 12
             
-            # Mapear semitonos a factores del acorde
-            # 0 = fundamental (P1)
-            # 3-4 = tercera (m3, M3)
-            # 7 = quinta (P5)
-            # 6 = quinta disminuida (d5) o aumentada dependiendo contexto
-            # 8 = quinta aumentada (A5)
-            # 10-11 = séptima (m7, M7)
-            # 2 = novena (M2, m2)
-            
-            if semitones == 0:
-                return '1'
-            elif semitones in [3, 4]:  # m3, M3
-                return '3'
-            elif semitones in [6, 7, 8]:  # d5, P5, A5
-                return '5'
-            elif semitones in [10, 11]:  # m7, M7
-                return '7'
-            elif semitones in [1, 2]:  # m9, M9
-                return '9'
-            else:
-                # 5 = 4ªJ, 9 = 6ªM (no son factores típicos de triadas/cuatriadas)
-                return '?'
+            # Mapear semitonos a factores del acorde (ver _FACTOR_LUT)
+            return _FACTOR_LUT[semitones]
                 
         except Exception as e:
             logger.warning(f"Error calculating chord factor for {note_name} from {root_name}: {e}")
             return '?'
-
-
-# =============================================================================
-# CHORD INTEGRATION HELPERS
-# =============================================================================
-
-def _dict_to_chord_safe(chord_dict: Dict) -> Optional['Chord']:
-    """
-    Convierte dict de acorde a Chord class de forma segura.
-    
-    Usado por reglas para integrar con chord_knowledge.Chord sin romper
-    backward compatibility. Si la conversión falla,retorna None y la
-    regla puede usar su método legacy.
     
-    Args:
-        chord_dict: Dict con formato {'S': 'G4', 'A': 'E4', ..., 'root': 'C', ...}
-        
-    Returns:
-        Chord object o None si faltan campos críticos
-        
-    Example:
-        chord_obj = _dict_to_chord_safe(chord1)
-        if chord_obj:
-            voices_with_7th = chord_obj.get_voices_with_factor('7')
-        else:
-            # Fallback a método antiguo
-            ...
-    """
-    try:
-        from chord_knowledge import Chord
-        
-        # Campos requeridos: root es crítico
-        if 'root' not in chord_dict or not chord_dict['root']:
-            return None  # No podemos analizar sin root
-        
-        # Extraer voces SATB
-        voices = {}
-        for voice in ['S', 'A', 'T', 'B']:
-            note = chord_dict.get(voice)
-            if note is not None:
-                voices[voice] = note
+    @staticmethod
+    def voices_by_factor(chord: Dict, root: str) -> Dict[str, Tuple[str, ...]]:
+        """
+        Voces del acorde agrupadas por factor respecto a root, en orden SATB.
         
-        if len(voices) == 0:
-            return None  # No hay voces
+        Calculado una sola vez por (voces, fundamental) y compartido por las
+        reglas de duplicación y omisión. El dict es compartido: no modificar.
         
-        # Crear Chord con campos disponibles
-        chord = Chord(
-            voices=voices,
-            root=chord_dict.get('root'),
-            quality=chord_dict.get('quality'),
-            key=chord_dict.get('key'),
-            inversion=chord_dict.get('inversion', 0)
-        )
+        Returns:
+            {factor: (voz, ...)}, p. ej. {'1': ('B', 'S'), '3': ('A',), '5': ('T',)}
+        """
+        notes = VoicedChord.from_dict(chord)
+        try:
+            return _voices_by_factor_cached(notes, root)
+        except TypeError:
+            # Notas o fundamental no hashables: calcular sin caché
+            return _voices_by_factor(notes, root)
+    
+    @staticmethod
+    def voice_factors(chord: Dict, root: str) -> Dict[str, str]:
+        """
+        Factor de cada voz presente respecto a root, en orden SATB.
         
-        return chord
+        Resuelve las cuatro voces en una sola consulta cacheada por
+        (voces, fundamental) en lugar de una llamada a get_chord_factor por
+        voz. El dict es compartido: no modificar.
         
-    except Exception as e:
-        logger.warning(f"Error converting dict to Chord: {e}")
-        return None  # Fallback seguro
+        Returns:
+            {voz: factor}, p. ej. {'S': '1', 'A': '5', 'T': '3', 'B': '1'}
+        """
+        notes = VoicedChord.from_dict(chord)
+        try:
+            return _voice_factors_cached(notes, root)
+        except TypeError:
+            return _voice_factors(notes, root)
 
 
+def _voices_by_factor(notes: VoicedChord, root: str) -> Dict[str, Tuple[str, ...]]:
+    """Agrupa las voces presentes por su factor (get_chord_factor)."""
+    by_factor: Dict[str, List[str]] = {}
+    for voice, note in zip(_SATB, notes):
+        if not note:
+            continue
+        factor = VoiceLeadingUtils.get_chord_factor(note, root)
+        by_factor.setdefault(factor, []).append(voice)
+    return {factor: tuple(voices) for factor, voices in by_factor.items()}
+
+
+# Versión cacheada por (voces, fundamental); ver VoiceLeadingUtils.voices_by_factor
+_voices_by_factor_cached = lru_cache(maxsize=512)(_voices_by_factor)
+
+
+def _voice_factors(notes: VoicedChord, root: str) -> Dict[str, str]:
+    """Factor (get_chord_factor) de cada voz presente, en orden SATB."""
+    return {
+        voice: VoiceLeadingUtils.get_chord_factor(note, root)
+        for voice, note in zip(_SATB, notes) if note
+    }
+
+
+# Versión cacheada por (voces, fundamental); ver VoiceLeadingUtils.voice_factors
+_voice_factors_cached = lru_cache(maxsize=512)(_voice_factors)
 
 
 # =============================================================================
-# REGLA #1: QUINTAS PARALELAS
+# TABLA DE INTERVALOS POR TRANSICIÓN
+# =============================================================================
+
+@dataclass
+class IntervalCache:
+    """
+    Intervalos de una transición chord1 → chord2, calculados una sola vez.
+    
+    Las reglas de quintas y octavas (paralelas, directas, desiguales) recorren
+    los mismos 6 pares de voces sobre las mismas notas. En lugar de que cada
+    regla reconstruya los intervalos con music21, la tabla guarda:
+        - pair_names1 / pair_names2: simpleName de cada par de voces en cada acorde
+        - voice_deltas: movimiento en semitonos de cada voz (chord2 - chord1)
+    
+        - masks1 / masks2: máscaras de bits por tipo de intervalo ('fifth',
+          'octave', 'p5', 'd5'), un bit por par de voces (ver _PAIR_BITS).
+          Ej: masks1['fifth'] & masks2['fifth'] → pares con quintas consecutivas
+        - abs_deltas / stepwise: tamaño del movimiento de cada voz y si es
+          grado conjunto (≤ 2 semitonos), para las excepciones de las directas
+        - parallel_pairs / contrary_pairs: máscaras (un bit por par, como
+          masks1/masks2) de los pares con movimiento directo o contrario
+    
+    Se obtiene con IntervalCache.for_transition(), cacheada por las notas SATB
+    de ambos acordes: todas las reglas de la misma transición comparten la tabla.
+    
+    Ejemplo:
+        intervals = IntervalCache.for_transition(chord1, chord2)
+        if intervals.name1('S', 'B') == 'P5' and intervals.motion('S', 'B') == 'parallel':
+            ...
+    """
+    pair_names1: Dict[Tuple[str, str], Optional[str]]
+    pair_names2: Dict[Tuple[str, str], Optional[str]]
+    voice_deltas: Dict[str, Optional[float]]
+    masks1: Dict[str, int]
+    masks2: Dict[str, int]
+    abs_deltas: Dict[str, Optional[float]]
+    stepwise: Dict[str, bool]
+    parallel_pairs: int
+    contrary_pairs: int
+    
+    @staticmethod
+    def for_transition(chord1: Dict, chord2: Dict) -> 'IntervalCache':
+        """Obtiene (o calcula) la tabla de intervalos de chord1 → chord2."""
+        return _build_interval_cache(
+            VoicedChord.from_dict(chord1),
+            VoicedChord.from_dict(chord2)
+        )
+    
+    def name1(self, v1: str, v2: str) -> Optional[str]:
+        """simpleName del intervalo v1-v2 en chord1 (None si falta alguna nota)"""
+        return self.pair_names1.get((v1, v2))
+    
+    def name2(self, v1: str, v2: str) -> Optional[str]:
+        """simpleName del intervalo v1-v2 en chord2 (None si falta alguna nota)"""
+        return self.pair_names2.get((v1, v2))
+    
+    def delta(self, voice: str) -> Optional[float]:
+        """Movimiento de una voz en semitonos (+ sube, - baja)"""
+        return self.voice_deltas.get(voice)
+    
+    def is_stepwise(self, voice: str) -> bool:
+        """True si la voz se mueve por grado conjunto (≤ 2 semitonos)"""
+        return self.stepwise.get(voice, False)
+    
+    def motion(self, v1: str, v2: str) -> str:
+        """
+        Tipo de movimiento entre dos voces (misma semántica que
+        VoiceLeadingUtils.get_motion_type).
+        """
+        return _MOTION_NAMES[self.motion_code(v1, v2)]
+    
+    def motion_code(self, v1: str, v2: str) -> int:
+        """Tipo de movimiento entre dos voces como código _MOTION_*"""
+        dir1 = self.voice_deltas.get(v1)
+        dir2 = self.voice_deltas.get(v2)
+        
+        if dir1 is None or dir2 is None:
+            return _MOTION_UNKNOWN
+        return _motion_code(dir1, dir2)
+
+
+@lru_cache(maxsize=512)
+def _chord_pair_names(notes: VoicedChord) -> Dict[Tuple[str, str], Optional[str]]:
+    """
+    Fila de intervalos verticales de UN acorde: simpleName de sus 6 pares de voces.
+    
+    Se cachea por acorde (no por transición): en una progresión cada acorde
+    aparece en dos transiciones (como destino y como origen) y su fila se
+    calcula una sola vez. El dict devuelto es compartido, solo lectura.
+    
+    Args:
+        notes: VoicedChord del acorde (None si falta la voz)
+    """
+    voices = _SATB
+    names = {}
+    
+    for i in range(4):
+        for j in range(i + 1, 4):
+            name = None
+            if notes[i] and notes[j]:
+                name = VoiceLeadingUtils.classify_interval(notes[i], notes[j])
+            # simpleName no depende de la dirección: registrar ambos órdenes
+            names[(voices[i], voices[j])] = name
+            names[(voices[j], voices[i])] = name
+    
+    return names
+
+
+@lru_cache(maxsize=512)
+def _chord_interval_masks(notes: VoicedChord) -> Dict[str, int]:
+    """
+    Empaqueta la fila de intervalos de un acorde en máscaras de bits.
+    
+    Returns:
+        {'fifth': bits, 'octave': bits, 'p5': bits, 'd5': bits} con un bit
+        por par de voces (_PAIR_BITS) que forma ese tipo de intervalo, y
+        'present': pares con ambas voces presentes (p. ej. sin T en SAB solo
+        quedan S-A, S-B y A-B)
+    """
+    names = _chord_pair_names(notes)
+    masks = {'fifth': 0, 'octave': 0, 'p5': 0, 'd5': 0, 'present': 0}
+    
+    for v1, v2, i, j, bit in _VOICE_PAIR_ENTRIES:
+        if notes[i] and notes[j]:
+            masks['present'] |= bit
+    
+    for pair, bit in _PAIR_BITS.items():
+        name = names[pair]
+        kind = _FIFTH_KIND_TABLE.get(name, _FIFTH_NONE)
+        if kind == _FIFTH_PERFECT:
+            masks['fifth'] |= bit
+            masks['p5'] |= bit
+        elif kind == _FIFTH_AUGMENTED:
+            masks['fifth'] |= bit
+        elif kind == _FIFTH_DIMINISHED:
+            masks['d5'] |= bit
+        elif name in _OCTAVE_NAMES:
+            masks['octave'] |= bit
+    
+    return masks
+
+
+@lru_cache(maxsize=512)
+def _chord_ps_row(notes: VoicedChord) -> Tuple[Optional[float], ...]:
+    """
+    Alturas (ps) de las 4 voces de un acorde, en el orden de VoicedChord.
+    
+    Fila numérica compartida por las reglas geométricas (cruzamiento,
+    distancia, invasión). Se cachea por acorde: en una progresión cada acorde
+    se convierte una sola vez aunque aparezca en dos transiciones.
+    None si falta la voz o la nota no se puede parsear.
+    """
+    return tuple(VoiceLeadingUtils.note_to_ps(note) if note else None for note in notes)
+
+
+@lru_cache(maxsize=1024)
+def _build_interval_cache(notes1: VoicedChord, notes2: VoicedChord) -> IntervalCache:
+    """
+    Construye la IntervalCache de una transición a partir de las notas SATB.
+    
+    Combina las filas verticales de ambos acordes (_chord_pair_names) con
+    el movimiento de cada voz.
+    
+    Args:
+        notes1, notes2: VoicedChord de cada acorde (None si falta la voz)
+    """
+    voices = _SATB
+    pair_names1 = _chord_pair_names(notes1)
+    pair_names2 = _chord_pair_names(notes2)
+    
+    voice_deltas = {}
+    abs_deltas = {}
+    stepwise = {}
+    # Un bit por voz (índice SATB) según el sentido de su movimiento
+    up = down = 0
+    for i, voice in enumerate(voices):
+        delta = None
+        if notes1[i] and notes2[i]:
+            parsed1 = VoiceLeadingUtils.parse_note(notes1[i])
+            parsed2 = VoiceLeadingUtils.parse_note(notes2[i])
+            if parsed1 and parsed2:
+                delta = parsed2[0] - parsed1[0]
+            else:
+                logger.warning(f"Error determinando tipo de movimiento: {notes1[i]} → {notes2[i]}")
+        voice_deltas[voice] = delta
+        abs_deltas[voice] = abs(delta) if delta is not None else None
+        stepwise[voice] = delta is not None and abs(delta) <= 2  # Grado conjunto
+        if delta:
+            up |= (delta > 0) << i
+            down |= (delta < 0) << i
+    
+    # Movimiento de cada par a partir de los bits de sus dos voces:
+    # directo = ambas suben o ambas bajan; contrario = una sube y la otra baja
+    parallel_pairs = contrary_pairs = 0
+    for _, _, i, j, bit in _VOICE_PAIR_ENTRIES:
+        up_i, up_j = (up >> i) & 1, (up >> j) & 1
+        down_i, down_j = (down >> i) & 1, (down >> j) & 1
+        parallel_pairs |= bit * ((up_i & up_j) | (down_i & down_j))
+        contrary_pairs |= bit * ((up_i & down_j) | (down_i & up_j))
+    
+    return IntervalCache(
+        pair_names1, pair_names2, voice_deltas,
+        _chord_interval_masks(notes1), _chord_interval_masks(notes2),
+        abs_deltas, stepwise, parallel_pairs, contrary_pairs
+    )
+
+
+# =============================================================================
+# PROGRESIÓN EN COLUMNAS (SoA)
+# =============================================================================
+
+@dataclass
+class ChordProgression:
+    """
+    Progresión completa con los campos de sus acordes en columnas paralelas.
+    
+    Los dicts de acorde (API pública) se leen UNA vez al construirla; las
+    reglas que trabajan por lotes (HarmonicRule.detect_batch) leen
+    directamente las columnas en lugar de hacer chord.get() por transición.
+    RulesEngine.validate_progression_batch la construye una vez por pieza.
+    
+    Columnas (una entrada por acorde, en orden):
+        - voices: VoicedChord (notas SATB)
+        - voices_ps: alturas ps de S/A/T/B (_chord_ps_row, None si falta)
+        - roots, qualities, degrees, keys: metadatos del análisis
+    
+    Ejemplo:
+        progression = ChordProgression.from_dicts([chord1, chord2, chord3])
+        crossings = VoiceCrossingRule().detect_batch(progression)
+    """
+    chords: List[Dict]
+    voices: Tuple[VoicedChord, ...]
+    voices_ps: Tuple[Tuple[Optional[float], ...], ...]
+    roots: Tuple[Optional[str], ...]
+    qualities: Tuple[Optional[str], ...]
+    degrees: Tuple[Optional[str], ...]
+    keys: Tuple[Optional[str], ...]
+    
+    @classmethod
+    def from_dicts(cls, chords: List[Dict]) -> 'ChordProgression':
+        """Construye las columnas a partir de la lista de dicts de acorde."""
+        voices = tuple(VoicedChord.from_dict(chord) for chord in chords)
+        return cls(
+            chords=list(chords),
+            voices=voices,
+            voices_ps=tuple(_chord_ps_row(notes) for notes in voices),
+            roots=tuple(chord.get('root') for chord in chords),
+            qualities=tuple(chord.get('quality') for chord in chords),
+            degrees=tuple(chord.get('degree') for chord in chords),
+            keys=tuple(chord.get('key') for chord in chords)
+        )
+    
+    def __len__(self) -> int:
+        return len(self.chords)
+
+
+# =============================================================================
+# DETECTOR FUSIONADO: QUINTAS Y OCTAVAS (paralelas, directas, desiguales)
+# =============================================================================
+
+class ParallelMotionDetector:
+    """
+    Detector de una sola pasada para las 5 reglas de consonancias perfectas.
+    
+    ParallelFifthsRule, ParallelOctavesRule, DirectFifthsRule, DirectOctavesRule
+    y UnequalFifthsRule recorren los mismos 6 pares de voces sobre la misma
+    IntervalCache. El detector clasifica cada par UNA vez y registra la primera
+    violación de cada regla; las reglas solo leen su entrada.
+    
+    El resultado depende únicamente de las notas SATB, así que se cachea por
+    transición (_detect_parallel_motion).
+    
+    Ejemplo:
+        violation = ParallelMotionDetector.detect('parallel_fifths', chord1, chord2)
+    """
+    
+    @staticmethod
+    def detect_all(chord1: Dict, chord2: Dict) -> Dict[str, Dict]:
+        """
+        Violaciones de las 5 reglas en la transición chord1 → chord2.
+        
+        Returns:
+            {rule_name: violación} solo para las reglas violadas.
+            El dict es compartido (cacheado): no modificar.
+        """
+        return _detect_parallel_motion(
+            VoicedChord.from_dict(chord1),
+            VoicedChord.from_dict(chord2)
+        )
+    
+    @staticmethod
+    def detect(rule_name: str, chord1: Dict, chord2: Dict) -> Optional[Dict]:
+        """Violación de una regla concreta (copia independiente) o None."""
+        violation = ParallelMotionDetector.detect_all(chord1, chord2).get(rule_name)
+        if not violation:
+            return None
+        return {**violation, 'voices': list(violation['voices'])}
+    
+    @staticmethod
+    def has_parallel_tenths_BS(intervals: IntervalCache) -> bool:
+        """
+        Verifica si Bajo-Soprano forman 10as paralelas.
+        
+        Una 10ª puede ser M10, m10, o sus equivalentes simples M3, m3.
+        Deben moverse en movimiento paralelo.
+        
+        Returns:
+            True si hay 10as paralelas en B-S
+        """
+        name1 = intervals.name1('B', 'S')
+        name2 = intervals.name2('B', 'S')
+        
+        if not name1 or not name2:
+            return False
+        
+        # Verificar si son 10as (o 3as, que son 10as simples)
+        is_tenth_1 = name1 in _TENTH_NAMES
+        is_tenth_2 = name2 in _TENTH_NAMES
+        
+        if not (is_tenth_1 and is_tenth_2):
+            return False
+        
+        # Verificar movimiento paralelo
+        return intervals.motion_code('B', 'S') == _MOTION_PARALLEL
+    
+    @staticmethod
+    def direct_fifth_allowed(v1: str, v2: str, intervals: IntervalCache) -> bool:
+        """
+        Excepciones de la quinta directa (movimientos de cada voz).
+        
+        - Partes extremas (B-S): S hace 2ª Y B hace 3ª, 4ª o 5ª (3-7 semitonos)
+        - Resto de pares: UNA voz hace grado conjunto (pero NO ambas)
+        """
+        # Excepción 1: Partes extremas (B-S)
+        if 'B' in [v1, v2] and 'S' in [v1, v2]:
+            return intervals.is_stepwise('S') and 3 <= intervals.abs_deltas['B'] <= 7
+        
+        # Excepción 2: Partes intermedias (resto de pares)
+        return intervals.is_stepwise(v1) != intervals.is_stepwise(v2)
+    
+    @staticmethod
+    def direct_octave_allowed(v1: str, v2: str, intervals: IntervalCache) -> bool:
+        """
+        Excepciones de la octava directa (movimientos con signo de cada voz).
+        
+        - B-S (MÁS ESTRICTA): soprano sube 1 semitono (sensible→tónica)
+          Y bajo sube 5 semitonos (4ª justa ascendente)
+        - Resto de pares: UNA voz hace grado conjunto (pero NO ambas)
+        """
+        # Excepción 1: Partes extremas (B-S) - MÁS ESTRICTA
+        # Movimientos con signo (+ sube, - baja)
+        if 'B' in [v1, v2] and 'S' in [v1, v2]:
+            return intervals.delta('S') == 1 and intervals.delta('B') == 5
+        
+        # Excepción 2: Partes intermedias (igual que quintas)
+        return intervals.is_stepwise(v1) != intervals.is_stepwise(v2)
+
+
+@lru_cache(maxsize=1024)
+def _detect_parallel_motion(notes1: VoicedChord, notes2: VoicedChord) -> Dict[str, Dict]:
+    """
+    Pasada única sobre los 6 pares de voces para las 5 reglas de quintas/octavas.
+    
+    Cada par se clasifica una vez (máscaras + tipo de movimiento) y se despacha
+    a las reglas que le afectan. Se conserva la PRIMERA violación de cada regla
+    en el orden S-A, S-T, S-B, A-T, A-B, T-B (el mismo que usaban las reglas).
+    
+    Args:
+        notes1, notes2: VoicedChord de cada acorde (None si falta la voz)
+    """
+    intervals = _build_interval_cache(notes1, notes2)
+    m1, m2 = intervals.masks1, intervals.masks2
+    
+    # Todas las reglas exigen quinta u octava en el acorde destino
+    if not (m2['fifth'] | m2['octave']):
+        return {}
+    
+    # Candidatos por regla (condiciones interválicas, un bit por par)
+    parallel_fifths = m1['fifth'] & m2['fifth']
+    parallel_octaves = m1['octave'] & m2['octave']
+    # Directas: llegan a P5 sin partir de P5 (paralelas) ni de d5 (desiguales)
+    direct_fifths = m2['p5'] & ~m1['p5'] & ~m1['d5']
+    direct_octaves = m2['octave'] & ~m1['octave']
+    # Desiguales: d5 → P5, solo en pares con el bajo
+    unequal_fifths = m1['d5'] & m2['p5'] & _BASS_PAIRS_MASK
+    
+    # Movimiento de cada par (máscaras de la transición): las paralelas y
+    # consecutivas exigen movimiento directo o contrario; las directas, directo
+    parallel_motion = intervals.parallel_pairs
+    contrary_motion = intervals.contrary_pairs
+    
+    # Solo pares con las 4 notas presentes (conjunto de voces real del ejercicio)
+    candidates = (((parallel_fifths | parallel_octaves) & (parallel_motion | contrary_motion))
+                  | ((direct_fifths | direct_octaves) & parallel_motion)
+                  | unequal_fifths) \
+        & m1['present'] & m2['present']
+    if not candidates:
+        return {}
+    
+    violations = {}
+    
+    for v1, v2, _, _, bit in _VOICE_PAIR_ENTRIES:
+        if not candidates & bit:
+            if not candidates:
+                break  # No quedan pares candidatos
+            continue
+        candidates &= ~bit
+        
+        if parallel_motion & bit:
+            motion = _MOTION_PARALLEL
+        elif contrary_motion & bit:
+            motion = _MOTION_CONTRARY
+        else:
+            motion = _MOTION_OBLIQUE  # Oblicuo, estático o desconocido: sin paralelas
+        
+        # Quintas/octavas paralelas (movimiento directo) o consecutivas (contrario)
+        if motion <= _MOTION_CONTRARY:
+            if parallel_fifths & bit and 'parallel_fifths' not in violations:
+                violations['parallel_fifths'] = {
+                    'chord_index': 0,
+                    'voices': [v1, v2],
+                    'motion_type': _MOTION_NAMES[motion]  # Para diferenciar el mensaje
+                }
+            if parallel_octaves & bit and 'parallel_octaves' not in violations:
+                violations['parallel_octaves'] = {
+                    'chord_index': 0,
+                    'voices': [v1, v2],
+                    'motion_type': _MOTION_NAMES[motion]
+                }
+        
+        # Quintas/octavas directas: solo movimiento directo y sin excepción
+        if motion == _MOTION_PARALLEL:
+            if (direct_fifths & bit and 'direct_fifths' not in violations
+                    and not ParallelMotionDetector.direct_fifth_allowed(v1, v2, intervals)):
+                violations['direct_fifths'] = {
+                    'chord_index': 0,
+                    'voices': [v1, v2],
+                    'upper_voice': v1
+                }
+            if (direct_octaves & bit and 'direct_octaves' not in violations
+                    and not ParallelMotionDetector.direct_octave_allowed(v1, v2, intervals)):
+                violations['direct_octaves'] = {
+                    'chord_index': 0,
+                    'voices': [v1, v2],
+                    'upper_voice': v1
+                }
+        
+        # Quintas desiguales (par con el bajo), salvo 10as paralelas B-S
+        if (unequal_fifths & bit and 'unequal_fifths' not in violations
+                and not ParallelMotionDetector.has_parallel_tenths_BS(intervals)):
+            violations['unequal_fifths'] = {
+                'chord_index': 0,
+                'voices': ['B', v1],
+                'upper_voice': v1
+            }
+    
+    return violations
+
+
+# =============================================================================
+# CHORD INTEGRATION HELPERS
+# =============================================================================
+
+def _dict_to_chord_safe(chord_dict: Dict) -> Optional['Chord']:
+    """
+    Convierte dict de acorde a Chord class de forma segura.
+    
+    Usado por reglas para integrar con chord_knowledge.Chord sin romper
+    backward compatibility. Si la conversión falla,retorna None y la
+    regla puede usar su método legacy.
+    
+    Args:
+        chord_dict: Dict con formato {'S': 'G4', 'A': 'E4', ..., 'root': 'C', ...}
+        
+    Returns:
+        Chord object o None si faltan campos críticos
+        
+    Example:
+        chord_obj = _dict_to_chord_safe(chord1)
+        if chord_obj:
+            voices_with_7th = chord_obj.get_voices_with_factor('7')
+        else:
+            # Fallback a método antiguo
+            ...
+    """
+    # Campos requeridos: root es crítico
+    root = chord_dict.get('root')
+    if not root:
+        return None  # No podemos analizar sin root
+    
+    # Extraer voces SATB (una sola consulta por voz)
+    voices = tuple(
+        (voice, note) for voice in _SATB
+        if (note := chord_dict.get(voice)) is not None
+    )
+    
+    if len(voices) == 0:
+        return None  # No hay voces
+    
+    args = (
+        voices,
+        root,
+        chord_dict.get('quality'),
+        chord_dict.get('key'),
+        chord_dict.get('inversion', 0)
+    )
+    try:
+        return _build_chord_cached(*args)
+    except TypeError:
+        # Campos no hashables: construir sin caché
+        return _build_chord(*args)
+
+
+def _build_chord(voices: Tuple, root, quality, key, inversion) -> Optional['Chord']:
+    """
+    Crea el Chord (análisis de factores incluido) a partir de campos hashables.
+    
+    Cacheado por contenido (_build_chord_cached): el mismo acorde se analiza
+    una vez aunque lo consulten varias reglas o aparezca en dos transiciones.
+    El Chord devuelto es compartido, solo lectura.
+    """
+    try:
+        from chord_knowledge import Chord
+        
+        # Crear Chord con campos disponibles
+        chord = Chord(
+            voices=dict(voices),
+            root=root,
+            quality=quality,
+            key=key,
+            inversion=inversion
+        )
+        
+        return chord
+        
+    except Exception as e:
+        logger.warning(f"Error converting dict to Chord: {e}")
+        return None  # Fallback seguro
+
+
+# Versión cacheada de _build_chord (se conserva la función sin caché para
+# campos no hashables)
+_build_chord_cached = lru_cache(maxsize=512)(_build_chord)
+
+
+
+
+# =============================================================================
+# REGLA #1: QUINTAS PARALELAS
 # =============================================================================
 
 class ParallelFifthsRule(HarmonicRule):
@@ -803,95 +1801,42 @@ class ParallelFifthsRule(HarmonicRule):
     Color: #FF0000 (RED)
     """
     
+    __slots__ = ()
+    
+    USES_MOTION_DETECTOR = True
+    EXCEPTIONS = (
+        _V_VII_PAIR_EXCEPTION,          # Excepción 1: Par V-VII (misma función dominante)
+        _VOICING_CHANGE_EXCEPTION,      # Excepción 2: Cambio de disposición
+        _SECOND_DIMINISHED_EXCEPTION,   # Excepción 3: Segunda quinta es disminuida
+    )
+    
     def __init__(self):
         super().__init__(
             name='parallel_fifths',
             tier=RuleTier.CRITICAL,
-            color='#FF0000',
+            color=_COLOR_RED,
             short_msg='Quintas paralelas',
             full_msg='Dos quintas justas consecutivas. Prohibidas tanto en movimiento paralelo como contrario: debilitan la independencia de las voces y oscurecen la claridad armónica.'
         )
-        self._add_common_exceptions()
-    
-    def _add_common_exceptions(self):
-        """Añade las excepciones comunes de las quintas paralelas"""
-        
-        # Excepción 1: Par V-VII (misma función dominante)
-        self.add_exception(
-            'V_VII_pair',
-            lambda c1, c2, ctx: ContextAnalyzer.is_V_VII_pair(c1, c2, ctx.get('key', 'C major')),
-            'Permitido entre V-VII o VII-V: ambos tienen función dominante'
-        )
-        
-        # Excepción 2: Cambio de disposición
-        self.add_exception(
-            'voicing_change',
-            lambda c1, c2, ctx: ContextAnalyzer.is_voicing_change(c1, c2),
-            'Permitido en cambio de disposición del mismo acorde'
-        )
-        
-        # Excepción 3: Segunda quinta es disminuida
-        self.add_exception(
-            'second_diminished',
-            lambda c1, c2, ctx: self._second_fifth_is_diminished(c1, c2),
-            'Permitido cuando la segunda quinta es disminuida (P5→d5)'
-        )
     
     def _detect_violation(self, chord1: Dict, chord2: Dict) -> Optional[Dict]:
         """
         Detecta quintas paralelas o contrarias entre todos los pares de voces.
         
-        Proceso:
+        Proceso (en ParallelMotionDetector, pasada única compartida):
             1. Para cada par de voces (S-A, S-T, S-B, A-T, A-B, T-B)
-            2. Calcular intervalo en chord1 y chord2 usando music21
-            3. Verificar si ambos son quintas (justa o aumentada) por NOMBRE
+            2. Intervalo en chord1 y chord2 por NOMBRE (IntervalCache)
+            3. Verificar si ambos son quintas (justa o aumentada)
             4. Verificar si el movimiento es paralelo o contrario
             5. Si es así, marcar violación
         
         Returns:
             Dict con información de la primera violación encontrada, o None
         """
-        voice_pairs = [
-            ('S', 'A'), ('S', 'T'), ('S', 'B'),
-            ('A', 'T'), ('A', 'B'),
-            ('T', 'B')
-        ]
-        
-        for v1, v2 in voice_pairs:
-            # Obtener notas de cada voz
-            note1_v1 = chord1.get(v1)
-            note1_v2 = chord1.get(v2)
-            note2_v1 = chord2.get(v1)
-            note2_v2 = chord2.get(v2)
-            
-            # Verificar que todas las notas existen
-            if not all([note1_v1, note1_v2, note2_v1, note2_v2]):
-                continue
-            
-            # Verificar si ambos intervalos son quintas usando nombres de music21
-            # Esto evita falsos positivos como -8 semitonos (m6 desc) detectado como A5
-            is_fifth_1 = VoiceLeadingUtils.is_fifth(note1_v1, note1_v2)
-            is_fifth_2 = VoiceLeadingUtils.is_fifth(note2_v1, note2_v2)
-            
-            if is_fifth_1 and is_fifth_2:
-                # Verificar tipo de movimiento
-                motion = VoiceLeadingUtils.get_motion_type(
-                    note1_v1, note2_v1,
-                    note1_v2, note2_v2
-                )
-                
-                # Paralelas (movimiento directo) o Consecutivas (movimiento contrario)
-                # Ambas están prohibidas
-                if motion in ['parallel', 'contrary']:
-                    return {
-                        'chord_index': 0,
-                        'voices': [v1, v2],
-                        'motion_type': motion  # Para diferenciar el mensaje
-                    }
-        
-        return None
+        return ParallelMotionDetector.detect(self.name, chord1, chord2)
     
-    def _second_fifth_is_diminished(self, chord1: Dict, chord2: Dict) -> bool:
+    @staticmethod
+    def _second_fifth_is_diminished(chord1: Dict, chord2: Dict) -> bool:
         """
         Verifica si la segunda quinta es disminuida (P5→d5).
         
@@ -901,17 +1846,6 @@ class ParallelFifthsRule(HarmonicRule):
         # TODO: Implementar verificación específica
         # Por ahora retorna False (no aplica excepción)
         return False
-    
-    def _calculate_confidence(self, chord1: Dict, chord2: Dict, context: Dict) -> int:
-        """
-        Calcula la confianza del error.
-        
-        Quintas paralelas son típicamente CERTAIN, pero pueden ser
-        HIGH si hay ambigüedad en la detección de voces.
-        """
-        # Si las voces están muy separadas o hay crossing, reducir confianza
-        # Por ahora, siempre CERTAIN
-        return ConfidenceLevel.CERTAIN.value
 
 
 # =============================================================================
@@ -930,11 +1864,15 @@ class ParallelOctavesRule(HarmonicRule):
         TODO: Consultar con experto si existen excepciones pedagógicas.
     """
     
+    __slots__ = ()
+    
+    USES_MOTION_DETECTOR = True
+    
     def __init__(self):
         super().__init__(
             name='parallel_octaves',
             tier=RuleTier.CRITICAL,
-            color='#FF0000',
+            color=_COLOR_RED,
             short_msg='Octavas paralelas',
             full_msg='Dos octavas justas consecutivas. Prohibidas tanto en movimiento paralelo como contrario: debilitan la independencia de las voces y reducen la riqueza armónica.'
         )
@@ -945,7 +1883,7 @@ class ParallelOctavesRule(HarmonicRule):
         """
         Detecta octavas paralelas o consecutivas entre todos los pares de voces.
         
-        Similar a ParallelFifthsRule pero con is_octave() en lugar de is_fifth().
+        Similar a ParallelFifthsRule pero con octavas (P8/P1) en lugar de quintas.
         
         Args:
             chord1, chord2: Acordes con voces {voz: nota}
@@ -953,60 +1891,8 @@ class ParallelOctavesRule(HarmonicRule):
         Returns:
             Dict con información del error o None si no hay error
         """
-        voice_pairs = [
-            ('S', 'A'), ('S', 'T'), ('S', 'B'),
-            ('A', 'T'), ('A', 'B'),
-            ('T', 'B')
-        ]
-        
-        for v1, v2 in voice_pairs:
-            # Obtener notas de ambos acordes
-            note1_v1 = chord1.get(v1)
-            note1_v2 = chord1.get(v2)
-            note2_v1 = chord2.get(v1)
-            note2_v2 = chord2.get(v2)
-            
-            # Verificar que todas las notas existen
-            if not all([note1_v1, note1_v2, note2_v1, note2_v2]):
-                continue
-            
-            # Verificar si ambos intervalos son octavas usando nombres de music21
-            is_octave_1 = VoiceLeadingUtils.is_octave(note1_v1, note1_v2)
-            is_octave_2 = VoiceLeadingUtils.is_octave(note2_v1, note2_v2)
-            
-            if is_octave_1 and is_octave_2:
-                # Verificar tipo de movimiento
-                motion = VoiceLeadingUtils.get_motion_type(
-                    note1_v1, note2_v1,
-                    note1_v2, note2_v2
-                )
-                
-                # Paralelas (movimiento directo) o Consecutivas (movimiento contrario)
-                # Ambas están prohibidas
-                if motion in ['parallel', 'contrary']:
-                    return {
-                        'chord_index': 0,
-                        'voices': [v1, v2],
-                        'motion_type': motion  # Para diferenciar el mensaje
-                    }
-        
-        return None
-    
-    def _calculate_confidence(self, chord1: Dict, chord2: Dict, context: Dict) -> int:
-        """
-        Calcula el nivel de confianza para octavas paralelas.
-        
-        Octavas paralelas son típicamente CERTAIN, similar a quintas.
-        
-        Args:
-            chord1, chord2: Acordes involucrados
-            context: Contexto armónico
-            
-        Returns:
-            Nivel de confianza (0-100)
-        """
-        # Por ahora siempre CERTAIN (100%)
-        return ConfidenceLevel.CERTAIN.value
+        return ParallelMotionDetector.detect(self.name, chord1, chord2)
+
 
 
 # =============================================================================
@@ -1030,20 +1916,19 @@ class DirectFifthsRule(HarmonicRule):
         - Sin Bajo: MEDIUM (70-80%)
     """
     
+    __slots__ = ()
+    
+    USES_MOTION_DETECTOR = True
+    EXCEPTIONS = (_VOICING_CHANGE_EXCEPTION,)  # Cambio de disposición
+    
     def __init__(self):
         super().__init__(
             name='direct_fifths',
             tier=RuleTier.CRITICAL,  # Para casos más graves (B-S)
-            color='#FFFF00',  # YELLOW (menos grave que paralelas RED)
+            color=_COLOR_YELLOW,  # Menos grave que las paralelas (rojo)
             short_msg='Quinta directa',
             full_msg='Dos voces llegan a quinta justa por movimiento directo. Evita: debilita la independencia de voces.'
         )
-        # NUEVO: Añadir excepción de cambio de disposición
-        self.add_exception(
-            'voicing_change',
-            lambda c1, c2, ctx: ContextAnalyzer.is_voicing_change(c1, c2),
-            'Permitido en cambio de disposición del mismo acorde'
-        )
     
     def _detect_violation(self, chord1: Dict, chord2: Dict) -> Optional[Dict]:
         """
@@ -1052,8 +1937,9 @@ class DirectFifthsRule(HarmonicRule):
         Condiciones:
         1. Intervalo final = P5 (quinta justa)
         2. Intervalo inicial ≠ P5 (si no, serían paralelas)
+           ni d5 (prioridad a UnequalFifthsRule)
         3. Movimiento directo (ambas voces mismo sentido)
-        4. Voz superior salta (> 2 semitonos)
+        4. NO cumple excepciones (ParallelMotionDetector.direct_fifth_allowed)
         
         Args:
             chord1, chord2: Acordes con voces {voz: nota}
@@ -1061,85 +1947,9 @@ class DirectFifthsRule(HarmonicRule):
         Returns:
             Dict con información del error o None
         """
-        voice_pairs = [
-            ('S', 'A'), ('S', 'T'), ('S', 'B'),
-            ('A', 'T'), ('A', 'B'),
-            ('T', 'B')
-        ]
-        
-        for v1, v2 in voice_pairs:
-            # Obtener notas
-            note1_v1 = chord1.get(v1)
-            note1_v2 = chord1.get(v2)
-            note2_v1 = chord2.get(v1)
-            note2_v2 = chord2.get(v2)
-            
-            if not all([note1_v1, note1_v2, note2_v1, note2_v2]):
-                continue
-            
-            # Condición 1: Intervalo final debe ser P5
-            is_fifth_final = VoiceLeadingUtils.is_perfect_fifth(note2_v1, note2_v2)
-            if not is_fifth_final:
-                continue  # No llegan a quinta, OK
-            
-            # Condición 2: Intervalo inicial NO debe ser P5 (si no, son paralelas)
-            is_fifth_initial = VoiceLeadingUtils.is_perfect_fifth(note1_v1, note1_v2)
-            if is_fifth_initial:
-                continue  # Ya detectado por ParallelFifthsRule
-            
-            # PRIORIDAD: Si intervalo inicial es d5, dejar que UnequalFifthsRule lo maneje
-            # Evita duplicación de errores (d5→P5 YA es quinta desigual)
-            is_dim_fifth_initial = VoiceLeadingUtils.is_diminished_fifth(note1_v1, note1_v2)
-            if is_dim_fifth_initial:
-                continue  # Prioridad a UnequalFifthsRule
-            
-            # Condición 3: Movimiento directo (mismo sentido)
-            motion = VoiceLeadingUtils.get_motion_type(
-                note1_v1, note2_v1,
-                note1_v2, note2_v2
-            )
-            if motion != 'parallel':
-                continue  # No es movimiento directo, OK
-            
-            
-            # VERIFICAR EXCEPCIONES (si se cumple alguna, NO es error)
-            # Calcular movimientos de cada voz
-            v1_movement = abs(VoiceLeadingUtils.get_interval_object(note1_v1, note2_v1).semitones)
-            v2_movement = abs(VoiceLeadingUtils.get_interval_object(note1_v2, note2_v2).semitones)
-            
-            v1_stepwise = v1_movement <= 2  # Grado conjunto (≤ 2 semitonos)
-            v2_stepwise = v2_movement <= 2
-            
-            # Excepción 1: Partes extremas (B-S)
-            if 'B' in [v1, v2] and 'S' in [v1, v2]:
-                # Determinar cuál es soprano y cuál es bajo
-                if v1 == 'S':
-                    soprano_stepwise = v1_stepwise
-                    bajo_movement = v2_movement
-                else:  # v2 == 'S'
-                    soprano_stepwise = v2_stepwise
-                    bajo_movement = v1_movement
-                
-                # Permitir si S hace 2ª Y B hace 3ª, 4ª o 5ª (3-7 semitonos)
-                if soprano_stepwise and 3 <= bajo_movement <= 7:
-                    continue  # Excepción aplicada, permitido
-            
-            # Excepción 2: Partes intermedias (resto de pares)
-            else:
-                # Permitir si UNA hace grado conjunto (pero NO ambas)
-                if (v1_stepwise and not v2_stepwise) or (v2_stepwise and not v1_stepwise):
-                    continue  # Excepción aplicada, permitido
-            
-            # NO se cumple ninguna excepción → ERROR
-            return {
-                'chord_index': 0,
-                'voices': [v1, v2],
-                'upper_voice': v1
-            }
-        
-        return None
+        return ParallelMotionDetector.detect(self.name, chord1, chord2)
     
-    def _calculate_confidence(self, chord1: Dict, chord2: Dict, context: Dict) -> int:
+    def _calculate_confidence(self, chord1: Dict, chord2: Dict, context: Dict, violation: Optional[Dict] = None) -> int:
         """
         Calcula confianza según severidad del par de voces.
         
@@ -1147,12 +1957,7 @@ class DirectFifthsRule(HarmonicRule):
         Con Bajo: HIGH (90%)
         Sin Bajo: MEDIUM (70-80%)
         """
-        # Buscar cuál fue el error detectado
-        violation = self._detect_violation(chord1, chord2)
-        if not violation:
-            return 0
-        
-        voices = violation['voices']
+        voices = violation['voices']  # validate() aporta la violación detectada
         v1, v2 = voices[0], voices[1]
         
         # Severidad según pares
@@ -1187,11 +1992,15 @@ class DirectOctavesRule(HarmonicRule):
         - Sin Bajo: MEDIUM (70-80%)
     """
     
+    __slots__ = ()
+    
+    USES_MOTION_DETECTOR = True
+    
     def __init__(self):
         super().__init__(
             name='direct_octaves',
             tier=RuleTier.CRITICAL,
-            color='#FFFF00',  # YELLOW (igual que quintas directas)
+            color=_COLOR_YELLOW,  # Igual que quintas directas
             short_msg='Octava directa',
             full_msg='Dos voces llegan a octava justa por movimiento directo. Evita: debilita la independencia de voces.'
         )
@@ -1206,98 +2015,21 @@ class DirectOctavesRule(HarmonicRule):
         3. Movimiento directo (ambas voces mismo sentido)
         4. NO cumple excepciones
         
-        Excepciones:
+        Excepciones (ParallelMotionDetector.direct_octave_allowed):
         - B-S: soprano +1 semitono ascendente Y bajo +5 semitonos (4ª justa)
         - Otras: una voz hace 2ª (pero no ambas)
         
         Returns:
             Dict con información del error o None
         """
-        voice_pairs = [
-            ('S', 'A'), ('S', 'T'), ('S', 'B'),
-            ('A', 'T'), ('A', 'B'),
-            ('T', 'B')
-        ]
-        
-        for v1, v2 in voice_pairs:
-            note1_v1 = chord1.get(v1)
-            note1_v2 = chord1.get(v2)
-            note2_v1 = chord2.get(v1)
-            note2_v2 = chord2.get(v2)
-            
-            if not all([note1_v1, note1_v2, note2_v1, note2_v2]):
-                continue
-            
-            # Condición 1: Intervalo final debe ser P8 o P1
-            is_octave_final = VoiceLeadingUtils.is_octave(note2_v1, note2_v2)
-            if not is_octave_final:
-                continue
-            
-            # Condición 2: Intervalo inicial NO debe ser P8/P1
-            is_octave_initial = VoiceLeadingUtils.is_octave(note1_v1, note1_v2)
-            if is_octave_initial:
-                continue  # Ya detectado por ParallelOctavesRule
-            
-            # Condición 3: Movimiento directo
-            motion = VoiceLeadingUtils.get_motion_type(
-                note1_v1, note2_v1,
-                note1_v2, note2_v2
-            )
-            if motion != 'parallel':
-                continue
-            
-            # VERIFICAR EXCEPCIONES
-            # Calcular movimientos (con signo para dirección)
-            v1_interval = VoiceLeadingUtils.get_interval_object(note1_v1, note2_v1)
-            v2_interval = VoiceLeadingUtils.get_interval_object(note1_v2, note2_v2)
-            
-            v1_semitones = v1_interval.semitones  # Con signo (+ sube, - baja)
-            v2_semitones = v2_interval.semitones
-            
-            v1_stepwise = abs(v1_semitones) <= 2
-            v2_stepwise = abs(v2_semitones) <= 2
-            
-            # Excepción 1: Partes extremas (B-S) - MÁS ESTRICTA
-            if 'B' in [v1, v2] and 'S' in [v1, v2]:
-                # Determinar quién es soprano y quién es bajo
-                if v1 == 'S':
-                    soprano_semitones = v1_semitones
-                    bajo_semitones = v2_semitones
-                else:
-                    soprano_semitones = v2_semitones
-                    bajo_semitones = v1_semitones
-                
-                # Permitir SI:
-                # - Soprano sube 1 semitono (+1, sensible→tónica)
-                # - Bajo sube 5 semitonos (+5, 4ª justa ascendente)
-                if soprano_semitones == 1 and bajo_semitones == 5:
-                    continue  # Excepción aplicada
-            
-            # Excepción 2: Partes intermedias (igual que quintas)
-            else:
-                # Permitir si UNA hace grado conjunto (pero NO ambas)
-                if (v1_stepwise and not v2_stepwise) or (v2_stepwise and not v1_stepwise):
-                    continue
-            
-            # NO se cumple ninguna excepción → ERROR
-            return {
-                'chord_index': 0,
-                'voices': [v1, v2],
-                'upper_voice': v1
-            }
-        
-        return None
+        return ParallelMotionDetector.detect(self.name, chord1, chord2)
     
-    def _calculate_confidence(self, chord1: Dict, chord2: Dict, context: Dict) -> int:
+    def _calculate_confidence(self, chord1: Dict, chord2: Dict, context: Dict, violation: Optional[Dict] = None) -> int:
         """
         Calcula confianza según severidad del par de voces.
         
         Mismo sistema que DirectFifthsRule.
         """
-        violation = self._detect_violation(chord1, chord2)
-        if not violation:
-            return 0
-        
         voices = violation['voices']
         
         if 'B' in voices and 'S' in voices:
@@ -1330,11 +2062,15 @@ class UnequalFifthsRule(HarmonicRule):
     Color: ORANGE (advertencia seria, menos que paralelas)
     """
     
+    __slots__ = ()
+    
+    USES_MOTION_DETECTOR = True
+    
     def __init__(self):
         super().__init__(
             name='unequal_fifths',
             tier=RuleTier.CRITICAL,
-            color='#FFA500',  # ORANGE
+            color=_COLOR_ORANGE,
             short_msg='Quintas desiguales',
             full_msg='Paso de quinta disminuida a quinta justa con bajo. Evita: movimiento armónico inadecuado.'
         )
@@ -1346,102 +2082,20 @@ class UnequalFifthsRule(HarmonicRule):
         Condiciones:
         1. Intervalo inicial = d5 (quinta disminuida)
         2. Intervalo final = P5 (quinta justa)
-        3. Bajo involucrado en el par
+        3. Bajo involucrado en el par (B-S, B-A, B-T)
         4. NO cumple excepción 10as paralelas B-S
         
         Returns:
             Dict con información del error o None
         """
-        # Solo pares que involucran al bajo
-        bass_pairs = [
-            ('B', 'S'),
-            ('B', 'A'),
-            ('B', 'T')
-        ]
-        
-        for v1, v2 in bass_pairs:
-            note1_v1 = chord1.get(v1)
-            note1_v2 = chord1.get(v2)
-            note2_v1 = chord2.get(v1)
-            note2_v2 = chord2.get(v2)
-            
-            if not all([note1_v1, note1_v2, note2_v1, note2_v2]):
-                continue
-            
-            # Condición 1: Intervalo inicial debe ser d5
-            is_dim_fifth_initial = VoiceLeadingUtils.is_diminished_fifth(note1_v1, note1_v2)
-            if not is_dim_fifth_initial:
-                continue
-            
-            # Condición 2: Intervalo final debe ser P5
-            is_perf_fifth_final = VoiceLeadingUtils.is_perfect_fifth(note2_v1, note2_v2)
-            if not is_perf_fifth_final:
-                continue
-            
-            # Condición 3: Verificar excepción 10as paralelas B-S
-            if self._has_parallel_tenths_BS(chord1, chord2):
-                continue  # Excepción aplicada
-            
-            # TODAS las condiciones se cumplen → ERROR
-            return {
-                'chord_index': 0,
-                'voices': [v1, v2],
-                'upper_voice': v2 if v1 == 'B' else v1
-            }
-        
-        return None
-    
-    def _has_parallel_tenths_BS(self, chord1: Dict, chord2: Dict) -> bool:
-        """
-        Verifica si Bajo-Soprano forman 10as paralelas.
-        
-        Una 10ª puede ser M10, m10, o sus equivalentes simples M3, m3.
-        Deben moverse en movimiento paralelo.
-        
-        Returns:
-            True si hay 10as paralelas en B-S
-        """
-        note1_B = chord1.get('B')
-        note1_S = chord1.get('S')
-        note2_B = chord2.get('B')
-        note2_S = chord2.get('S')
-        
-        if not all([note1_B, note1_S, note2_B, note2_S]):
-            return False
-        
-        # Obtener intervalos B-S en ambos acordes
-        interval1 = VoiceLeadingUtils.get_interval_object(note1_B, note1_S)
-        interval2 = VoiceLeadingUtils.get_interval_object(note2_B, note2_S)
-        
-        if not interval1 or not interval2:
-            return False
-        
-        # Verificar si son 10as (o 3as, que son 10as simples)
-        tenth_names = ['M10', 'm10', 'M3', 'm3', 'A10', 'd10', 'A3']
-        is_tenth_1 = interval1.simpleName in tenth_names
-        is_tenth_2 = interval2.simpleName in tenth_names
-        
-        if not (is_tenth_1 and is_tenth_2):
-            return False
-        
-        # Verificar movimiento paralelo
-        motion = VoiceLeadingUtils.get_motion_type(
-            note1_B, note2_B,
-            note1_S, note2_S
-        )
-        
-        return motion == 'parallel'
+        return ParallelMotionDetector.detect(self.name, chord1, chord2)
     
-    def _calculate_confidence(self, chord1: Dict, chord2: Dict, context: Dict) -> int:
+    def _calculate_confidence(self, chord1: Dict, chord2: Dict, context: Dict, violation: Optional[Dict] = None) -> int:
         """
         Calcula confianza.
         
         Siempre HIGH (90%) ya que solo detectamos con bajo.
         """
-        violation = self._detect_violation(chord1, chord2)
-        if not violation:
-            return 0
-        
         return 90  # HIGH - con bajo siempre
 
 
@@ -1449,6 +2103,75 @@ class UnequalFifthsRule(HarmonicRule):
 # REGLA #6: RESOLUCIÓN DE SENSIBLE (Leading Tone)
 # =============================================================================
 
+# Grados diatónicos comunes (no son dominantes secundarias ni acordes cromáticos)
+_DIATONIC_DEGREES = frozenset({
+    'I', 'ii', 'iii', 'IV', 'V', 'vi', 'vii°',
+    'i', 'II°', 'III', 'iv', 'VII', 'VI'
+})
+
+# Clasificación de grados en bits: una consulta por grado en lugar de
+# varias comparaciones startswith / in por voz
+_DEG_DOMINANT = 1 << 0     # V, V7, V6... / vii°, vii°7 / viiø7
+_DEG_MEDIANT = 1 << 1      # III, iii
+_DEG_SUBMEDIANT = 1 << 2   # vi, VI, VIb, bVI
+_DEG_TONIC = 1 << 3        # I, i
+_DEG_STRICT_DOMINANT = 1 << 4  # V, vii° exactos / V/x / vii.../x (duplicación de sensible)
+
+
+@lru_cache(maxsize=256)
+def _compute_degree_flags(degree: str) -> int:
+    """
+    Bits _DEG_* de un grado romano (camino lento, ver _degree_flags).
+    
+    Cacheada con tamaño acotado: los grados llegan en los dicts de acorde
+    del cliente y un servidor de larga duración puede ver muchos distintos.
+    """
+    flags = 0
+    if degree.startswith(('V', 'vii°', 'viiø')):
+        flags |= _DEG_DOMINANT
+    if degree in ('III', 'iii'):
+        flags |= _DEG_MEDIANT
+    if degree in ('vi', 'VI', 'VIb', 'bVI'):
+        flags |= _DEG_SUBMEDIANT
+    if degree in ('I', 'i'):
+        flags |= _DEG_TONIC
+    if (degree in ('V', 'vii°') or degree.startswith('V/')
+            or (degree.startswith('vii') and '/' in degree)):
+        flags |= _DEG_STRICT_DOMINANT
+    return flags
+
+
+# Grados que produce VoiceLeadingUtils.get_degree_from_chord, precalculados
+# (tabla fija: no crece con los grados que envía el cliente)
+_DEGREE_FLAGS = {
+    degree: _compute_degree_flags(degree)
+    for degree in ('I', 'ii', 'iii', 'IV', 'V', 'vi', 'vii°',
+                   'i', 'ii°', 'III', 'iv', 'VI', '?')
+}
+
+
+def _degree_flags(degree: str) -> int:
+    """Bits _DEG_* de un grado: tabla fija o, si no está tabulado, caché LRU."""
+    flags = _DEGREE_FLAGS.get(degree)
+    if flags is None:
+        flags = _compute_degree_flags(degree)
+    return flags
+
+
+@lru_cache(maxsize=1024)
+def _leading_tone_resolves(note1: str, note2: str, tonic_pc: Optional[int]) -> bool:
+    """
+    True si la sensible note1 resuelve en note2: llega a la tónica de la
+    tonalidad (tonic_pc, None si no se conoce) o sube un semitono.
+    
+    Cacheada por (nota, nota, tónica): cada movimiento de sensible se
+    evalúa una sola vez aunque se repita en la pieza.
+    """
+    if tonic_pc is not None and VoiceLeadingUtils.pitch_class(note2) == tonic_pc:
+        return True  # Resolvió a Tónica Global
+    # Resolvió subiendo semitono (F# -> G, B -> C)
+    return (VoiceLeadingUtils.semitones_between(note1, note2) or 0) == 1
+
 class LeadingToneResolutionRule(HarmonicRule):
     """
     Regla: La sensible en función dominante (V, VII) debe resolver a la Tónica.
@@ -1469,6 +2192,8 @@ class LeadingToneResolutionRule(HarmonicRule):
     Color: #CD853F (Peru - Marrón claro)
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__(
             name='leading_tone_resolution',
@@ -1487,9 +2212,54 @@ class LeadingToneResolutionRule(HarmonicRule):
         """
         key = chord1.get('key', 'C major') 
         
+        # Tónica y sensible de la tonalidad (pitch classes, cacheadas por key)
+        key_pcs = VoiceLeadingUtils.get_key_pcs(key) if key else None
+        tonic_pc = key_pcs[0] if key_pcs else None
+        
+        # Sensibles tonales de chord1
+        leading_tone_voices = VoiceLeadingUtils.get_leading_tone_voices(chord1, key) if key else []
+        
+        # Grados de ambos acordes: no dependen de la voz, se calculan una vez
+        chord_degree = VoiceLeadingUtils.get_degree_from_chord(chord1, key) if key else '?'
+        chord2_degree = VoiceLeadingUtils.get_degree_from_chord(chord2, key) if key else '?'
+        
+        degree1_flags = _degree_flags(chord_degree)
+        degree2_flags = _degree_flags(chord2_degree)
+        
+        # Grados dominantes (igual para mayor y menor)
+        # CORREGIDO: prefijo para incluir V7, V7,+, etc. (ver _DEG_DOMINANT)
+        is_dominant_chord = bool(degree1_flags & _DEG_DOMINANT)
+        
+        # Condiciones de sensible local que no dependen de la voz:
+        # movimiento de fundamentales V-I y acorde secundario/cromático
+        root1 = chord1.get('root')
+        root2 = chord2.get('root')
+        pc_root1 = None
+        if root1 and root2:
+            # Verificar si es movimiento V-I (P5 descendente / P4 ascendente)
+            roots_interval = VoiceLeadingUtils.classify_interval(root1 + '4', root2 + '4')
+            
+            if roots_interval in ['P4', 'P5']:
+                # CRITICAL FIX: Usar degree del analizador en lugar de recalcular
+                # VoiceLeadingUtils.get_degree_from_chord() pierde información de secundarias
+                # (ej: V7/V se convierte en 'ii' diatónico)
+                chord1_degree = chord1.get('degree', '?')
+                
+                # Marcar como sensible local si:
+                # 1. Es dominante secundaria (V/x, vii°/x)
+                # 2. O NO es un grado diatónico simple (_DIATONIC_DEGREES)
+                if '/' in chord1_degree or chord1_degree not in _DIATONIC_DEGREES:
+                    pc_root1 = VoiceLeadingUtils.pitch_class(root1)
+        
+        # Salida rápida: sin sensible tonal activa ni posible sensible local
+        # (caso más común: I, IV, vi... no contienen la sensible)
+        has_tonal_sensible = is_dominant_chord and bool(leading_tone_voices)
+        if not has_tonal_sensible and pc_root1 is None:
+            return None
+        
         # Analizar cada voz en Chord1
         for voice_name, note1 in chord1.items():
-            if voice_name not in ['S', 'A', 'T', 'B']:
+            if voice_name not in _SATB:
                 continue
                 
             is_sensible_candidate = False
@@ -1497,21 +2267,10 @@ class LeadingToneResolutionRule(HarmonicRule):
             
             # --- CHEQUEO 1: Sensible Tonal (Grado 7) ---
             if key:
-                info = VoiceLeadingUtils.get_scale_degree_info(note1, key)
-                if info['is_leading_tone']:
+                if voice_name in leading_tone_voices:
                     # FIX: Solo si está en acorde de función dominante
                     # La sensible solo exige resolución en acordes dominantes (V, vii°)
                     # En otros acordes (ej: iii7 donde es la 5ª), NO es sensible activa
-                    chord_degree = VoiceLeadingUtils.get_degree_from_chord(chord1, key)
-                    
-                    # Grados dominantes (igual para mayor y menor)
-                    # CORREGIDO: Usar startswith para incluir V7, V7,+, etc.
-                    is_dominant_chord = (
-                        chord_degree.startswith('V') or  # V, V7, V7,+, V6, etc.
-                        chord_degree.startswith('vii°') or  # vii°, vii°7
-                        chord_degree.startswith('viiø')  # viiø7
-                    )
-                    
                     if is_dominant_chord:
                         is_sensible_candidate = True
                     # Si no es dominante, NO marcar como sensible activa
@@ -1525,43 +2284,12 @@ class LeadingToneResolutionRule(HarmonicRule):
             # - NUEVO: El movimiento NO es una progresión diatónica normal
             #   (I→V no cuenta, pero D7→G sí, cuando D7 no es el V de la tonalidad)
             
-            if not is_sensible_candidate:
-                root1 = chord1.get('root')
-                root2 = chord2.get('root')
-                
-                # Solo considerar sensible local si hay movimiento de fundamentales V-I
-                if root1 and root2:
-                    # Verificar si es movimiento V-I (P5 descendente / P4 ascendente)
-                    interval_roots = VoiceLeadingUtils.get_interval_object(root1 + '4', root2 + '4')
-                    
-                    if interval_roots and interval_roots.simpleName in ['P4', 'P5']:
-                        # CRITICAL FIX: Usar degree del analizador en lugar de recalcular
-                        # VoiceLeadingUtils.get_degree_from_chord() pierde información de secundarias
-                        # (ej: V7/V se convierte en 'ii' diatónico)
-                        chord1_degree = chord1.get('degree', '?')
-                        
-                        # Verificar si es dominante secundaria (contiene '/')
-                        # O si es un acorde cromático (contiene '#' o 'b' pero no es diatónico)
-                        is_secondary_dominant = '/' in chord1_degree
-                        
-                        # Grados diatónicos comunes (no son dominantes secundarias)
-                        diatonic_degrees = ['I', 'ii', 'iii', 'IV', 'V', 'vi', 'vii°',
-                                            'i', 'II°', 'III', 'iv', 'VII', 'VI']
-                        
-                        # Marcar como sensible local si:
-                        # 1. Es dominante secundaria (V/x, vii°/x)
-                        # 2. O NO es un grado diatónico simple
-                        if is_secondary_dominant or chord1_degree not in diatonic_degrees:
-                            # Verificar si note1 es la 3ª Mayor (Sensible local)
-                            try:
-                                p_root = music21.pitch.Pitch(root1)
-                                p_note = music21.pitch.Pitch(note1)
-                                diff = (p_note.pitchClass - p_root.pitchClass) % 12
-                                if diff == 4:  # M3 = 4 semitonos
-                                    is_sensible_candidate = True
-                                    is_local_sensible = True
-                            except:
-                                pass
+            if not is_sensible_candidate and pc_root1 is not None:
+                # Verificar si note1 es la 3ª Mayor (Sensible local)
+                pc_note = VoiceLeadingUtils.pitch_class(note1)
+                if pc_note is not None and (pc_note - pc_root1) % 12 == 4:  # M3 = 4 semitonos
+                    is_sensible_candidate = True
+                    is_local_sensible = True
 
             if not is_sensible_candidate:
                 continue
@@ -1572,8 +2300,7 @@ class LeadingToneResolutionRule(HarmonicRule):
             # (Solo aplica si fue detectada por Grado 7 tonal)
             # NOTA: Con el fix arriba, esto ya no debería activarse, pero lo mantenemos como seguridad
             if key:
-                chord_degree = VoiceLeadingUtils.get_degree_from_chord(chord1, key)
-                if chord_degree in ['III', 'iii']:
+                if degree1_flags & _DEG_MEDIANT:
                     continue
  
 
@@ -1582,36 +2309,23 @@ class LeadingToneResolutionRule(HarmonicRule):
             if not note2: 
                 continue
             
-            # 1. Chequeo: ¿Resolvió a Tónica Tonal? (Solo si era sensible tonal)
-            if key:
-                info2 = VoiceLeadingUtils.get_scale_degree_info(note2, key)
-                if info2['degree'] == 1:
-                    continue # Resolvió a Tónica Global
-
-            # 2. Chequeo: ¿Resolvió ascendiendo semitono? (Criterio General)
-            semitones = 0
-            interval_obj = VoiceLeadingUtils.get_interval_object(note1, note2)
-            if interval_obj:
-                semitones = interval_obj.semitones
-            
-            if semitones == 1:
-                continue # Resolvió subiendo semitono (F# -> G, B -> C)
+            # Chequeos 1 y 2: ¿Resolvió a Tónica Tonal o ascendiendo semitono?
+            if _leading_tone_resolves(note1, note2, tonic_pc):
+                continue
             
             # Excepción Cadencia Rota (V-vi).
             if key:
-                chord2_degree = VoiceLeadingUtils.get_degree_from_chord(chord2, key)
-                
                 # Si no podemos determinar el grado ('?'), asumimos que podría ser tónica
                 if chord2_degree == '?':
                     # No permitir excepción, continuar validando
                     pass
                 else:
-                    is_dest_submediant = (chord2_degree in ['vi', 'VI', 'VIb', 'bVI'])
+                    is_dest_submediant = bool(degree2_flags & _DEG_SUBMEDIANT)
                     
                     if is_dest_submediant:
                         pass 
                     else:
-                        if chord2_degree not in ['I', 'i'] and not is_local_sensible:
+                        if not degree2_flags & _DEG_TONIC and not is_local_sensible:
                               continue
             
             # Excepción: V-VII (misma función)
@@ -1629,19 +2343,16 @@ class LeadingToneResolutionRule(HarmonicRule):
             if key and voice_name == 'B' and not is_local_sensible:
                 # Verificar que es modo mayor
                 if 'major' in key.lower():
-                    chord2_degree = VoiceLeadingUtils.get_degree_from_chord(chord2, key)
                     # Si el acorde destino es vi (submediante)
                     if chord2_degree == 'vi':
                         # Verificar que note2 es la fundamental del vi
                         root2 = chord2.get('root')
                         if root2:
-                            try:
-                                factor2 = VoiceLeadingUtils.get_chord_factor(note2, root2)
-                                if factor2 == '1':
-                                    # Cadencia rota V6 → vi válida
-                                    continue
-                            except:
-                                pass
+                            # get_chord_factor devuelve '?' si no puede calcular
+                            factor2 = VoiceLeadingUtils.get_chord_factor(note2, root2)
+                            if factor2 == '1':
+                                # Cadencia rota V6 → vi válida
+                                continue
                 
             # Excepción: Resolución Indirecta (Voz Interna)
             # Aplica para TODAS las sensibles (tonales y locales)
@@ -1653,26 +2364,23 @@ class LeadingToneResolutionRule(HarmonicRule):
                 # Obtener fundamental del acorde destino (tónica esperada)
                 root2 = chord2.get('root')
                 if root2:
-                    try:
-                        # Verificar condición 1: ¿note2 es la 5ª del acorde destino?
-                        factor2 = VoiceLeadingUtils.get_chord_factor(note2, root2)
-                        is_fifth = (factor2 == '5')
+                    # Verificar condición 1: ¿note2 es la 5ª del acorde destino?
+                    factor2 = VoiceLeadingUtils.get_chord_factor(note2, root2)
+                    is_fifth = (factor2 == '5')
+                    
+                    if is_fifth:
+                        # Verificar condición 2: ¿La voz superior tiene la tónica?
+                        # A → verificar S, T → verificar A
+                        upper_voice = 'S' if voice_name == 'A' else 'A'
+                        upper_note = chord2.get(upper_voice)
                         
-                        if is_fifth:
-                            # Verificar condición 2: ¿La voz superior tiene la tónica?
-                            # A → verificar S, T → verificar A
-                            upper_voice = 'S' if voice_name == 'A' else 'A'
-                            upper_note = chord2.get(upper_voice)
+                        if upper_note:
+                            upper_factor = VoiceLeadingUtils.get_chord_factor(upper_note, root2)
+                            has_tonic_above = (upper_factor == '1')
                             
-                            if upper_note:
-                                upper_factor = VoiceLeadingUtils.get_chord_factor(upper_note, root2)
-                                has_tonic_above = (upper_factor == '1')
-                                
-                                if has_tonic_above:
-                                    # Resolución indirecta válida
-                                    continue
-                    except:
-                        pass 
+                            if has_tonic_above:
+                                # Resolución indirecta válida
+                                continue
             
             return {
                 'chord_index': 0,
@@ -1699,11 +2407,13 @@ class SeventhResolutionRule(HarmonicRule):
     Color: #FF0000 (RED)
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__(
             name='seventh_resolution',
             tier=RuleTier.CRITICAL,
-            color='#FF0000',
+            color=_COLOR_RED,
             short_msg='Séptima sin resolver',
             full_msg='La séptima del acorde es una disonancia obligada y debe resolver descendiendo por grado.'
         )
@@ -1712,62 +2422,22 @@ class SeventhResolutionRule(HarmonicRule):
         """
         Detecta si la 7ª del acorde NO resuelve correctamente.
         
-        Refactorizado para usar Chord class con fallback completo.
+        Un solo camino: el factor de cada voz sale de get_chord_factor
+        (cacheado), el mismo cálculo que Chord._analyze_factors, sin
+        construir el objeto Chord.
         """
-        # Intentar usar Chord (método nuevo)
-        chord1_obj = _dict_to_chord_safe(chord1)
-        
-        if chord1_obj:
-            return self._detect_violation_chord(chord1_obj, chord2)
-        else:
-            return self._detect_violation_legacy(chord1, chord2)
-    
-    def _detect_violation_chord(self, chord1_obj, chord2: Dict) -> Optional[Dict]:
-        """Método refactorizado usando Chord class."""
-        from chord_knowledge import Chord
-        
-        # Reconstruir chord1 dict para compatibilidad con is_voicing_change
-        chord1 = chord1_obj.voices.copy()
-        chord1['root'] = chord1_obj.root
-        chord1['quality'] = chord1_obj.quality
-        chord1['key'] = chord1_obj.key
-        chord1['inversion'] = chord1_obj.inversion
-        
-        # Excepción: cambio de disposición
-        if ContextAnalyzer.is_voicing_change(chord1, chord2):
-            return None
-        
-        # Usar Chord para encontrar voces con 7ª - MÁS SIMPLE
-        voices_with_7th = chord1_obj.get_voices_with_factor('7')
-        
-        for voice in voices_with_7th:
-            note1 = chord1_obj.voices[voice]
-            note2 = chord2.get(voice)
-            if not note2: continue
-            
-            iv = VoiceLeadingUtils.get_interval_object(note1, note2)
-            if not iv: continue
-            
-            semitones = iv.semitones
-            
-            # REGLA: Debe bajar -1 o -2 semitonos
-            if semitones == -1 or semitones == -2:
-                continue
-            
-            return {'chord_index': 0, 'voices': [voice], 'upper_voice': voice}
-        
-        return None
-    
-    def _detect_violation_legacy(self, chord1: Dict, chord2: Dict) -> Optional[Dict]:
-        """Método original SIN CAMBIOS (fallback)."""
         root1 = chord1.get('root')
         if not root1: return None
         
+        # Excepción: cambio de disposición (inversión 0 por defecto, como en Chord)
+        if 'inversion' not in chord1:
+            chord1 = {**chord1, 'inversion': 0}
         if ContextAnalyzer.is_voicing_change(chord1, chord2):
             return None
-            
-        for voice, note1 in chord1.items():
-            if voice not in ['S','A','T','B']: continue
+        
+        for voice in _SATB:
+            note1 = chord1.get(voice)
+            if not note1: continue
             
             factor = VoiceLeadingUtils.get_chord_factor(note1, root1)
             if factor != '7': continue
@@ -1775,16 +2445,15 @@ class SeventhResolutionRule(HarmonicRule):
             note2 = chord2.get(voice)
             if not note2: continue
             
-            iv = VoiceLeadingUtils.get_interval_object(note1, note2)
-            if not iv: continue
-            
-            semitones = iv.semitones
+            semitones = VoiceLeadingUtils.semitones_between(note1, note2)
+            if semitones is None: continue
             
+            # REGLA: Debe bajar -1 o -2 semitonos
             if semitones == -1 or semitones == -2:
                 continue
             
             return {'chord_index': 0, 'voices': [voice], 'upper_voice': voice}
-            
+        
         return None
 
 
@@ -1793,6 +2462,192 @@ class SeventhResolutionRule(HarmonicRule):
 # MOTOR DE REGLAS
 # =============================================================================
 
+# =============================================================================
+# DETECTOR FUSIONADO: GEOMETRÍA DE VOCES (cruzamiento, distancia, invasión)
+# =============================================================================
+
+class VoiceGeometryDetector:
+    """
+    Detector de una sola pasada para las 3 reglas geométricas de voces.
+    
+    VoiceCrossingRule, MaximumDistanceRule y VoiceOverlapRule comparan las
+    mismas alturas (ps) de voces contiguas. El detector lee las filas de ambos
+    acordes (_chord_ps_row) una vez y registra la primera violación de cada
+    regla; las reglas solo leen su entrada.
+    
+    Ejemplo:
+        violation = VoiceGeometryDetector.detect('voice_crossing', chord1, chord2)
+    """
+    
+    @staticmethod
+    def detect_all(chord1: Dict, chord2: Dict) -> Dict[str, Dict]:
+        """
+        Violaciones de las 3 reglas en la transición chord1 → chord2.
+        
+        Returns:
+            {rule_name: violación} solo para las reglas violadas.
+            El dict es compartido (cacheado): no modificar.
+        """
+        return _detect_voice_geometry(
+            VoicedChord.from_dict(chord1),
+            VoicedChord.from_dict(chord2)
+        )
+    
+    @staticmethod
+    def detect(rule_name: str, chord1: Dict, chord2: Dict) -> Optional[Dict]:
+        """Violación de una regla concreta (copia independiente) o None."""
+        violation = VoiceGeometryDetector.detect_all(chord1, chord2).get(rule_name)
+        if not violation:
+            return None
+        return {**violation, 'voices': list(violation['voices'])}
+    
+    @staticmethod
+    def detect_batch(rule_name: str, progression: ChordProgression) -> List[Optional[Dict]]:
+        """
+        Violaciones de una regla en cada transición de la progresión,
+        leyendo la columna voices sin volver a los dicts.
+        """
+        voices = progression.voices
+        results = []
+        for t in range(len(voices) - 1):
+            violation = _detect_voice_geometry(voices[t], voices[t + 1]).get(rule_name)
+            results.append({**violation, 'voices': list(violation['voices'])} if violation else None)
+        return results
+
+
+# Pares contiguos (voz_inferior, voz_superior) de cada regla geométrica
+_CROSSING_PAIRS = (('B', 'T'), ('T', 'A'), ('A', 'S'))
+_DISTANCE_PAIRS = (
+    ('A', 'S'),  # Alto-Soprano
+    ('T', 'A')   # Tenor-Alto
+)
+_OVERLAP_PAIRS = (('B', 'T'), ('T', 'A'), ('A', 'S'))
+
+
+@lru_cache(maxsize=512)
+def _detect_chord_spacing(notes1: VoicedChord) -> Dict[str, Dict]:
+    """
+    Cruzamiento y distancia máxima: solo dependen de chord1.
+    
+    Cacheado por acorde (no por transición): un acorde repetido o seguido de
+    acordes distintos se analiza una sola vez.
+    
+    Args:
+        notes1: VoicedChord del acorde (None si falta la voz)
+    """
+    row1 = _chord_ps_row(notes1)
+    violations = {}
+    
+    # Cruzamiento (chord1): voz grave > voz aguda
+    for lower_voice, upper_voice in _CROSSING_PAIRS:
+        lower_idx, upper_idx = _VOICE_INDEX[lower_voice], _VOICE_INDEX[upper_voice]
+        
+        # Si falta alguna nota, no podemos validar este par
+        if not notes1[lower_idx] or not notes1[upper_idx]:
+            continue
+        
+        ps_lower, ps_upper = row1[lower_idx], row1[upper_idx]
+        if ps_lower is None or ps_upper is None:
+            logger.warning(f"Error analizando cruce {lower_voice}-{upper_voice}: "
+                           f"nota no válida ({notes1[lower_idx]}, {notes1[upper_idx]})")
+            continue
+        
+        if ps_lower > ps_upper:
+            violations['voice_crossing'] = {
+                'chord_index': 0,
+                'voices': [lower_voice, upper_voice],
+                'upper_voice': upper_voice
+            }
+            break
+    
+    # Distancia máxima (chord1): voces superiores separadas > 8ª
+    for lower_voice, upper_voice in _DISTANCE_PAIRS:
+        lower_idx, upper_idx = _VOICE_INDEX[lower_voice], _VOICE_INDEX[upper_voice]
+        
+        # Si falta alguna nota, no podemos validar
+        if not notes1[lower_idx] or not notes1[upper_idx]:
+            continue
+        
+        ps_lower, ps_upper = row1[lower_idx], row1[upper_idx]
+        if ps_lower is None or ps_upper is None:
+            logger.warning(f"Error analizando distancia {lower_voice}-{upper_voice}: "
+                           f"nota no válida ({notes1[lower_idx]}, {notes1[upper_idx]})")
+            continue
+        
+        # Calcular distancia absoluta
+        distance = abs(ps_upper - ps_lower)
+        
+        # Verificar si excede octava (12 semitonos)
+        if distance > 12:
+            violations['maximum_distance'] = {
+                'chord_index': 0,
+                'voices': [lower_voice, upper_voice],
+                'upper_voice': upper_voice,
+                'distance_semitones': distance
+            }
+            break
+    
+    return violations
+
+
+@lru_cache(maxsize=1024)
+def _detect_voice_geometry(notes1: VoicedChord, notes2: VoicedChord) -> Dict[str, Dict]:
+    """
+    Pasada única para cruzamiento, distancia máxima e invasión de voces.
+    
+    Conserva la PRIMERA violación de cada regla en su propio orden de pares
+    (el mismo que usaban las reglas por separado).
+    
+    Args:
+        notes1, notes2: VoicedChord de cada acorde (None si falta la voz)
+    """
+    violations = dict(_detect_chord_spacing(notes1))
+    
+    # Acorde repetido: la invasión se reduce a p1_upper < p1_lower en los
+    # mismos pares contiguos que el cruzamiento; sin cruce no hay invasión
+    if notes1 == notes2 and 'voice_crossing' not in violations:
+        return violations
+    
+    row1 = _chord_ps_row(notes1)
+    row2 = _chord_ps_row(notes2)
+    
+    # Invasión (chord1 → chord2)
+    for lower_voice, upper_voice in _OVERLAP_PAIRS:
+        lower_idx, upper_idx = _VOICE_INDEX[lower_voice], _VOICE_INDEX[upper_voice]
+        
+        # Necesitamos las 4 notas para validar
+        if not (notes1[lower_idx] and notes1[upper_idx] and notes2[lower_idx] and notes2[upper_idx]):
+            continue
+        
+        p1_lower, p1_upper = row1[lower_idx], row1[upper_idx]
+        p2_lower, p2_upper = row2[lower_idx], row2[upper_idx]
+        if p1_lower is None or p1_upper is None or p2_lower is None or p2_upper is None:
+            logger.warning(f"Error analizando overlap {lower_voice}-{upper_voice}: nota no válida")
+            continue
+        
+        # Invasión descendente: voz superior baja más que inferior estaba
+        if p2_upper < p1_lower:
+            violations['voice_overlap'] = {
+                'chord_index': 0,
+                'voices': [lower_voice, upper_voice],
+                'upper_voice': upper_voice,
+                'invasion_type': 'descending'
+            }
+            break
+        
+        # Invasión ascendente: voz inferior sube más que superior estaba
+        if p2_lower > p1_upper:
+            violations['voice_overlap'] = {
+                'chord_index': 0,
+                'voices': [lower_voice, upper_voice],
+                'upper_voice': lower_voice,  # La que invade (lower sube)
+                'invasion_type': 'ascending'
+            }
+            break
+    
+    return violations
+
+
 # =============================================================================
 # REGLA #8: CRUZAMIENTO DE VOCES (VOICE CROSSING)
 # =============================================================================
@@ -1819,11 +2674,16 @@ class VoiceCrossingRule(HarmonicRule):
         - Cruce momentáneo en paso (no implementada)
     """
     
+    __slots__ = ()
+    
+    # Cruzamiento de voces es INEQUÍVOCO
+    CONFIDENCE = ConfidenceLevel.CERTAIN.value  # 100%
+    
     def __init__(self):
         super().__init__(
             name='voice_crossing',
             tier=RuleTier.CRITICAL,
-            color='#FF0000',  # RED - Error grave
+            color=_COLOR_RED,  # Error grave
             short_msg='Cruzamiento de voces',
             full_msg='Las voces se cruzan: una voz grave está por encima de una voz aguda, '
                      'violando el orden natural Bajo < Tenor < Alto < Soprano'
@@ -1838,43 +2698,14 @@ class VoiceCrossingRule(HarmonicRule):
         - T-A: Tenor debe estar por debajo del Alto
         - A-S: Alto debe estar por debajo de la Soprano
         
-        Returns:
-            Dict con voices cruzadas o None si no hay cruces
-        """
-        voice_pairs = [('B', 'T'), ('T', 'A'), ('A', 'S')]
-        
-        for lower_voice, upper_voice in voice_pairs:
-            note_lower = chord1.get(lower_voice)
-            note_upper = chord1.get(upper_voice)
-            
-            # Si falta alguna nota, no podemos validar este par
-            if not note_lower or not note_upper:
-                continue
-            
-            try:
-                # Convertir a pitch space (ps)
-                p_lower = music21.pitch.Pitch(note_lower)
-                p_upper = music21.pitch.Pitch(note_upper)
-                
-                # Verificar cruzamiento: voz grave > voz aguda
-                if p_lower.ps > p_upper.ps:
-                    return {
-                        'chord_index': 0,
-                        'voices': [lower_voice, upper_voice],
-                        'upper_voice': upper_voice
-                    }
-            
-            except Exception as e:
-                logger.warning(f"Error analizando cruce {lower_voice}-{upper_voice}: {e}")
-                continue
-        
-        return None
-    
-    def _calculate_confidence(self, chord1, chord2, context):
-        """
-        Cruzamiento de voces es INEQUÍVOCO.
+        Returns:
+            Dict con voices cruzadas o None si no hay cruces
         """
-        return ConfidenceLevel.CERTAIN.value  # 100%
+        return VoiceGeometryDetector.detect(self.name, chord1, chord2)
+    
+    def detect_batch(self, progression: ChordProgression) -> List[Optional[Dict]]:
+        """Detección por lotes sobre las columnas de la progresión."""
+        return VoiceGeometryDetector.detect_batch(self.name, progression)
 
 
 
@@ -1904,11 +2735,16 @@ class MaximumDistanceRule(HarmonicRule):
         - Contextos donde la separación es obligada (no implementada)
     """
     
+    __slots__ = ()
+    
+    # Distancia excesiva es clara pero no tan grave como cruzamiento
+    CONFIDENCE = ConfidenceLevel.HIGH.value  # 80%
+    
     def __init__(self):
         super().__init__(
             name='maximum_distance',
             tier=RuleTier.IMPORTANT,
-            color='#FFFF00',  # YELLOW - Advertencia importante
+            color=_COLOR_YELLOW,  # Advertencia importante
             short_msg='Distancia excesiva entre voces',
             full_msg='La separación entre voces contiguas supera la octava (12 semitonos), '
                      'creando un vacío armónico no recomendado'
@@ -1927,48 +2763,12 @@ class MaximumDistanceRule(HarmonicRule):
         Returns:
             Dict con voices afectadas o None si distancias válidas
         """
-        # Pares a verificar (voz_inferior, voz_superior)
-        voice_pairs = [
-            ('A', 'S'),  # Alto-Soprano
-            ('T', 'A')   # Tenor-Alto
-        ]
-        
-        for lower_voice, upper_voice in voice_pairs:
-            note_lower = chord1.get(lower_voice)
-            note_upper = chord1.get(upper_voice)
-            
-            # Si falta alguna nota, no podemos validar
-            if not note_lower or not note_upper:
-                continue
-            
-            try:
-                # Convertir a pitch space
-                p_lower = music21.pitch.Pitch(note_lower)
-                p_upper = music21.pitch.Pitch(note_upper)
-                
-                # Calcular distancia absoluta
-                distance = abs(p_upper.ps - p_lower.ps)
-                
-                # Verificar si excede octava (12 semitonos)
-                if distance > 12:
-                    return {
-                        'chord_index': 0,
-                        'voices': [lower_voice, upper_voice],
-                        'upper_voice': upper_voice,
-                        'distance_semitones': distance
-                    }
-            
-            except Exception as e:
-                logger.warning(f"Error analizando distancia {lower_voice}-{upper_voice}: {e}")
-                continue
-        
-        return None
+        # Pares verificados: _DISTANCE_PAIRS (voz_inferior, voz_superior)
+        return VoiceGeometryDetector.detect(self.name, chord1, chord2)
     
-    def _calculate_confidence(self, chord1, chord2, context):
-        """
-        Distancia excesiva es clara pero no tan grave como cruzamiento.
-        """
-        return ConfidenceLevel.HIGH.value  # 80%
+    def detect_batch(self, progression: ChordProgression) -> List[Optional[Dict]]:
+        """Detección por lotes sobre las columnas de la progresión."""
+        return VoiceGeometryDetector.detect_batch(self.name, progression)
 
 
 
@@ -1997,11 +2797,16 @@ class VoiceOverlapRule(HarmonicRule):
         - Intercambio intencional de voces (no implementada)
     """
     
+    __slots__ = ()
+    
+    # Invasión de voces es clara pero menos grave que cruzamiento
+    CONFIDENCE = ConfidenceLevel.HIGH.value  # 80%
+    
     def __init__(self):
         super().__init__(
             name='voice_overlap',
             tier=RuleTier.IMPORTANT,
-            color='#FFFF00',  # YELLOW - Advertencia importante
+            color=_COLOR_YELLOW,  # Advertencia importante
             short_msg='Invasión de voces',
             full_msg='Una voz invade el registro que ocupaba otra voz en el acorde anterior, '
                      'creando confusión en la conducción de voces'
@@ -2018,54 +2823,11 @@ class VoiceOverlapRule(HarmonicRule):
         Returns:
             Dict con voices afectadas o None si no hay invasiones
         """
-        voice_pairs = [('B', 'T'), ('T', 'A'), ('A', 'S')]
-        
-        for lower_voice, upper_voice in voice_pairs:
-            note1_lower = chord1.get(lower_voice)
-            note1_upper = chord1.get(upper_voice)
-            note2_lower = chord2.get(lower_voice)
-            note2_upper = chord2.get(upper_voice)
-            
-            # Necesitamos las 4 notas para validar
-            if not all([note1_lower, note1_upper, note2_lower, note2_upper]):
-                continue
-            
-            try:
-                # Convertir a pitch space
-                p1_lower = music21.pitch.Pitch(note1_lower).ps
-                p1_upper = music21.pitch.Pitch(note1_upper).ps
-                p2_lower = music21.pitch.Pitch(note2_lower).ps
-                p2_upper = music21.pitch.Pitch(note2_upper).ps
-                
-                # Invasión descendente: voz superior baja más que inferior estaba
-                if p2_upper < p1_lower:
-                    return {
-                        'chord_index': 0,
-                        'voices': [lower_voice, upper_voice],
-                        'upper_voice': upper_voice,
-                        'invasion_type': 'descending'
-                    }
-                
-                # Invasión ascendente: voz inferior sube más que superior estaba
-                if p2_lower > p1_upper:
-                    return {
-                        'chord_index': 0,
-                        'voices': [lower_voice, upper_voice],
-                        'upper_voice': lower_voice,  # La que invade (lower sube)
-                        'invasion_type': 'ascending'
-                    }
-            
-            except Exception as e:
-                logger.warning(f"Error analizando overlap {lower_voice}-{upper_voice}: {e}")
-                continue
-        
-        return None
+        return VoiceGeometryDetector.detect(self.name, chord1, chord2)
     
-    def _calculate_confidence(self, chord1, chord2, context):
-        """
-        Invasión de voces es clara pero menos grave que cruzamiento.
-        """
-        return ConfidenceLevel.HIGH.value  # 80%
+    def detect_batch(self, progression: ChordProgression) -> List[Optional[Dict]]:
+        """Detección por lotes sobre las columnas de la progresión."""
+        return VoiceGeometryDetector.detect_batch(self.name, progression)
 
 
 
@@ -2074,6 +2836,40 @@ class VoiceOverlapRule(HarmonicRule):
 # REGLA #11: DUPLICACIÓN DE SENSIBLE (DUPLICATED LEADING TONE)
 # =============================================================================
 
+def _resolve_root(chord: Dict) -> Optional[str]:
+    """
+    Fundamental del acorde; si falta, el nombre del bajo (pitch_name cacheado).
+    
+    Returns:
+        Nombre de la fundamental o None si no hay root ni bajo válido
+    """
+    root = chord.get('root')
+    if root:
+        return root
+    bass_note = chord.get('B')
+    return VoiceLeadingUtils.pitch_name(bass_note) if bass_note else None
+
+
+def _transitions_from_chord_checks(per_chord: List[Optional[Dict]]) -> List[Optional[Dict]]:
+    """
+    Violaciones por transición a partir de las de cada acorde.
+    
+    Las reglas de duplicación revisan chord1 y, si está bien, chord2
+    (chord_index 1). En una progresión cada acorde se revisa UNA vez y la
+    transición t toma el resultado de t o, en su defecto, el de t+1.
+    """
+    results = []
+    for t in range(len(per_chord) - 1):
+        violation, chord_index = per_chord[t], 0
+        if not violation:
+            violation, chord_index = per_chord[t + 1], 1
+        results.append(
+            {**violation, 'voices': list(violation['voices']), 'chord_index': chord_index}
+            if violation else None
+        )
+    return results
+
+
 class DuplicatedLeadingToneRule(HarmonicRule):
     """
     Detecta duplicación de la sensible en acordes de función dominante.
@@ -2095,11 +2891,16 @@ class DuplicatedLeadingToneRule(HarmonicRule):
     Color: #FF0000 (RED) - Error crítico
     """
     
+    __slots__ = ()
+    
+    # Duplicar la sensible es un error inequívoco en pedagogía estricta
+    CONFIDENCE = ConfidenceLevel.CERTAIN.value  # 100%
+    
     def __init__(self):
         super().__init__(
             name='duplicated_leading_tone',
             tier=RuleTier.CRITICAL,
-            color='#FF0000',  # RED
+            color=_COLOR_RED,
             short_msg='Sensible duplicada',
             full_msg='La sensible está duplicada en múltiples voces, '
                      'lo cual crea problemas de resolución y desequilibra el acorde'
@@ -2133,6 +2934,12 @@ class DuplicatedLeadingToneRule(HarmonicRule):
         
         return None
     
+    def detect_batch(self, progression: ChordProgression) -> List[Optional[Dict]]:
+        """Detección por lotes: cada acorde de la progresión se revisa una sola vez."""
+        return _transitions_from_chord_checks(
+            [self._check_chord_for_duplicated_leading_tone(chord) for chord in progression.chords]
+        )
+    
     def _check_chord_for_duplicated_leading_tone(self, chord: Dict) -> Optional[Dict]:
         """
         Verifica si UN acorde tiene sensible duplicada.
@@ -2146,48 +2953,20 @@ class DuplicatedLeadingToneRule(HarmonicRule):
         # 1. Verificar si es acorde dominante
         chord_degree = chord.get('degree')
         
-        is_dominant = False
-        if chord_degree:
-            is_dominant = (
-                chord_degree in ['V', 'vii°'] or
-                chord_degree.startswith('V/') or
-                chord_degree.startswith('vii') and '/' in chord_degree
-            )
+        # V, vii°, V/x o vii.../x (bit precalculado por grado, ver _degree_flags)
+        is_dominant = bool(chord_degree) and bool(_degree_flags(chord_degree) & _DEG_STRICT_DOMINANT)
         
         if not is_dominant:
             return None  # No es dominante, no aplica
         
-        # 2. Obtener la fundamental del acorde
-        root = chord.get('root')
-        
+        # 2. Obtener la fundamental del acorde (o el bajo como fallback)
+        root = _resolve_root(chord)
         if not root:
-            # Fallback: usar bajo
-            bass_note = chord.get('B')
-            if bass_note:
-                try:
-                    root = music21.pitch.Pitch(bass_note).name
-                except:
-                    return None
-            else:
-                return None
+            return None
         
         # 3. Identificar cuáles notas son el factor '3' (sensible en dominantes)
-        voices_with_third = []
-        
-        for voice in ['S', 'A', 'T', 'B']:
-            note = chord.get(voice)
-            if not note:
-                continue
-            
-            try:
-                # Usar el conocimiento de factores del sistema
-                factor = VoiceLeadingUtils.get_chord_factor(note, root)
-                
-                if factor == '3':  # Esta nota es la 3ª del acorde = sensible
-                    voices_with_third.append(voice)
-            except Exception as e:
-                logger.warning(f"Error obteniendo factor de {note} en {root}: {e}")
-                continue
+        # Usar el conocimiento de factores del sistema (compartido entre reglas)
+        voices_with_third = list(VoiceLeadingUtils.voices_by_factor(chord, root).get('3', ()))
         
         # 4. Si hay más de una voz con el factor '3' → Sensible duplicada
         if len(voices_with_third) > 1:
@@ -2198,12 +2977,6 @@ class DuplicatedLeadingToneRule(HarmonicRule):
             }
         
         return None
-    
-    def _calculate_confidence(self, chord1, chord2, context):
-        """
-        Duplicar la sensible es un error inequívoco en pedagogía estricta.
-        """
-        return 100  # Confianza máxima
 
 
 class DuplicatedSeventhRule(HarmonicRule):
@@ -2224,6 +2997,11 @@ class DuplicatedSeventhRule(HarmonicRule):
     Aplicable a: V7, ii7, I7, cualquier acorde con 7ª
     """
     
+    __slots__ = ()
+    
+    # Duplicar la 7ª es un error inequívoco
+    CONFIDENCE = ConfidenceLevel.CERTAIN.value  # 100%
+    
     def __init__(self):
         super().__init__(
             name='duplicated_seventh',
@@ -2260,6 +3038,12 @@ class DuplicatedSeventhRule(HarmonicRule):
         
         return None
     
+    def detect_batch(self, progression: ChordProgression) -> List[Optional[Dict]]:
+        """Detección por lotes: cada acorde de la progresión se revisa una sola vez."""
+        return _transitions_from_chord_checks(
+            [self._check_chord_for_duplicated_seventh(chord) for chord in progression.chords]
+        )
+    
     def _check_chord_for_duplicated_seventh(self, chord: Dict) -> Optional[Dict]:
         """
         Verifica si UN acorde tiene 7ª duplicada.
@@ -2269,40 +3053,19 @@ class DuplicatedSeventhRule(HarmonicRule):
         2. Identificar voces con factor '7'
         3. Si > 1 → Error
         """
-        if not chord or len(chord) < 2:
+        # Un dict de un solo campo no puede duplicar nada: lo descartan ya
+        # _resolve_root (sin root ni bajo) o el mapa de factores (una voz)
+        if not chord:
             return None
         
-        # 1. Obtener la fundamental del acorde
-        root = chord.get('root')
-        
+        # 1. Obtener la fundamental del acorde (o el bajo como fallback)
+        root = _resolve_root(chord)
         if not root:
-            # Fallback: usar bajo
-            bass_note = chord.get('B')
-            if bass_note:
-                try:
-                    root = music21.pitch.Pitch(bass_note).name
-                except:
-                    return None
-            else:
-                return None
+            return None
         
         # 2. Identificar cuáles notas son el factor '7' (séptima del acorde)
-        voices_with_seventh = []
-        
-        for voice in ['S', 'A', 'T', 'B']:
-            note = chord.get(voice)
-            if not note:
-                continue
-            
-            try:
-                # Usar el conocimiento de factores del sistema
-                factor = VoiceLeadingUtils.get_chord_factor(note, root)
-                
-                if factor == '7':  # Esta nota es la 7ª del acorde
-                    voices_with_seventh.append(voice)
-            except Exception as e:
-                logger.warning(f"Error obteniendo factor de {note} en {root}: {e}")
-                continue
+        # Usar el conocimiento de factores del sistema (compartido entre reglas)
+        voices_with_seventh = list(VoiceLeadingUtils.voices_by_factor(chord, root).get('7', ()))
         
         # 3. Si hay más de una voz con el factor '7' → Séptima duplicada
         if len(voices_with_seventh) > 1:
@@ -2313,12 +3076,6 @@ class DuplicatedSeventhRule(HarmonicRule):
             }
         
         return None
-    
-    def _calculate_confidence(self, chord1, chord2, context):
-        """
-        Duplicar la 7ª es un error inequívoco.
-        """
-        return 100  # Confianza máxima
 
 
 # =============================================================================
@@ -2348,6 +3105,12 @@ class ExcessiveMelodicMotionRule(HarmonicRule):
     Color: #FF8C00 (Dark Orange) - Tier 2
     """
     
+    __slots__ = ()
+    
+    # El salto excesivo es un error claro y cuantificable: confianza alta
+    # pero no máxima, por posibles excepciones estilísticas
+    CONFIDENCE = 90
+    
     # Umbral en semitonos: 12 = octava justa (P8)
     OCTAVE_SEMITONES = 12
     
@@ -2355,7 +3118,7 @@ class ExcessiveMelodicMotionRule(HarmonicRule):
         super().__init__(
             name='excessive_melodic_motion',
             tier=RuleTier.IMPORTANT,
-            color='#FF8C00',  # Dark Orange
+            color=_COLOR_DARK_ORANGE,
             short_msg='Salto melódico excesivo',
             full_msg='El movimiento melódico supera una octava. Los saltos mayores '
                      'a la 8ª dificultan la percepción de la línea melódica y son '
@@ -2374,32 +3137,53 @@ class ExcessiveMelodicMotionRule(HarmonicRule):
         Returns:
             Dict con la primera violación encontrada, o None
         """
+        notes1 = VoicedChord.from_dict(chord1)
+        notes2 = VoicedChord.from_dict(chord2)
+        return self._detect_leaps(notes1, _chord_ps_row(notes1), notes2, _chord_ps_row(notes2))
+    
+    def detect_batch(self, progression: ChordProgression) -> List[Optional[Dict]]:
+        """Detección por lotes sobre las columnas voices / voices_ps."""
+        voices, rows = progression.voices, progression.voices_ps
+        return [
+            self._detect_leaps(voices[t], rows[t], voices[t + 1], rows[t + 1])
+            for t in range(len(voices) - 1)
+        ]
+    
+    def _detect_leaps(
+        self,
+        notes1: VoicedChord,
+        row1: Tuple[Optional[float], ...],
+        notes2: VoicedChord,
+        row2: Tuple[Optional[float], ...]
+    ) -> Optional[Dict]:
+        """
+        Compara las filas de alturas (ps) de ambos acordes voz a voz.
+        
+        Args:
+            notes1, notes2: VoicedChord de cada acorde
+            row1, row2: sus filas _chord_ps_row (mismo orden S, A, T, B)
+        """
         voices_with_excessive_leap = []
         
-        for voice in ['S', 'A', 'T', 'B']:
-            note1 = chord1.get(voice)
-            note2 = chord2.get(voice)
+        for i, voice in enumerate(_SATB):
+            note1 = notes1[i]
+            note2 = notes2[i]
             
             # Ambas notas deben existir para analizar el movimiento
             if not note1 or not note2:
                 continue
             
-            try:
-                # Calcular intervalo en semitonos
-                p1 = music21.pitch.Pitch(note1)
-                p2 = music21.pitch.Pitch(note2)
-                
-                # Diferencia absoluta en semitonos (pitch space)
-                semitones = abs(p2.ps - p1.ps)
-                
-                # Si supera la octava justa (12 semitonos)
-                if semitones > self.OCTAVE_SEMITONES:
-                    voices_with_excessive_leap.append(voice)
-                    logger.debug(f"Salto excesivo en {voice}: {note1} → {note2} ({semitones} semitonos)")
-                    
-            except Exception as e:
-                logger.warning(f"Error calculando salto melódico en {voice}: {e}")
+            # Diferencia en semitonos (pitch space) desde las filas cacheadas
+            ps1, ps2 = row1[i], row2[i]
+            if ps1 is None or ps2 is None:
+                logger.warning("Error calculando salto melódico en %s: %s → %s", voice, note1, note2)
                 continue
+            semitones = abs(ps2 - ps1)
+            
+            # Si supera la octava justa (12 semitonos)
+            if semitones > self.OCTAVE_SEMITONES:
+                voices_with_excessive_leap.append(voice)
+                logger.debug("Salto excesivo en %s: %s → %s (%s semitonos)", voice, note1, note2, semitones)
         
         # Reportar la primera voz con salto excesivo
         if voices_with_excessive_leap:
@@ -2410,20 +3194,23 @@ class ExcessiveMelodicMotionRule(HarmonicRule):
             }
         
         return None
-    
-    def _calculate_confidence(self, chord1: Dict, chord2: Dict, context: Dict) -> int:
-        """
-        El salto excesivo es un error claro y cuantificable.
-        
-        Confianza alta pero no máxima: hay excepciones estilísticas.
-        """
-        return 90  # Alta confianza, pero no 100% por posibles excepciones estilísticas
 
 
 # =============================================================================
 # REGLA #14: OMISIÓN IMPROPIA DE FACTORES (IMPROPER OMISSION)
 # =============================================================================
 
+# tipo_especial (analizador_tonal) de acordes cromáticos exentos de la regla
+_TIPOS_CROMATICOS = frozenset({
+    '+6it', '+6fr', '+6al', 'N', 'dominante_secundaria', 'prestamo_menor'
+})
+
+# Bits de la máscara de intervalos desde la fundamental (_is_chromatic_chord)
+_IV_AUGMENTED_FOURTH = 1 << 6   # Tritono
+_IV_PERFECT_FIFTH = 1 << 7
+_IV_AUGMENTED_SIXTH = 1 << 10
+
+
 class ImproperOmissionRule(HarmonicRule):
     """
     Detecta omisión impropia de factores críticos en acordes.
@@ -2447,11 +3234,17 @@ class ImproperOmissionRule(HarmonicRule):
     Color: #FF8C00 (Dark Orange) - Tier 2
     """
     
+    __slots__ = ()
+    
+    # La omisión de factores es detectable con alta confianza,
+    # pero hay excepciones estilísticas (cadencias arcaicas)
+    CONFIDENCE = 85
+    
     def __init__(self):
         super().__init__(
             name='improper_omission',
             tier=RuleTier.IMPORTANT,
-            color='#FF8C00',  # Dark Orange
+            color=_COLOR_DARK_ORANGE,
             short_msg='Factor omitido',
             full_msg='El acorde omite un factor esencial. La tercera define la calidad '
                      'mayor/menor del acorde y no debe omitirse excepto en cadencias finales arcaicas.'
@@ -2463,7 +3256,7 @@ class ImproperOmissionRule(HarmonicRule):
         
         Proceso:
             1. Convertir dict a Chord object (chord_knowledge.py)
-            2. Usar get_missing_factors() para detectar omisiones
+            2. Usar missing_factors para detectar omisiones
             3. Filtrar: la 5ª puede omitirse, pero la 3ª no
             4. Reportar violación si falta la 3ª
         
@@ -2485,7 +3278,8 @@ class ImproperOmissionRule(HarmonicRule):
         
         return None
     
-    def _is_chromatic_chord(self, chord_obj) -> bool:
+    @staticmethod
+    def _is_chromatic_chord(chord_obj) -> bool:
         """
         Detecta si un acorde es cromático (como 6ª Aumentada).
         
@@ -2507,47 +3301,46 @@ class ImproperOmissionRule(HarmonicRule):
             6ª Aug Italiana: [0, 4, 10] → True (tiene 6ª Aug)
             V7: [0, 4, 7, 10] → False (no tiene tritono aislado)
         """
-        try:
-            # CRITICAL FIX: Validar que chord_obj y su root existan
-            # music21 no siempre puede identificar la raíz de acordes cromáticos
-            if not chord_obj:
-                return False
-            
-            # Si chord_obj.root es None, get_intervals_from_root() retornará []
-            # pero validamos explícitamente para evitar AttributeError
-            if not hasattr(chord_obj, 'root') or chord_obj.root is None:
-                logger.debug("Acorde sin raíz identificada, no se puede validar como cromático")
-                return False
-            
-            intervals = chord_obj.get_intervals_from_root()
-            
-            if not intervals:
-                return False  # No se pudo calcular
-            
-            # Intervalo de 6ª Aumentada = 10 semitonos
-            AUGMENTED_SIXTH = 10
-            
-            # 4ª Aumentada (tritono) = 6 semitonos
-            AUGMENTED_FOURTH = 6
-            
-            # Si contiene 6ª Aumentada, es claramente cromático
-            if AUGMENTED_SIXTH in intervals:
-                return True
-            
-            # Si contiene tritono Y tiene al menos 3 factores distintos,
-            # probablemente es acorde cromático (no V7 normal)
-            if AUGMENTED_FOURTH in intervals and len(intervals) >= 3:
-                # Verificar que NO sea simplemente un V7 diatónico
-                # V7 typical: [0, 4, 7, 10] (1, 3, 5, m7)
-                # 6ª Aug Francesa: [0, 2, 4, 10] (contiene 2ª, no 5ª)
-                if 7 not in intervals:  # No tiene 5ª justa
-                    return True  # Probablemente cromático
-            
+        # CRITICAL FIX: Validar que chord_obj y su root existan
+        # music21 no siempre puede identificar la raíz de acordes cromáticos
+        if not chord_obj:
             return False
-            
-        except Exception as e:
-            logger.debug(f"Error detectando acorde cromático: {e}")
+        
+        # Si chord_obj.root es None, intervals_from_root será ()
+        # pero validamos explícitamente para evitar AttributeError
+        if not hasattr(chord_obj, 'root') or chord_obj.root is None:
+            logger.debug("Acorde sin raíz identificada, no se puede validar como cromático")
+            return False
+        
+        # Única llamada que puede fallar: el análisis de intervalos de Chord
+        try:
+            intervals = chord_obj.intervals_from_root
+        except (AttributeError, ValueError) as e:
+            logger.debug("Error detectando acorde cromático: %s", e)
             return False
+        
+        if not intervals:
+            return False  # No se pudo calcular
+        
+        # Intervalos (0-11 semitonos, únicos) empaquetados en una máscara de 12 bits
+        mask = 0
+        for iv in intervals:
+            mask |= 1 << iv
+        
+        # Si contiene 6ª Aumentada, es claramente cromático
+        if mask & _IV_AUGMENTED_SIXTH:
+            return True
+        
+        # Si contiene tritono Y tiene al menos 3 factores distintos,
+        # probablemente es acorde cromático (no V7 normal)
+        if mask & _IV_AUGMENTED_FOURTH and len(intervals) >= 3:
+            # Verificar que NO sea simplemente un V7 diatónico
+            # V7 typical: [0, 4, 7, 10] (1, 3, 5, m7)
+            # 6ª Aug Francesa: [0, 2, 4, 10] (contiene 2ª, no 5ª)
+            if not mask & _IV_PERFECT_FIFTH:  # No tiene 5ª justa
+                return True  # Probablemente cromático
+        
+        return False
     
     def _check_chord_for_omissions(self, chord_dict: Dict, chord_index: int) -> Optional[Dict]:
         """
@@ -2567,42 +3360,47 @@ class ImproperOmissionRule(HarmonicRule):
         
         if tipo_especial:
             # Tipos cromáticos conocidos: +6it, +6fr, +6al, N (Napolitana)
-            acordes_cromaticos_validos = ['+6it', '+6fr', '+6al', 'N', 'dominante_secundaria', 'prestamo_menor']
-            
-            if tipo_especial in acordes_cromaticos_validos:
-                logger.debug(f"Acorde cromático detectado por tipo_especial='{tipo_especial}', exento de validación de omisión")
+            if tipo_especial in _TIPOS_CROMATICOS:
+                logger.debug("Acorde cromático detectado por tipo_especial='%s', exento de validación de omisión",
+                             tipo_especial)
                 return None  # Acorde cromático válido, no aplicar reglas
         
-        # ========== CONVERSIÓN A OBJETO CHORD ==========
-        chord_obj = _dict_to_chord_safe(chord_dict)
-        
         # ========== CLÁUSULA DE GUARDA #2: Detección de cromáticos por intervalos ==========
         # Si el acorde tiene intervalos cromáticos característicos (6ª Aug, etc.),
         # exentarlo aunque tipo_especial no esté presente (fallback robusto)
-        if chord_obj and self._is_chromatic_chord(chord_obj):
-            logger.debug(f"Acorde cromático detectado por intervalos, exento de validación")
+        if _is_chromatic_chord_dict(chord_dict):
+            logger.debug("Acorde cromático detectado por intervalos, exento de validación")
             return None  # Acorde cromático válido, no aplicar reglas de omisión
         
         # ========== VALIDACIÓN NORMAL: Acordes diatónicos ==========
+        # Si la calidad no declara un tipo de acorde conocido, chord_type sería
+        # None/unknown: ir directo al método legacy sin construir el Chord
+        if not _declares_chord_type(chord_dict):
+            return self._legacy_check_omissions(chord_dict, chord_index)
+        
+        # ========== CONVERSIÓN A OBJETO CHORD ==========
+        chord_obj = _dict_to_chord_safe(chord_dict)
+        
         # Si no se puede crear el objeto Chord O si chord_type es None/unknown,
         # usar método legacy que funciona solo con root + notas SATB
         if chord_obj is None or chord_obj.chord_type is None or chord_obj.chord_type == 'unknown':
             return self._legacy_check_omissions(chord_dict, chord_index)
         
         # Si tenemos chord_type válido, usar chord_knowledge
-        missing = chord_obj.get_missing_factors()
+        missing = chord_obj.missing_factors
         
         if not missing:
             return None  # Acorde completo
         
         # Filtrar: la 5ª puede omitirse (es tolerable)
-        critical_missing = [f for f in missing if f in ['3', '7']]
+        missing_third = '3' in missing
+        missing_seventh = '7' in missing
         
-        if not critical_missing:
+        if not (missing_third or missing_seventh):
             return None  # Solo falta la 5ª, que es aceptable
         
         # La 3ª es más crítica que la 7ª
-        if '3' in critical_missing:
+        if missing_third:
             # Omisión de 3ª: error crítico
             return {
                 'chord_index': chord_index,
@@ -2610,7 +3408,7 @@ class ImproperOmissionRule(HarmonicRule):
                 'missing_factor': '3',
                 'severity': 'critical'
             }
-        elif '7' in critical_missing:
+        elif missing_seventh:
             # Verificar si es un acorde de 7ª
             chord_quality = chord_dict.get('quality', '')
             if 'seventh' in chord_quality or chord_dict.get('degree', '').startswith('V'):
@@ -2628,21 +3426,15 @@ class ImproperOmissionRule(HarmonicRule):
         """
         Método fallback si chord_knowledge no está disponible.
         
-        Usa VoiceLeadingUtils.get_chord_factor() directamente.
+        Usa los factores de VoiceLeadingUtils.voices_by_factor().
         """
         root = chord_dict.get('root')
         if not root:
             return None  # Sin root no podemos analizar
         
         # Calcular factores de cada voz
-        factors_present = set()
-        
-        for voice in ['S', 'A', 'T', 'B']:
-            note = chord_dict.get(voice)
-            if note:
-                factor = VoiceLeadingUtils.get_chord_factor(note, root)
-                if factor != '?':
-                    factors_present.add(factor)
+        factors_present = set(VoiceLeadingUtils.voices_by_factor(chord_dict, root))
+        factors_present.discard('?')
         
         # Verificar si falta la 3ª
         if '3' not in factors_present:
@@ -2654,16 +3446,7 @@ class ImproperOmissionRule(HarmonicRule):
             }
         
         # Verificar si falta la 7ª en acordes de séptima
-        degree = chord_dict.get('degree', '')
-        quality = chord_dict.get('quality', '')
-        
-        is_seventh_chord = (
-            'V7' in degree or 
-            'vii°7' in degree or
-            'seventh' in quality.lower()
-        )
-        
-        if is_seventh_chord and '7' not in factors_present:
+        if _is_seventh_chord(chord_dict) and '7' not in factors_present:
             return {
                 'chord_index': chord_index,
                 'voices': ['?'],
@@ -2672,13 +3455,70 @@ class ImproperOmissionRule(HarmonicRule):
             }
         
         return None
+
+
+@lru_cache(maxsize=128)
+def _is_seventh_label(degree: str, quality: str) -> bool:
+    """¿Indican el grado o la calidad un acorde de séptima?"""
+    return (
+        'V7' in degree or
+        'vii°7' in degree or
+        'seventh' in quality.lower()
+    )
+
+
+def _is_seventh_chord(chord_dict: Dict) -> bool:
+    """Acorde de séptima según sus etiquetas 'degree' / 'quality'."""
+    degree = chord_dict.get('degree', '')
+    quality = chord_dict.get('quality', '')
+    try:
+        return _is_seventh_label(degree, quality)
+    except TypeError:
+        # Etiquetas no hashables: evaluar sin caché
+        return _is_seventh_label.__wrapped__(degree, quality)
+
+
+# Campos que determinan el Chord de _dict_to_chord_safe (clave de caché)
+_CHORD_FIELDS = ('root', 'quality', 'key', 'inversion', 'S', 'A', 'T', 'B')
+
+
+@lru_cache(maxsize=512)
+def _chromatic_chord_cached(chord_key: Tuple) -> bool:
+    """Caché de ImproperOmissionRule._is_chromatic_chord por contenido del acorde."""
+    chord_obj = _dict_to_chord_safe(dict(chord_key))
+    return bool(chord_obj) and ImproperOmissionRule._is_chromatic_chord(chord_obj)
+
+
+def _is_chromatic_chord_dict(chord_dict: Dict) -> bool:
+    """
+    ¿Es cromático el acorde? Memoizado por contenido: el mismo acorde llega
+    como chord2 de una transición y chord1 de la siguiente.
+    """
+    try:
+        return _chromatic_chord_cached(_context_key(chord_dict, _CHORD_FIELDS))
+    except TypeError:
+        # Campos no hashables: calcular sin caché
+        chord_obj = _dict_to_chord_safe(chord_dict)
+        return bool(chord_obj) and ImproperOmissionRule._is_chromatic_chord(chord_obj)
+
+
+def _declares_chord_type(chord_dict: Dict) -> bool:
+    """
+    ¿Daría la calidad del dict un chord_type conocido al construir el Chord?
     
-    def _calculate_confidence(self, chord1: Dict, chord2: Dict, context: Dict) -> int:
-        """
-        La omisión de factores es detectable con alta confianza,
-        pero hay excepciones estilísticas.
-        """
-        return 85  # Alta confianza, pero hay excepciones arcaicas
+    Permite saltar la construcción del Chord cuando solo se usaría el
+    método legacy (chord_type None o 'unknown').
+    """
+    quality = chord_dict.get('quality')
+    if not quality:
+        return False
+    try:
+        from chord_knowledge import QUALITY_TO_CHORD_TYPE
+        return bool(QUALITY_TO_CHORD_TYPE.get(quality))
+    except ImportError:
+        return False  # Sin chord_knowledge no hay Chord: método legacy
+    except TypeError:
+        return True  # Calidad no hashable: que decida _dict_to_chord_safe
 
 
 # NOTA: TritonResolutionRule fue ELIMINADA
@@ -2687,6 +3527,71 @@ class ImproperOmissionRule(HarmonicRule):
 # - SeventhResolutionRule: 7ª → grado conjunto descendente
 
 
+# Nombres de voz para los mensajes de app.py
+_VOICE_NAMES_ES = {
+    'S': 'Soprano',
+    'A': 'Contralto',
+    'T': 'Tenor',
+    'B': 'Bajo'
+}
+
+# Orden de voces de grave a agudo (convención pedagógica)
+_VOICE_ORDER = {'B': 0, 'T': 1, 'A': 2, 'S': 3}
+
+
+def _voice_order_key(voice: str) -> int:
+    """Clave de ordenación grave → agudo; voces desconocidas al final."""
+    return _VOICE_ORDER.get(voice, 999)
+
+
+def _format_error_for_app(error: Dict, tiempo_index: int) -> Dict:
+    """Un error del motor en el formato de app.py (ver RulesEngine.format_errors_for_app)."""
+    # CRITICAL FIX: Ajustar tiempo_index según chord_index
+    # chord_index=0 → error en chord1 (tiempo_index)
+    # chord_index=1 → error en chord2 (tiempo_index + 1)
+    actual_tiempo_index = tiempo_index + error.get('chord_index', 0)
+    
+    # Compás y tiempo dentro del compás (4 tiempos por compás)
+    compas_idx, tiempo_idx = divmod(actual_tiempo_index, 4)
+    
+    # Ordenar voces de grave a agudo (Bajo → Tenor → Alto → Soprano)
+    sorted_voices = sorted(error.get('voices', []), key=_voice_order_key)
+    
+    # Construir mensaje corto con voces ordenadas
+    short_msg = error['short_msg']
+    voces_str = '-'.join([_VOICE_NAMES_ES.get(v, v) for v in sorted_voices])
+    mensaje_corto = f"{short_msg} ({voces_str})" if voces_str else short_msg
+    
+    return {
+        'id': f"err-{actual_tiempo_index}",
+        'mensaje': f"Compás {compas_idx + 1}, T{tiempo_idx + 1}: {mensaje_corto}",
+        'mensaje_corto': mensaje_corto,
+        'tiempo_index': actual_tiempo_index,
+        'voces': sorted_voices,  # También ordenar en la lista de voces
+        'confidence': error.get('confidence', 100),
+        'color': error.get('color', _COLOR_RED),
+        'rule': error.get('rule', 'unknown')
+    }
+
+
+class ValidationResult(list):
+    """
+    Errores de una transición (lista, como antes) con índice por regla.
+    
+    by_rule agrupa los errores por su nombre de regla al construir el
+    resultado, así que consultar una regla concreta no recorre la lista:
+        errors = engine.validate_progression(chord1, chord2)
+        lt_errors = errors.by_rule.get('leading_tone_resolution', ())
+    El índice no se actualiza si se modifica la lista después.
+    """
+    
+    def __init__(self, errors=()):
+        super().__init__(errors)
+        self.by_rule: Dict[str, List[Dict]] = {}
+        for error in self:
+            self.by_rule.setdefault(error['rule'], []).append(error)
+
+
 class RulesEngine:
     """
     Motor principal que coordina todas las reglas armónicas.
@@ -2703,22 +3608,34 @@ class RulesEngine:
         errors = engine.validate_progression(chord1, chord2)
     """
     
-    def __init__(self, key: str = "C", mode: str = "major"):
+    def __init__(self, key: str = "C", mode: str = "major", fast_mode: bool = False):
         """
         Inicializa el motor de reglas.
         
         Args:
             key: Tonalidad ('C', 'D', 'Eb', etc.)
             mode: Modo ('major' o 'minor')
+            fast_mode: Si True, validate_progression evalúa primero las reglas
+                CRITICAL y omite las de tier inferior cuando alguna falla
+                (validación por lotes de partituras largas)
         """
         self.key = key
         self.mode = mode
+        self.fast_mode = fast_mode
         self.rules: List[HarmonicRule] = []
         
+        # Reglas habilitadas (orden de registro y orden por tier para
+        # fast_mode); se recalculan solo al registrar/habilitar/deshabilitar
+        self._enabled_rules: List[HarmonicRule] = []
+        self._enabled_rules_by_tier: List[HarmonicRule] = []
+        
+        # Motor congelado (ver freeze): no admite cambios en sus reglas
+        self._frozen = False
+        
         # Registrar reglas Tier 1 por defecto
         self._register_default_rules()
         
-        logger.info(f"RulesEngine inicializado en {key} {mode}")
+        logger.info("RulesEngine inicializado en %s %s", key, mode)
     
     def _register_default_rules(self):
         """Registra las reglas Tier 1 por defecto"""
@@ -2768,24 +3685,53 @@ class RulesEngine:
         Args:
             rule: Instancia de una regla armónica
         """
+        self._check_not_frozen()
         self.rules.append(rule)
-        logger.info(f"Regla '{rule.name}' registrada (Tier {rule.tier.value})")
+        self._rebuild_enabled()
+        logger.info("Regla '%s' registrada (Tier %s)", rule.name, rule.tier.value)
+    
+    def freeze(self):
+        """
+        Impide registrar, habilitar o deshabilitar reglas a partir de ahora.
+        
+        Para motores compartidos (get_engine): un cambio hecho por una
+        petición afectaría a todas las demás de la misma tonalidad.
+        """
+        self._frozen = True
+    
+    def _check_not_frozen(self):
+        """RuntimeError si el motor está congelado"""
+        if self._frozen:
+            raise RuntimeError(
+                "Motor de reglas compartido (get_engine): no se pueden cambiar "
+                "sus reglas; crear un RulesEngine propio"
+            )
+    
+    def _rebuild_enabled(self):
+        """Recalcula las listas de reglas habilitadas tras un cambio de estado"""
+        self._enabled_rules = [r for r in self.rules if r.enabled]
+        # Orden estable por tier: CRITICAL → IMPORTANT → ADVANCED
+        self._enabled_rules_by_tier = sorted(self._enabled_rules, key=lambda r: r.tier.value)
     
     def validate_progression(
         self,
         chord1: Dict,
         chord2: Dict,
         context: Optional[Dict] = None
-    ) -> List[Dict]:
+    ) -> ValidationResult:
         """
         Valida una progresión de dos acordes contra todas las reglas.
         
+        En fast_mode las reglas se recorren por tier (CRITICAL primero) y,
+        si alguna CRITICAL detecta error, no se evalúan las de tier inferior.
+        
         Args:
             chord1, chord2: Análisis de acordes
             context: Contexto armónico adicional
             
         Returns:
-            Lista de errores encontrados (puede estar vacía)
+            ValidationResult: lista de errores encontrados (puede estar
+            vacía), con los errores agrupados por regla en by_rule
         """
         if context is None:
             context = {}
@@ -2796,33 +3742,120 @@ class RulesEngine:
         
         errors = []
         
-        for rule in self.rules:
-            if not rule.enabled:
+        # Una sola pasada para las reglas de quintas/octavas: si la transición
+        # no tiene ninguna violación candidata, no se despachan esas reglas
+        motion_violations = ParallelMotionDetector.detect_all(chord1, chord2)
+        
+        rules = self._enabled_rules_by_tier if self.fast_mode else self._enabled_rules
+        critical_seen = False
+        
+        for rule in rules:
+            if critical_seen and rule.tier is not RuleTier.CRITICAL:
+                break  # fast_mode: el resto de reglas es de tier inferior
+            
+            if rule.USES_MOTION_DETECTOR and rule.name not in motion_violations:
                 continue
             
             error = rule.validate(chord1, chord2, context)
             if error:
                 errors.append(error)
+                if self.fast_mode and rule.tier is RuleTier.CRITICAL:
+                    critical_seen = True
+        
+        return ValidationResult(errors)
+    
+    def validate_progression_batch(
+        self,
+        chords: List[Dict],
+        context: Optional[Dict] = None
+    ) -> List[ValidationResult]:
+        """
+        Valida todas las transiciones de una progresión en una sola llamada.
+        
+        El contexto se prepara una vez para toda la pieza en lugar de en
+        cada par, y la tonalidad se inyecta en cada acorde una sola vez.
+        La detección va por columnas: los acordes se leen una vez en una
+        ChordProgression y cada regla recorre la progresión completa con
+        detect_batch; después, por transición, se aplican excepciones y
+        confianza (HarmonicRule._confirm_violation) en el mismo orden y con
+        el mismo corte de fast_mode que validate_progression.
+        
+        Args:
+            chords: Acordes de la progresión, en orden
+            context: Contexto armónico común a toda la progresión
+            
+        Returns:
+            Lista de len(chords) - 1 elementos: errores de cada transición t → t+1
+        """
+        context = dict(context) if context else {}
+        if 'key' not in context:
+            context['key'] = f"{self.key} {self.mode}"
+        
+        # Cada acorde se copia como mucho una vez, no por regla y transición
+        key = context['key']
+        chords = [chord if 'key' in chord else {**chord, 'key': key} for chord in chords]
         
-        return errors
+        rules = self._enabled_rules_by_tier if self.fast_mode else self._enabled_rules
+        progression = ChordProgression.from_dicts(chords)
+        detected = [rule.detect_batch(progression) for rule in rules]
+        
+        results = []
+        for t in range(len(chords) - 1):
+            chord1, chord2 = chords[t], chords[t + 1]
+            errors = []
+            critical_seen = False
+            
+            for rule, violations in zip(rules, detected):
+                if critical_seen and rule.tier is not RuleTier.CRITICAL:
+                    break  # fast_mode: el resto de reglas es de tier inferior
+                
+                error = rule._confirm_violation(chord1, chord2, context, violations[t])
+                if error:
+                    errors.append(error)
+                    if self.fast_mode and rule.tier is RuleTier.CRITICAL:
+                        critical_seen = True
+            
+            results.append(ValidationResult(errors))
+        
+        return results
     
     def enable_rule(self, rule_name: str):
         """Habilita una regla específica"""
+        self._check_not_frozen()
         for rule in self.rules:
             if rule.name == rule_name:
                 rule.enabled = True
-                logger.info(f"Regla '{rule_name}' habilitada")
+                self._rebuild_enabled()
+                logger.info("Regla '%s' habilitada", rule_name)
                 return
-        logger.warning(f"Regla '{rule_name}' no encontrada")
+        logger.warning("Regla '%s' no encontrada", rule_name)
     
     def disable_rule(self, rule_name: str):
         """Deshabilita una regla específica"""
+        self._check_not_frozen()
         for rule in self.rules:
             if rule.name == rule_name:
                 rule.enabled = False
-                logger.info(f"Regla '{rule_name}' deshabilitada")
+                self._rebuild_enabled()
+                logger.info("Regla '%s' deshabilitada", rule_name)
                 return
-        logger.warning(f"Regla '{rule_name}' no encontrada")
+        logger.warning("Regla '%s' no encontrada", rule_name)
+    
+    def enable_only(self, rule_name: str):
+        """
+        Deja habilitada solo la regla indicada (útil para tests de una regla).
+        
+        Equivale a deshabilitar todas las demás, pero recalcula las reglas
+        habilitadas una sola vez.
+        """
+        self._check_not_frozen()
+        if not any(rule.name == rule_name for rule in self.rules):
+            logger.warning("Regla '%s' no encontrada", rule_name)
+            return
+        for rule in self.rules:
+            rule.enabled = rule.name == rule_name
+        self._rebuild_enabled()
+        logger.info("Solo la regla '%s' habilitada", rule_name)
     
     def get_active_rules(self, tier: Optional[RuleTier] = None) -> List[HarmonicRule]:
         """
@@ -2867,53 +3900,22 @@ class RulesEngine:
         Returns:
             Lista de errores formateados para app.py
         """
-        formatted = []
-        
-        nombres_voces = {
-            'S': 'Soprano',
-            'A': 'Contralto',
-            'T': 'Tenor',
-            'B': 'Bajo'
-        }
-        
-        # Orden de voces de grave a agudo (convención pedagógica)
-        voice_order = {'B': 0, 'T': 1, 'A': 2, 'S': 3}
-        
-        for error in errors:
-            # CRITICAL FIX: Ajustar tiempo_index según chord_index
-            # chord_index=0 → error en chord1 (tiempo_index)
-            # chord_index=1 → error en chord2 (tiempo_index + 1)
-            chord_idx = error.get('chord_index', 0)
-            actual_tiempo_index = tiempo_index + chord_idx
-            
-            # Calcular tiempo dentro del compás
-            t_compas = (actual_tiempo_index % 4) + 1
-            actual_compas = (actual_tiempo_index // 4) + 1
-            
-            # Ordenar voces de grave a agudo (Bajo → Tenor → Alto → Soprano)
-            voices = error.get('voices', [])
-            sorted_voices = sorted(voices, key=lambda v: voice_order.get(v, 999))
-            
-            # Construir descripción de voces en orden correcto
-            voces_str = '-'.join([nombres_voces.get(v, v) for v in sorted_voices])
-            
-            # Construir mensaje corto con voces ordenadas
-            mensaje_corto = error['short_msg']
-            if voces_str:
-                mensaje_corto = f"{error['short_msg']} ({voces_str})"
-            
-            formatted.append({
-                'id': f"err-{actual_tiempo_index}",
-                'mensaje': f"Compás {actual_compas}, T{t_compas}: {mensaje_corto}",
-                'mensaje_corto': mensaje_corto,
-                'tiempo_index': actual_tiempo_index,
-                'voces': sorted_voices,  # También ordenar en la lista de voces
-                'confidence': error.get('confidence', 100),
-                'color': error.get('color', '#FF0000'),
-                'rule': error.get('rule', 'unknown')
-            })
-        
-        return formatted
+        return [_format_error_for_app(error, tiempo_index) for error in errors]
+
+
+@lru_cache(maxsize=48)
+def get_engine(key: str = "C", mode: str = "major") -> RulesEngine:
+    """
+    Motor de reglas compartido por (tonalidad, modo).
+    
+    Las reglas no guardan estado entre validaciones, así que las peticiones
+    y tests en la misma tonalidad reutilizan un único motor en lugar de
+    registrar de nuevo todas las reglas. El motor está congelado (freeze):
+    para habilitar/deshabilitar reglas crear un RulesEngine propio.
+    """
+    engine = RulesEngine(key=key, mode=mode)
+    engine.freeze()
+    return engine
 
 
 # =============================================================================
@@ -2951,6 +3953,33 @@ if __name__ == "__main__":
             print(f"    Mensaje: {error['full_msg']}")
     else:
         print("\n✅ No se encontraron errores")
+    
+    # Benchmark en régimen estable (cachés calientes): ns por par de acordes.
+    # Con --profile se ejecuta además bajo cProfile para localizar hot-spots.
+    import sys
+    import time
+    
+    logging.getLogger().setLevel(logging.WARNING)  # Sin logs en el bucle medido
+    N = 1000
+    
+    def _bench():
+        for _ in range(N):
+            engine.validate_progression(chord1, chord2)
+    
+    for _ in range(10):  # Calentamiento
+        engine.validate_progression(chord1, chord2)
+    
+    t0 = time.perf_counter_ns()
+    _bench()
+    dt = (time.perf_counter_ns() - t0) / N
+    print(f"\n⏱️  validate_progression: {dt:.0f} ns/pair ({N} iteraciones)")
+    
+    if '--profile' in sys.argv:
+        import cProfile
+        import pstats
+        profiler = cProfile.Profile()
+        profiler.runcall(_bench)
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(20)
 # =============================================================================
 # REGLA #8: CRUZAMIENTO DE VOCES (VOICE CROSSING)
 # =============================================================================
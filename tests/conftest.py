@@ -0,0 +1,24 @@
+"""
+Configuración de pytest para tests/.
+
+Añade la raíz del repositorio al path para importar harmonic_rules y
+chord_knowledge sin depender del directorio de trabajo desde el que se
+lance pytest, y define las fixtures compartidas por los tests.
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+
+@pytest.fixture(scope='session')
+def c_engine():
+    """Motor de reglas en Do Mayor propio de los tests, construido una vez por sesión."""
+    from harmonic_rules import RulesEngine
+    return RulesEngine(key='C', mode='major')
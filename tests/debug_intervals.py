@@ -2,50 +2,78 @@
 Debug script para analizar intervalos exactos en test cases fallidos
 """
 
-import music21
+from functools import lru_cache
 
-# Test case pf_004 y pf_005 (son idénticos)
-chord1 = {'S': 'G4', 'A': 'E4', 'T': 'C4', 'B': 'C3'}
-chord2 = {'S': 'F4', 'A': 'C4', 'T': 'A3', 'B': 'F3'}
 
-voice_pairs = [('S', 'A'), ('S', 'T'), ('S', 'B'), ('A', 'T'), ('A', 'B'), ('T', 'B')]
+@lru_cache(maxsize=None)
+def _pitch(name):
+    """Pitch de music21 por nombre de nota (se parsea una sola vez)"""
+    import music21  # Diferido: solo se carga al ejecutar el script
+    return music21.pitch.Pitch(name)
 
-print("=" * 80)
-print("DEBUG: Intervalos Calculados en Test pf_004/pf_005")
-print("=" * 80)
-print()
 
-for v1, v2 in voice_pairs:
-    # Chord 1
-    p1_1 = music21.pitch.Pitch(chord1[v1])
-    p1_2 = music21.pitch.Pitch(chord1[v2])
-    int1 = music21.interval.Interval(p1_1, p1_2)
-    
-    # Chord 2
-    p2_1 = music21.pitch.Pitch(chord2[v1])
-    p2_2 = music21.pitch.Pitch(chord2[v2])
-    int2 = music21.interval.Interval(p2_1, p2_2)
+@lru_cache(maxsize=None)
+def _interval(name1, name2):
+    """Intervalo de music21 entre dos nombres de nota (cacheado)"""
+    import music21
+    return music21.interval.Interval(_pitch(name1), _pitch(name2))
+
+
+def is_fifth(semitones):
+    normalized = abs(semitones) % 12
+    return normalized == 7 or normalized == 8
+
+
+def main():
+    """Imprime los intervalos de cada par de voces en pf_004/pf_005"""
+    # Test case pf_004 y pf_005 (son idénticos)
+    chord1 = {'S': 'G4', 'A': 'E4', 'T': 'C4', 'B': 'C3'}
+    chord2 = {'S': 'F4', 'A': 'C4', 'T': 'A3', 'B': 'F3'}
     
-    print(f"Par de voces: {v1}-{v2}")
-    print(f"  Chord1: {chord1[v1]} - {chord1[v2]}")
-    print(f"    Intervalo: {int1.name} ({int1.semitones} semitonos)")
-    print(f"    Dirección: {int1.direction}")
+    VOICES = ('S', 'A', 'T', 'B')
     
-    print(f"  Chord2: {chord2[v1]} - {chord2[v2]}")
-    print(f"    Intervalo: {int2.name} ({int2.semitones} semitonos)")
-    print(f"    Dirección: {int2.direction}")
+    # Pares de voces como índices en las tuplas (S, A, T, B)
+    voice_pairs = ((0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3))
     
-    # Verificar si son quintas
-    def is_fifth(semitones):
-        normalized = abs(semitones) % 12
-        return normalized == 7 or normalized == 8
+    # Acordes como tuplas en orden SATB
+    c1 = tuple(chord1[v] for v in VOICES)
+    c2 = tuple(chord2[v] for v in VOICES)
     
-    is_fifth_1 = is_fifth(int1.semitones)
-    is_fifth_2 = is_fifth(int2.semitones)
+    print("=" * 80)
+    print("DEBUG: Intervalos Calculados en Test pf_004/pf_005")
+    print("=" * 80)
+    print()
     
-    if is_fifth_1 and is_fifth_2:
-        print(f"  ⚠️  AMBOS SON QUINTAS → Posible error detectado")
+    for i, j in voice_pairs:
+        n1a, n1b = c1[i], c1[j]
+        n2a, n2b = c2[i], c2[j]
+        
+        # Chord 1
+        int1 = _interval(n1a, n1b)
+        
+        # Chord 2
+        int2 = _interval(n2a, n2b)
+        
+        print(f"Par de voces: {VOICES[i]}-{VOICES[j]}")
+        print(f"  Chord1: {n1a} - {n1b}")
+        print(f"    Intervalo: {int1.name} ({int1.semitones} semitonos)")
+        print(f"    Dirección: {int1.direction}")
+        
+        print(f"  Chord2: {n2a} - {n2b}")
+        print(f"    Intervalo: {int2.name} ({int2.semitones} semitonos)")
+        print(f"    Dirección: {int2.direction}")
+        
+        # Verificar si son quintas
+        is_fifth_1 = is_fifth(int1.semitones)
+        is_fifth_2 = is_fifth(int2.semitones)
+        
+        if is_fifth_1 and is_fifth_2:
+            print(f"  ⚠️  AMBOS SON QUINTAS → Posible error detectado")
+        
+        print()
     
-    print()
+    print("=" * 80)
+
 
-print("=" * 80)
+if __name__ == "__main__":
+    main()
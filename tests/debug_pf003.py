@@ -2,65 +2,100 @@
 Debug específico para test pf_003: Quintas contrarias S-B
 """
 
-import music21
-
-# Test case pf_003
-chord1 = {'S': 'G5', 'A': 'E5', 'T': 'C5', 'B': 'C3'}
-chord2 = {'S': 'F5', 'A': 'D5', 'T': 'A4', 'B': 'D3'}
-
-print("=" * 80)
-print("DEBUG: Test pf_003 - Quintas contrarias S-B")
-print("=" * 80)
-print()
-
-# Analizar intervalo S-B
-print("Par de voces: S-B")
-print(f"  Chord1: {chord1['S']} - {chord1['B']}")
-
-p1_s = music21.pitch.Pitch(chord1['S'])
-p1_b = music21.pitch.Pitch(chord1['B'])
-int1 = music21.interval.Interval(p1_s, p1_b)
-
-print(f"    Intervalo: {int1.name} ({int1.semitones} semitonos)")
-print(f"    Simple name: {int1.simpleName}")
-print(f"    Direction: {int1.direction}")
-print()
-
-print(f"  Chord2: {chord2['S']} - {chord2['B']}")
-
-p2_s = music21.pitch.Pitch(chord2['S'])
-p2_b = music21.pitch.Pitch(chord2['B'])
-int2 = music21.interval.Interval(p2_s, p2_b)
-
-print(f"    Intervalo: {int2.name} ({int2.semitones} semitonos)")
-print(f"    Simple name: {int2.simpleName}")
-print(f"    Direction: {int2.direction}")
-print()
-
-# Verificar si son quintas
-print("Verificación:")
-print(f"  ¿Chord1 S-B es quinta? simpleName={int1.simpleName} → {int1.simpleName in ['P5', 'A5']}")
-print(f"  ¿Chord2 S-B es quinta? simpleName={int2.simpleName} → {int2.simpleName in ['P5', 'A5']}")
-print()
-
-# Tipo de movimiento
-dir_s = p2_s.ps - p1_s.ps
-dir_b = p2_b.ps - p1_b.ps
-
-print(f"Movimiento:")
-print(f"  S: {chord1['S']} → {chord2['S']} (diferencia: {dir_s})")
-print(f"  B: {chord1['B']} → {chord2['B']} (diferencia: {dir_b})")
-
-if dir_s == 0 and dir_b == 0:
-    motion = 'static'
-elif dir_s == 0 or dir_b == 0:
-    motion = 'oblique'
-elif (dir_s > 0 and dir_b > 0) or (dir_s < 0 and dir_b < 0):
-    motion = 'parallel'
-else:
-    motion = 'contrary'
-
-print(f"  Tipo de movimiento: {motion}")
-print()
-
-print("=" * 80)
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _pitch(name):
+    """Pitch de music21 por nombre de nota (se parsea una sola vez)"""
+    import music21  # Diferido: solo se carga al ejecutar el script
+    return music21.pitch.Pitch(name)
+
+
+@lru_cache(maxsize=None)
+def _interval(name1, name2):
+    """Intervalo de music21 entre dos nombres de nota (cacheado)"""
+    import music21
+    return music21.interval.Interval(_pitch(name1), _pitch(name2))
+
+
+# Semitono de cada letra y alteraciones (notación music21: '#' sostenido, '-' bemol)
+_STEP = {'C': 0, 'D': 2, 'E': 4, 'F': 5, 'G': 7, 'A': 9, 'B': 11}
+_ALTER = {'#': 1, '-': -1}
+
+
+def _midi(name):
+    """Número MIDI de un nombre de nota ('G5' → 79) sin construir un Pitch"""
+    accidentals = name[1:].rstrip('0123456789')
+    octave = int(name[1 + len(accidentals):])
+    return 12 * (octave + 1) + _STEP[name[0].upper()] + sum(_ALTER.get(c, 0) for c in accidentals)
+
+
+# Tipo de movimiento por signo de cada voz: _MOTION[signo_1 + 1][signo_2 + 1]
+_MOTION = (
+    ('parallel', 'oblique', 'contrary'),   # voz 1 desciende
+    ('oblique', 'static', 'oblique'),      # voz 1 estática
+    ('contrary', 'oblique', 'parallel'),   # voz 1 asciende
+)
+
+
+def _sign(x):
+    """-1, 0 o 1 según el signo de x"""
+    return (x > 0) - (x < 0)
+
+
+def main():
+    """Imprime el análisis S-B del test pf_003"""
+    # Test case pf_003
+    chord1 = {'S': 'G5', 'A': 'E5', 'T': 'C5', 'B': 'C3'}
+    chord2 = {'S': 'F5', 'A': 'D5', 'T': 'A4', 'B': 'D3'}
+    
+    print("=" * 80)
+    print("DEBUG: Test pf_003 - Quintas contrarias S-B")
+    print("=" * 80)
+    print()
+    
+    # Analizar intervalo S-B
+    print("Par de voces: S-B")
+    print(f"  Chord1: {chord1['S']} - {chord1['B']}")
+    
+    int1 = _interval(chord1['S'], chord1['B'])
+    
+    print(f"    Intervalo: {int1.name} ({int1.semitones} semitonos)")
+    print(f"    Simple name: {int1.simpleName}")
+    print(f"    Direction: {int1.direction}")
+    print()
+    
+    print(f"  Chord2: {chord2['S']} - {chord2['B']}")
+    
+    int2 = _interval(chord2['S'], chord2['B'])
+    
+    print(f"    Intervalo: {int2.name} ({int2.semitones} semitonos)")
+    print(f"    Simple name: {int2.simpleName}")
+    print(f"    Direction: {int2.direction}")
+    print()
+    
+    # Verificar si son quintas
+    print("Verificación:")
+    print(f"  ¿Chord1 S-B es quinta? simpleName={int1.simpleName} → {int1.simpleName in ['P5', 'A5']}")
+    print(f"  ¿Chord2 S-B es quinta? simpleName={int2.simpleName} → {int2.simpleName in ['P5', 'A5']}")
+    print()
+    
+    # Tipo de movimiento
+    dir_s = _midi(chord2['S']) - _midi(chord1['S'])
+    dir_b = _midi(chord2['B']) - _midi(chord1['B'])
+    
+    print(f"Movimiento:")
+    print(f"  S: {chord1['S']} → {chord2['S']} (diferencia: {dir_s})")
+    print(f"  B: {chord1['B']} → {chord2['B']} (diferencia: {dir_b})")
+    
+    motion = _MOTION[_sign(dir_s) + 1][_sign(dir_b) + 1]
+    
+    print(f"  Tipo de movimiento: {motion}")
+    print()
+    
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
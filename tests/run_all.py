@@ -0,0 +1,84 @@
+"""
+Ejecuta todos los test runners (run_*.py) en paralelo.
+
+Cada runner es independiente y se lanza en su propio proceso, así que
+se reparten entre los núcleos disponibles. La salida de cada runner se
+muestra completa y en orden al terminar, seguida de un resumen.
+
+Uso:
+    python tests/run_all.py [--workers N]
+"""
+
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from runner_common import FAIL
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(TESTS_DIR)
+
+# (runner, directorio de trabajo): cada runner abre sus JSON con rutas
+# relativas a la raíz del repo ('tests/...') o a tests/
+RUNNERS = (
+    ('run_tests.py', ROOT_DIR),
+    ('run_direct_fifths_tests.py', ROOT_DIR),
+    ('run_leading_tone_tests.py', ROOT_DIR),
+    ('run_lt_falling_fifth.py', ROOT_DIR),
+    ('run_lt_quality.py', ROOT_DIR),
+    ('run_lt_sec_tests.py', ROOT_DIR),
+    ('run_repro_real.py', ROOT_DIR),
+    ('run_seventh_resolution_tests.py', ROOT_DIR),
+    ('run_duplicated_leading_tone_tests.py', TESTS_DIR),
+    ('run_lt_iii7_fix_test.py', TESTS_DIR),
+    ('run_maximum_distance_tests.py', TESTS_DIR),
+    ('run_voice_crossing_tests.py', TESTS_DIR),
+    ('run_voice_overlap_tests.py', TESTS_DIR),
+)
+
+
+def _run_runner(runner, cwd):
+    """Ejecuta un runner en un proceso aparte y retorna (código, salida)"""
+    env = dict(os.environ)
+    # Raíz del repo en el path para 'from harmonic_rules import ...'
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, (ROOT_DIR, env.get('PYTHONPATH'))))
+    result = subprocess.run(
+        [sys.executable, os.path.join(TESTS_DIR, runner)],
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True
+    )
+    return result.returncode, result.stdout
+
+
+def run_all(workers=None):
+    """Lanza todos los runners en paralelo; retorna 0 si todos terminan bien"""
+    # Los hilos solo esperan a los subprocesos: el trabajo se reparte entre procesos
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        results = list(executor.map(lambda entry: _run_runner(*entry), RUNNERS))
+
+    for (runner, _), (code, output) in zip(RUNNERS, results):
+        print("#" * 80)
+        print(f"# {runner} (código de salida {code})")
+        print("#" * 80)
+        print(output)
+
+    failed = [runner for (runner, _), (code, _) in zip(RUNNERS, results) if code != 0]
+
+    print("=" * 80)
+    print(f"RUNNERS: {len(RUNNERS) - len(failed)}/{len(RUNNERS)} terminaron sin errores")
+    for runner in failed:
+        print(f"  {FAIL} {runner}")
+    print("=" * 80)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    workers = None
+    if '--workers' in sys.argv:
+        workers = int(sys.argv[sys.argv.index('--workers') + 1])
+    sys.exit(run_all(workers))
@@ -8,10 +8,13 @@ import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from harmonic_rules import DirectFifthsRule
+from runner_common import FAIL, PASS, norm_voices
+
 
 def run_direct_fifths_tests():
     """Ejecuta los tests de DirectFifthsRule"""
+    # Import diferido: music21 (vía harmonic_rules) solo se carga al ejecutar
+    from harmonic_rules import DirectFifthsRule
     
     # Cargar tests
     with open('tests/test_direct_fifths.json', 'r', encoding='utf-8') as f:
@@ -42,30 +45,30 @@ def run_direct_fifths_tests():
         if expected == "ERROR":
             if violation:
                 # Verificar voces afectadas
-                expected_voices = set(test.get('voices_affected', []))
-                actual_voices = set(violation['voices'])
+                expected_voices = norm_voices(test.get('voices_affected', []))
+                actual_voices = norm_voices(violation['voices'])
                 
                 if expected_voices == actual_voices:
-                    print(f"✅ PASS [{test_id}] {test_name}")
+                    print(f"{PASS} PASS [{test_id}] {test_name}")
                     print(f"         Detectado correctamente en voces {violation['voices']}")
                     passed += 1
                 else:
-                    print(f"❌ FAIL [{test_id}] {test_name}")
+                    print(f"{FAIL} FAIL [{test_id}] {test_name}")
                     print(f"         Voces esperadas: {expected_voices}")
                     print(f"         Voces detectadas: {actual_voices}")
                     failed += 1
             else:
-                print(f"❌ FAIL [{test_id}] {test_name}")
+                print(f"{FAIL} FAIL [{test_id}] {test_name}")
                 print(f"         Esperado: ERROR, Obtenido: OK")
                 failed += 1
         
         elif expected == "OK" or expected == "OK_FOR_DF":
             if violation:
-                print(f"❌ FAIL [{test_id}] {test_name}")
+                print(f"{FAIL} FAIL [{test_id}] {test_name}")
                 print(f"         Esperado: OK, Obtenido: ERROR en {violation['voices']}")
                 failed += 1
             else:
-                print(f"✅ PASS [{test_id}] {test_name}")
+                print(f"{PASS} PASS [{test_id}] {test_name}")
                 if test.get('notes'):
                     print(f"         {test['notes']}")
                 passed += 1
@@ -78,10 +81,10 @@ def run_direct_fifths_tests():
     print()
     
     if failed == 0:
-        print("✅ Todos los tests pasaron correctamente")
+        print(f"{PASS} Todos los tests pasaron correctamente")
         return 0
     else:
-        print(f"❌ {failed} tests fallaron")
+        print(f"{FAIL} {failed} tests fallaron")
         return 1
 
 if __name__ == "__main__":
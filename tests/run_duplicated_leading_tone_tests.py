@@ -6,10 +6,13 @@ import json
 import sys
 sys.path.insert(0, '..')
 
-from harmonic_rules import RulesEngine
+from runner_common import FAIL, PASS, norm_voices
+
 
 def run_duplicated_leading_tone_tests():
     """Ejecuta tests de DuplicatedLeadingToneRule"""
+    # Import diferido: music21 (vía harmonic_rules) solo se carga al ejecutar
+    from harmonic_rules import RulesEngine
     
     with open('test_duplicated_leading_tone.json', 'r') as f:
         test_cases = json.load(f)
@@ -21,42 +24,40 @@ def run_duplicated_leading_tone_tests():
     passed = 0
     failed = 0
     
+    # Crear engine una sola vez (las reglas no guardan estado entre pares)
+    engine = RulesEngine(key='C', mode='major')
+    
+    # Solo duplicated_leading_tone
+    engine.enable_only('duplicated_leading_tone')
+    
     for test in test_cases:
         print(f"Test {test['id']}: {test['name']}")
         print(f"  Descripción: {test['description']}")
         
-        # Crear engine
-        engine = RulesEngine(key='C', mode='major')
-        
-        # Solo duplicated_leading_tone
-        for rule in engine.rules:
-            if rule.name != 'duplicated_leading_tone':
-                engine.disable_rule(rule.name)
-        
         # Validar
         errors = engine.validate_progression(test['chord1'], test['chord2'])
         dlt_errors = [e for e in errors if e['rule'] == 'duplicated_leading_tone']
         
         if test['expected'] == 'ERROR':
             if len(dlt_errors) > 0:
-                voices_detected = set(dlt_errors[0]['voices'])
-                voices_expected = set(test['voices_affected'])
+                voices_detected = norm_voices(dlt_errors[0]['voices'])
+                voices_expected = norm_voices(test['voices_affected'])
                 
                 if voices_detected == voices_expected:
-                    print(f"  ✅ PASADO - Duplicación detectada en {sorted(list(voices_detected))}")
+                    print(f"  {PASS} PASADO - Duplicación detectada en {list(voices_detected)}")
                     passed += 1
                 else:
-                    print(f"  ❌ FALLIDO - Voces incorrectas: esperaba {voices_expected}, obtuvo {voices_detected}")
+                    print(f"  {FAIL} FALLIDO - Voces incorrectas: esperaba {voices_expected}, obtuvo {voices_detected}")
                     failed += 1
             else:
-                print(f"  ❌ FALLIDO - Debería detectar sensible duplicada")
+                print(f"  {FAIL} FALLIDO - Debería detectar sensible duplicada")
                 failed += 1
         else:  # expected == 'OK'
             if len(dlt_errors) == 0:
-                print(f"  ✅ PASADO - Sin duplicación detectada")
+                print(f"  {PASS} PASADO - Sin duplicación detectada")
                 passed += 1
             else:
-                print(f"  ❌ FALLIDO - No debería detectar error: {dlt_errors[0]}")
+                print(f"  {FAIL} FALLIDO - No debería detectar error: {dlt_errors[0]}")
                 failed += 1
         
         print()
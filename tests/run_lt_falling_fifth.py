@@ -1,10 +1,12 @@
 import json
 import logging
-from harmonic_rules import LeadingToneResolutionRule
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 
 def run_tests():
+    # Import diferido: music21 (vía harmonic_rules) solo se carga al ejecutar
+    from harmonic_rules import LeadingToneResolutionRule
+    
     print("==================================================")
     print(" EJECUTANDO TESTS: CAÍDA DE 5TA (V7/ii -> ii)")
     print("==================================================")
@@ -1,12 +1,17 @@
 import json
 import logging
-from harmonic_rules import LeadingToneResolutionRule
+
+from runner_common import FAIL, PASS
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
+
 def run_tests():
+    # Import diferido: music21 (vía harmonic_rules) solo se carga al ejecutar
+    from harmonic_rules import LeadingToneResolutionRule
+    
     print("==================================================")
     print("EJECUTANDO TESTS: Sensible Secundaria")
     print("==================================================")
@@ -31,10 +36,10 @@ def run_tests():
         result_status = "ERROR" if violation else "OK"
         
         if result_status == expected:
-            print("✅ PASS")
+            print(f"{PASS} PASS")
             passed += 1
         else:
-            print(f"❌ FAIL (Esperado: {expected}, Obtenido: {result_status})")
+            print(f"{FAIL} FAIL (Esperado: {expected}, Obtenido: {result_status})")
             if violation:
                 print(f"   Detalle: {violation}")
 
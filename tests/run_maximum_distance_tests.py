@@ -6,10 +6,13 @@ import json
 import sys
 sys.path.insert(0, '..')
 
-from harmonic_rules import RulesEngine, MaximumDistanceRule
+from runner_common import FAIL, PASS, norm_voices
+
 
 def run_maximum_distance_tests():
     """Ejecuta tests de MaximumDistanceRule"""
+    # Import diferido: music21 (vía harmonic_rules) solo se carga al ejecutar
+    from harmonic_rules import RulesEngine, MaximumDistanceRule
     
     with open('test_maximum_distance.json', 'r') as f:
         test_cases = json.load(f)
@@ -21,18 +24,16 @@ def run_maximum_distance_tests():
     passed = 0
     failed = 0
     
+    # Crear engine una sola vez (las reglas no guardan estado entre pares)
+    engine = RulesEngine(key='C', mode='major')
+    
+    # Solo activar MaximumDistanceRule
+    engine.enable_only('maximum_distance')
+    
     for test in test_cases:
         print(f"Test {test['id']}: {test['name']}")
         print(f"  Descripción: {test['description']}")
         
-        # Crear engine
-        engine = RulesEngine(key='C', mode='major')
-        
-        # Solo activar MaximumDistanceRule
-        for rule in engine.rules:
-            if rule.name != 'maximum_distance':
-                engine.disable_rule(rule.name)
-        
         # Validar
         errors = engine.validate_progression(test['chord1'], test['chord2'])
         md_errors = [e for e in errors if e['rule'] == 'maximum_distance']
@@ -42,21 +43,21 @@ def run_maximum_distance_tests():
                 voices_detected = md_errors[0]['voices']
                 voices_expected = test['voices_affected']
                 
-                if set(voices_detected) == set(voices_expected):
-                    print(f"  ✅ PASADO - Error detectado en {voices_detected}")
+                if norm_voices(voices_detected) == norm_voices(voices_expected):
+                    print(f"  {PASS} PASADO - Error detectado en {voices_detected}")
                     passed += 1
                 else:
-                    print(f"  ❌ FALLIDO - Voces incorrectas: esperaba {voices_expected}, obtuvo {voices_detected}")
+                    print(f"  {FAIL} FALLIDO - Voces incorrectas: esperaba {voices_expected}, obtuvo {voices_detected}")
                     failed += 1
             else:
-                print(f"  ❌ FALLIDO - Debería detectar distancia excesiva")
+                print(f"  {FAIL} FALLIDO - Debería detectar distancia excesiva")
                 failed += 1
         else:  # expected == 'OK'
             if len(md_errors) == 0:
-                print(f"  ✅ PASADO - Distancias válidas")
+                print(f"  {PASS} PASADO - Distancias válidas")
                 passed += 1
             else:
-                print(f"  ❌ FALLIDO - No debería detectar error: {md_errors[0]}")
+                print(f"  {FAIL} FALLIDO - No debería detectar error: {md_errors[0]}")
                 failed += 1
         
         print()
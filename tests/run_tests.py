@@ -4,18 +4,22 @@ Test runner para validar reglas armónicas.
 Ejecuta los casos de test definidos en test_cases.json y reporta resultados.
 """
 
+import io
 import json
 import sys
 import os
+from functools import partial
 
 # Añadir el directorio padre al path para importar harmonic_rules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from harmonic_rules import RulesEngine
+from runner_common import FAIL, PASS, WARN
 
 
 def run_tests():
     """Ejecuta todos los test cases y reporta resultados"""
+    # Import diferido: music21 (vía harmonic_rules) solo se carga al ejecutar
+    from harmonic_rules import RulesEngine
     
     # Cargar test cases
     with open('tests/test_cases.json', 'r') as f:
@@ -24,15 +28,19 @@ def run_tests():
     # Inicializar motor
     engine = RulesEngine(key="C", mode="major")
     
+    # Salida acumulada en memoria y volcada de una sola vez al final
+    out = io.StringIO()
+    emit = partial(print, file=out)
+    
     # Estadísticas
     total_tests = 0
     passed_tests = 0
     failed_tests = 0
     
-    print("=" * 80)
-    print("HARMONIC RULES TEST SUITE - Parallel Fifths")
-    print("=" * 80)
-    print()
+    emit("=" * 80)
+    emit("HARMONIC RULES TEST SUITE - Parallel Fifths")
+    emit("=" * 80)
+    emit()
     
     # Ejecutar tests de quintas paralelas
     for test in test_data['test_parallel_fifths']:
@@ -56,59 +64,60 @@ def run_tests():
         if has_errors == expected_error:
             # Test pasó
             passed_tests += 1
-            status = "✅ PASS"
+            status = f"{PASS} PASS"
             
             # Verificar excepciones si aplica
             if 'exception' in test and not has_errors:
                 exception_name = test['exception']
-                print(f"{status} [{test_id}] {test_name}")
-                print(f"         Excepción '{exception_name}' aplicada correctamente")
+                emit(f"{status} [{test_id}] {test_name}")
+                emit(f"         Excepción '{exception_name}' aplicada correctamente")
             elif has_errors:
                 # Verificar voces afectadas si están especificadas
                 if 'voices_affected' in test:
                     error = errors[0]
                     if set(error['voices']) == set(test['voices_affected']):
-                        print(f"{status} [{test_id}] {test_name}")
-                        print(f"         Detectado correctamente en voces {error['voices']}")
+                        emit(f"{status} [{test_id}] {test_name}")
+                        emit(f"         Detectado correctamente en voces {error['voices']}")
                     else:
-                        print(f"⚠️  WARN [{test_id}] {test_name}")
-                        print(f"         Esperado voces {test['voices_affected']}, " 
+                        emit(f"{WARN}  WARN [{test_id}] {test_name}")
+                        emit(f"         Esperado voces {test['voices_affected']}, " 
                               f"detectado {error['voices']}")
                 else:
-                    print(f"{status} [{test_id}] {test_name}")
-                    print(f"         Error detected: {errors[0]['short_msg']}")
+                    emit(f"{status} [{test_id}] {test_name}")
+                    emit(f"         Error detected: {errors[0]['short_msg']}")
             else:
-                print(f"{status} [{test_id}] {test_name}")
+                emit(f"{status} [{test_id}] {test_name}")
         else:
             # Test falló
             failed_tests += 1
-            status = "❌ FAIL"
-            print(f"{status} [{test_id}] {test_name}")
+            status = f"{FAIL} FAIL"
+            emit(f"{status} [{test_id}] {test_name}")
             
             if expected_error and not has_errors:
-                print(f"         Esperado: ERROR, Obtenido: OK")
+                emit(f"         Esperado: ERROR, Obtenido: OK")
                 if 'voices_affected' in test:
-                    print(f"         Debería detectar error en voces {test['voices_affected']}")
+                    emit(f"         Debería detectar error en voces {test['voices_affected']}")
             elif not expected_error and has_errors:
-                print(f"         Esperado: OK, Obtenido: ERROR")
-                print(f"         Error detectado: {errors[0]['short_msg']} en {errors[0]['voices']}")
+                emit(f"         Esperado: OK, Obtenido: ERROR")
+                emit(f"         Error detectado: {errors[0]['short_msg']} en {errors[0]['voices']}")
                 if 'exception' in test:
-                    print(f"         Debería aplicar excepción '{test['exception']}'")
+                    emit(f"         Debería aplicar excepción '{test['exception']}'")
         
-        print()
+        emit()
     
     # Resumen final
-    print("=" * 80)
-    print(f"RESULTADOS: {passed_tests}/{total_tests} tests pasados")
-    print("=" * 80)
-    print()
+    emit("=" * 80)
+    emit(f"RESULTADOS: {passed_tests}/{total_tests} tests pasados")
+    emit("=" * 80)
+    emit()
     
     if failed_tests > 0:
-        print(f"❌ {failed_tests} tests fallaron")
-        return 1
+        emit(f"{FAIL} {failed_tests} tests fallaron")
     else:
-        print("✅ Todos los tests pasaron correctamente")
-        return 0
+        emit(f"{PASS} Todos los tests pasaron correctamente")
+    
+    sys.stdout.write(out.getvalue())
+    return 1 if failed_tests > 0 else 0
 
 
 if __name__ == "__main__":
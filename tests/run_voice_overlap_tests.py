@@ -6,10 +6,13 @@ import json
 import sys
 sys.path.insert(0, '..')
 
-from harmonic_rules import RulesEngine, VoiceOverlapRule
+from runner_common import FAIL, PASS, norm_voices
+
 
 def run_voice_overlap_tests():
     """Ejecuta tests de VoiceOverlapRule"""
+    # Import diferido: music21 (vía harmonic_rules) solo se carga al ejecutar
+    from harmonic_rules import RulesEngine, VoiceOverlapRule
     
     with open('test_voice_overlap.json', 'r') as f:
         test_cases = json.load(f)
@@ -21,18 +24,16 @@ def run_voice_overlap_tests():
     passed = 0
     failed = 0
     
+    # Crear engine una sola vez (las reglas no guardan estado entre pares)
+    engine = RulesEngine(key='C', mode='major')
+    
+    # Solo activar VoiceOverlapRule
+    engine.enable_only('voice_overlap')
+    
     for test in test_cases:
         print(f"Test {test['id']}: {test['name']}")
         print(f"  Descripción: {test['description']}")
         
-        # Crear engine
-        engine = RulesEngine(key='C', mode='major')
-        
-        # Solo activar VoiceOverlapRule
-        for rule in engine.rules:
-            if rule.name != 'voice_overlap':
-                engine.disable_rule(rule.name)
-        
         # Validar
         errors = engine.validate_progression(test['chord1'], test['chord2'])
         vo_errors = [e for e in errors if e['rule'] == 'voice_overlap']
@@ -42,21 +43,21 @@ def run_voice_overlap_tests():
                 voices_detected = vo_errors[0]['voices']
                 voices_expected = test['voices_affected']
                 
-                if set(voices_detected) == set(voices_expected):
-                    print(f"  ✅ PASADO - Invasión detectada en {voices_detected}")
+                if norm_voices(voices_detected) == norm_voices(voices_expected):
+                    print(f"  {PASS} PASADO - Invasión detectada en {voices_detected}")
                     passed += 1
                 else:
-                    print(f"  ❌ FALLIDO - Voces incorrectas: esperaba {voices_expected}, obtuvo {voices_detected}")
+                    print(f"  {FAIL} FALLIDO - Voces incorrectas: esperaba {voices_expected}, obtuvo {voices_detected}")
                     failed += 1
             else:
-                print(f"  ❌ FALLIDO - Debería detectar invasión")
+                print(f"  {FAIL} FALLIDO - Debería detectar invasión")
                 failed += 1
         else:  # expected == 'OK'
             if len(vo_errors) == 0:
-                print(f"  ✅ PASADO - Sin invasiones")
+                print(f"  {PASS} PASADO - Sin invasiones")
                 passed += 1
             else:
-                print(f"  ❌ FALLIDO - No debería detectar error: {vo_errors[0]}")
+                print(f"  {FAIL} FALLIDO - No debería detectar error: {vo_errors[0]}")
                 failed += 1
         
         print()
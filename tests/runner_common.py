@@ -0,0 +1,17 @@
+"""
+Utilidades compartidas por los test runners (tests/run_*.py).
+
+Los runners se ejecutan como scripts, así que tests/ está en sys.path[0]
+y basta con 'from runner_common import ...'.
+"""
+
+import sys
+
+# Marcas de resultado: emoji solo si la consola usa UTF-8 (ASCII en otro caso)
+_UTF8 = (sys.stdout.encoding or '').lower().replace('-', '') == 'utf8'
+PASS, FAIL, WARN = ('✅', '❌', '⚠️') if _UTF8 else ('[OK]', '[FAIL]', '[WARN]')
+
+
+def norm_voices(voices):
+    """Voces como tupla ordenada (comparación independiente del orden)"""
+    return tuple(sorted(voices))
@@ -0,0 +1,79 @@
+"""
+Tests de la caché de resultados de /analizar_partitura (app.py).
+"""
+
+import pytest
+
+pytest.importorskip('flask')
+
+import app as app_module
+
+PARTITURA = [
+    {'S': 'E5', 'A': 'G4', 'T': 'C4', 'B': 'C3'},
+    {'S': 'D5', 'A': 'G4', 'T': 'B3', 'B': 'G2'},
+    {'S': 'C5', 'A': 'G4', 'T': 'E4', 'B': 'C3'},
+]
+TONALIDAD = {'tonica': 'C', 'modo': 'major'}
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    app_module._result_cache.clear()
+    yield
+    app_module._result_cache.clear()
+
+
+@pytest.fixture
+def client():
+    return app_module.app.test_client()
+
+
+def _post(client, partitura=PARTITURA):
+    return client.post('/analizar_partitura',
+                       json={'partitura': partitura, 'tonalidad': TONALIDAD})
+
+
+def test_hit_returns_same_payload(client):
+    first = _post(client)
+    assert first.status_code == 200
+    assert len(app_module._result_cache) == 1
+
+    second = _post(client)
+    assert second.status_code == 200
+    assert second.get_json() == first.get_json()
+
+    key = app_module._result_cache_key(PARTITURA, TONALIDAD)
+    assert app_module._result_cache_get(key) == first.get_json()
+
+
+def test_eviction_at_cache_size():
+    size = app_module._RESULT_CACHE_SIZE
+    for i in range(size):
+        app_module._result_cache_put(f'k{i}', {'n': i})
+    assert app_module._result_cache_get('k0') == {'n': 0}  # k0 pasa a reciente
+
+    app_module._result_cache_put('nueva', {'n': size})
+    assert len(app_module._result_cache) == size
+    assert app_module._result_cache_get('k1') is None      # la menos usada
+    assert app_module._result_cache_get('k0') == {'n': 0}
+    assert app_module._result_cache_get('nueva') == {'n': size}
+
+
+def test_invalid_input_not_cached(client):
+    response = _post(client, partitura=[{'X': 'C4'}])
+    assert response.status_code == 400
+    assert not app_module._result_cache
+
+
+def test_partial_analysis_not_cached(client, monkeypatch):
+    class FailingEngine:
+        key, mode = 'C', 'major'
+
+        def validate_progression(self, *args, **kwargs):
+            raise RuntimeError('fallo simulado')
+
+    app_module._lazy_load_analizador()  # Que la carga perezosa no pise el parche
+    monkeypatch.setattr(app_module, 'get_engine', lambda *args: FailingEngine())
+    response = _post(client)
+    assert response.status_code == 200
+    assert not app_module._result_cache
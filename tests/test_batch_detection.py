@@ -0,0 +1,101 @@
+"""
+Equivalencia de los caminos por lotes con los de un par de acordes.
+
+- Cada regla que sobrescribe detect_batch debe devolver, para cada
+  transición t → t+1 de una ChordProgression, lo mismo que
+  _detect_violation(chords[t], chords[t+1]).
+- RulesEngine.validate_progression_batch debe devolver, para cada
+  transición, lo mismo que validate_progression(chords[t], chords[t+1]).
+"""
+
+import glob
+import json
+import os
+
+import pytest
+
+from harmonic_rules import ChordProgression, HarmonicRule, RulesEngine
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Las fixtures no traen grado; aquí V con sensible duplicada (S-T), en ambas
+# posiciones de la transición, y un V7 para las reglas de séptima
+_I = {'S': 'C5', 'A': 'E4', 'T': 'G3', 'B': 'C3', 'root': 'C', 'quality': 'major', 'degree': 'I'}
+_V_DUP = {'S': 'B4', 'A': 'D4', 'T': 'B3', 'B': 'G2', 'root': 'G', 'quality': 'major', 'degree': 'V'}
+_V7 = {'S': 'F5', 'A': 'B4', 'T': 'F4', 'B': 'G2', 'root': 'G', 'quality': 'dominant7', 'degree': 'V7'}
+DOMINANT_CHORDS = [
+    {'key': 'C major', **chord} for chord in (_I, _V_DUP, _I, _V_DUP, _V_DUP, _V7, _I)
+]
+
+
+def _fixture_cases(node):
+    """Casos {chord1, chord2[, key]} de un JSON de fixtures, a cualquier profundidad"""
+    if isinstance(node, dict):
+        if 'chord1' in node and 'chord2' in node:
+            yield node
+        else:
+            for value in node.values():
+                yield from _fixture_cases(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _fixture_cases(value)
+
+
+def _fixture_progressions():
+    """Una progresión por fichero JSON: chord1, chord2 de cada caso, en orden"""
+    progressions = []
+    for path in sorted(glob.glob(os.path.join(TESTS_DIR, 'test_*.json'))):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        chords = []
+        for case in _fixture_cases(data):
+            key = case.get('key', 'C major')
+            chords += [{'key': key, **case['chord1']}, {'key': key, **case['chord2']}]
+        if len(chords) > 1:
+            progressions.append(pytest.param(chords, id=os.path.basename(path)))
+    progressions.append(pytest.param(DOMINANT_CHORDS, id='dominantes'))
+    return progressions
+
+
+BATCH_RULES = [
+    rule for rule in RulesEngine(key='C', mode='major').rules
+    if type(rule).detect_batch is not HarmonicRule.detect_batch
+]
+
+
+def test_batch_rules_present():
+    assert {type(rule).__name__ for rule in BATCH_RULES} >= {
+        'VoiceCrossingRule', 'MaximumDistanceRule', 'VoiceOverlapRule',
+        'DuplicatedLeadingToneRule', 'DuplicatedSeventhRule',
+        'ExcessiveMelodicMotionRule'
+    }
+
+
+@pytest.mark.parametrize('chords', _fixture_progressions())
+@pytest.mark.parametrize('rule', BATCH_RULES, ids=lambda rule: type(rule).__name__)
+def test_detect_batch_matches_pairwise(rule, chords):
+    batch = rule.detect_batch(ChordProgression.from_dicts(chords))
+    assert len(batch) == len(chords) - 1
+    for t, violation in enumerate(batch):
+        assert violation == rule._detect_violation(chords[t], chords[t + 1]), t
+
+
+@pytest.mark.parametrize('chords', _fixture_progressions())
+@pytest.mark.parametrize('fast_mode', [False, True], ids=['completo', 'fast_mode'])
+def test_validate_progression_batch_matches_pairwise(fast_mode, chords):
+    engine = RulesEngine(key='C', mode='major', fast_mode=fast_mode)
+    batch = engine.validate_progression_batch(chords)
+    assert len(batch) == len(chords) - 1
+    for t, errors in enumerate(batch):
+        assert errors == engine.validate_progression(chords[t], chords[t + 1]), t
+
+
+def test_validate_progression_batch_injects_engine_key():
+    # Sin 'key' en los acordes ni en el contexto: se usa la tonalidad del motor
+    chords = [{k: v for k, v in chord.items() if k != 'key'} for chord in DOMINANT_CHORDS]
+    engine = RulesEngine(key='C', mode='major')
+    batch = engine.validate_progression_batch(chords)
+    assert any(batch)
+    assert batch == [engine.validate_progression(chords[t], chords[t + 1])
+                     for t in range(len(chords) - 1)]
+    assert all('key' not in chord for chord in chords)  # No modifica la entrada
@@ -10,18 +10,53 @@ Fecha: 2025-12-28
 ================================================================================
 """
 
+import io
+import os
 import sys
-sys.path.insert(0, '..')
+from functools import partial
+
+if __name__ == "__main__":
+    # Ejecución directa: raíz del repo en el path (con pytest lo hace conftest.py)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from chord_knowledge import Chord, Progression, CHORD_DEFINITIONS
 import json
 
+# Salida de los tests: print (capturada por pytest); run_all_tests la
+# redirige a memoria y la vuelca de una sola vez al terminar
+_emit = print
+
+
+# =============================================================================
+# ACORDES DE PRUEBA - Construidos una sola vez y compartidos por los tests
+# =============================================================================
+
+def _make_chord(voices, root, quality, inversion=0, key='C major'):
+    """Construye un Chord de prueba (los tests solo lo consultan)."""
+    return Chord(voices=voices, root=root, quality=quality, key=key, inversion=inversion)
+
+
+# I en Do Mayor: C-E-G (C3, E3, G4, C5)
+I_C_MAJOR = _make_chord({'B': 'C3', 'T': 'E3', 'A': 'G4', 'S': 'C5'}, 'C', 'major')
+
+# I en Do Mayor, resolución de V7_ROOT: C-C-E-C
+I_C_MAJOR_CLOSE = _make_chord({'B': 'C3', 'T': 'C4', 'A': 'E4', 'S': 'C5'}, 'C', 'major')
+
+# V7 en Do: G-B-D-F (estado fundamental)
+V7_ROOT = _make_chord({'B': 'G2', 'T': 'B3', 'A': 'D4', 'S': 'F4'}, 'G', 'dominant-seventh')
+
+# V7/6 en Do: sensible en bajo (B-D-F-G)
+V7_INV1 = _make_chord({'B': 'B2', 'T': 'D3', 'A': 'F4', 'S': 'G4'}, 'G', 'dominant-seventh', inversion=1)
+
+# V7 sin quinta: G-B-F-B (omitir D)
+V7_NO_FIFTH = _make_chord({'B': 'G2', 'T': 'B3', 'A': 'F4', 'S': 'B4'}, 'G', 'dominant-seventh')
+
 
 def test_chord_definitions():
     """Verifica que ChordDefinitions contiene todos los tipos básicos."""
-    print("\n" + "="*60)
-    print("TEST 1: ChordDefinitions")
-    print("="*60)
+    _emit("\n" + "="*60)
+    _emit("TEST 1: ChordDefinitions")
+    _emit("="*60)
     
     required_types = [
         'major', 'minor', 'diminished',
@@ -35,35 +70,28 @@ def test_chord_definitions():
         assert 'morphology' in definition
         assert 'figured_bass' in definition
         assert 'category' in definition
-        print(f"  ✓ {chord_type}: {definition['name']}")
+        _emit(f"  ✓ {chord_type}: {definition['name']}")
     
-    print(f"\n✅ ChordDefinitions completo: {len(CHORD_DEFINITIONS)} tipos")
+    _emit(f"\n✅ ChordDefinitions completo: {len(CHORD_DEFINITIONS)} tipos")
 
 
 def test_chord_major_triad():
     """Test acorde Mayor en estado fundamental."""
-    print("\n" + "="*60)
-    print("TEST 2: Acorde Mayor (I en Do)")
-    print("="*60)
-    
-    # I en Do Mayor: C-E-G (C3, E3, G4, C5)
-    chord = Chord(
-        voices={'B': 'C3', 'T': 'E3', 'A': 'G4', 'S': 'C5'},
-        root='C',
-        quality='major',
-        key='C major',
-        inversion=0
-    )
-    
-    print(f"\nChord: {chord}")
-    print(f"Voices: {chord.voices}")
-    print(f"Factors: {chord.voice_factors}")
-    
-    # Verificar factores
-    assert chord.get_factor_for_voice('B') == '1', "Bajo debe ser fundamental"
-    assert chord.get_factor_for_voice('T') == '3', "Tenor debe ser tercera"
-    assert chord.get_factor_for_voice('A') == '5', "Alto debe ser quinta"
-    assert chord.get_factor_for_voice('S') == '1', "Soprano debe ser fundamental"
+    _emit("\n" + "="*60)
+    _emit("TEST 2: Acorde Mayor (I en Do)")
+    _emit("="*60)
+    
+    chord = I_C_MAJOR
+    
+    _emit(f"\nChord: {chord}")
+    _emit(f"Voices: {chord.voices}")
+    _emit(f"Factors: {chord.voice_factors}")
+    
+    # Verificar factores: B=fundamental, T=tercera, A=quinta, S=fundamental
+    expected = {'B': '1', 'T': '3', 'A': '5', 'S': '1'}
+    assert chord.voice_factors == expected, f"Factores esperados {expected}, got {chord.voice_factors}"
+    for voice, factor in expected.items():
+        assert chord.get_factor_for_voice(voice) == factor, f"{voice} debe ser factor {factor}"
     
     # Verificar consultas
     assert chord.has_factor('1')
@@ -86,32 +114,25 @@ def test_chord_major_triad():
     cifrado = chord.get_figured_bass()
     assert cifrado == '5/3', f"Cifrado debe ser 5/3, got {cifrado}"
     
-    print("\n✅ Acorde Mayor: Todos los tests pasados")
+    _emit("\n✅ Acorde Mayor: Todos los tests pasados")
 
 
 def test_chord_dominant_seventh():
     """Test acorde V7 en Do Mayor."""
-    print("\n" + "="*60)
-    print("TEST 3: V7 en Do Mayor (G-B-D-F)")
-    print("="*60)
-    
-    # V7 en Do: G-B-D-F (estado fundamental)
-    chord = Chord(
-        voices={'B': 'G2', 'T': 'B3', 'A': 'D4', 'S': 'F4'},
-        root='G',
-        quality='dominant-seventh',
-        key='C major',
-        inversion=0
-    )
-    
-    print(f"\nChord: {chord}")
-    print(f"Factors: {chord.voice_factors}")
-    
-    # Verificar factores
-    assert chord.get_factor_for_voice('B') == '1', "Bajo = fundamental"
-    assert chord.get_factor_for_voice('T') == '3', "Tenor = tercera (sensible)"
-    assert chord.get_factor_for_voice('A') == '5', "Alto = quinta"
-    assert chord.get_factor_for_voice('S') == '7', "Soprano = séptima"
+    _emit("\n" + "="*60)
+    _emit("TEST 3: V7 en Do Mayor (G-B-D-F)")
+    _emit("="*60)
+    
+    chord = V7_ROOT
+    
+    _emit(f"\nChord: {chord}")
+    _emit(f"Factors: {chord.voice_factors}")
+    
+    # Verificar factores: B=fundamental, T=tercera (sensible), A=quinta, S=séptima
+    expected = {'B': '1', 'T': '3', 'A': '5', 'S': '7'}
+    assert chord.voice_factors == expected, f"Factores esperados {expected}, got {chord.voice_factors}"
+    for voice, factor in expected.items():
+        assert chord.get_factor_for_voice(voice) == factor, f"{voice} debe ser factor {factor}"
     
     # Verificar séptima
     assert chord.has_seventh, "Debe tener séptima"
@@ -135,26 +156,19 @@ def test_chord_dominant_seventh():
     cifrado = chord.get_figured_bass()
     assert cifrado == '7/+', f"Cifrado debe ser 7/+, got {cifrado}"
     
-    print("\n✅ V7: Todos los tests pasados")
+    _emit("\n✅ V7: Todos los tests pasados")
 
 
 def test_chord_v7_first_inversion():
     """Test V7 en 1ª inversión."""
-    print("\n" + "="*60)
-    print("TEST 4: V7 en 1ª inversión (6/5-)")
-    print("="*60)
-    
-    # V7/6 en Do: sensible en bajo (B-D-F-G)
-    chord = Chord(
-        voices={'B': 'B2', 'T': 'D3', 'A': 'F4', 'S': 'G4'},
-        root='G',
-        quality='dominant-seventh',
-        key='C major',
-        inversion=1
-    )
-    
-    print(f"\nChord: {chord}")
-    print(f"Factors: {chord.voice_factors}")
+    _emit("\n" + "="*60)
+    _emit("TEST 4: V7 en 1ª inversión (6/5-)")
+    _emit("="*60)
+    
+    chord = V7_INV1
+    
+    _emit(f"\nChord: {chord}")
+    _emit(f"Factors: {chord.voice_factors}")
     
     # Verificar bajo es la tercera (sensible)
     assert chord.get_factor_for_voice('B') == '3', "Bajo debe ser tercera (sensible)"
@@ -163,41 +177,23 @@ def test_chord_v7_first_inversion():
     cifrado = chord.get_figured_bass()
     assert cifrado == '6/5-', f"Cifrado debe ser 6/5-, got {cifrado}"
     
-    print("\n✅ V7 Primera Inversión: Tests pasados")
+    _emit("\n✅ V7 Primera Inversión: Tests pasados")
 
 
 def test_progression_v7_to_i():
     """Test progresión V7 → I."""
-    print("\n" + "="*60)
-    print("TEST 5: Progresión V7 → I")
-    print("="*60)
-    
-    # V7 en Do
-    v7 = Chord(
-        voices={'B': 'G2', 'T': 'B3', 'A': 'D4', 'S': 'F4'},
-        root='G',
-        quality='dominant-seventh',
-        key='C major',
-        inversion=0
-    )
-    
-    # I en Do
-    i = Chord(
-        voices={'B': 'C3', 'T': 'C4', 'A': 'E4', 'S': 'C5'},
-        root='C',
-        quality='major',
-        key='C major',
-        inversion=0
-    )
-    
-    # Crear progresión
-    progression = Progression(v7, i)
-    
-    print(f"\nProgression: {progression}")
+    _emit("\n" + "="*60)
+    _emit("TEST 5: Progresión V7 → I")
+    _emit("="*60)
+    
+    # Crear progresión V7 → I en Do
+    progression = Progression(V7_ROOT, I_C_MAJOR_CLOSE)
+    
+    _emit(f"\nProgression: {progression}")
     
     # Verificar movimientos de factores
     movements = progression.get_all_factor_movements()
-    print(f"Movements: {movements}")
+    _emit(f"Movements: {movements}")
     
     # Bajo: 1 → 1 (G → C, fundamental → fundamental)
     assert movements['B'] == ('1', '1'), f"Bajo 1→1, got {movements['B']}"
@@ -218,26 +214,19 @@ def test_progression_v7_to_i():
     voices_3_to_1 = progression.get_voices_with_movement('3', '1')
     assert 'T' in voices_3_to_1, "Tenor debe hacer 3→1"
     
-    print("\n✅ Progresión V7→I: Movimientos correctos")
+    _emit("\n✅ Progresión V7→I: Movimientos correctos")
 
 
 def test_incomplete_chord():
     """Test acorde incompleto (sin 5ª)."""
-    print("\n" + "="*60)
-    print("TEST 6: Acorde V7 sin 5ª")
-    print("="*60)
-    
-    # V7 sin quinta: G-B-F-B (omitir D)
-    chord = Chord(
-        voices={'B': 'G2', 'T': 'B3', 'A': 'F4', 'S': 'B4'},
-        root='G',
-        quality='dominant-seventh',
-        key='C major',
-        inversion=0
-    )
-    
-    print(f"\nChord: {chord}")
-    print(f"Factors: {chord.voice_factors}")
+    _emit("\n" + "="*60)
+    _emit("TEST 6: Acorde V7 sin 5ª")
+    _emit("="*60)
+    
+    chord = V7_NO_FIFTH
+    
+    _emit(f"\nChord: {chord}")
+    _emit(f"Factors: {chord.voice_factors}")
     
     # Verificar factores presentes
     assert chord.has_factor('1')
@@ -256,17 +245,21 @@ def test_incomplete_chord():
     doubled = chord.get_doubled_factors()
     assert '3' in doubled, "Tercera debe estar duplicada"
     
-    print(f"Missing factors: {missing}")
-    print(f"Doubled factors: {doubled}")
+    _emit(f"Missing factors: {missing}")
+    _emit(f"Doubled factors: {doubled}")
     
-    print("\n✅ Acorde incompleto: Detectado correctamente")
+    _emit("\n✅ Acorde incompleto: Detectado correctamente")
 
 
 def run_all_tests():
     """Ejecuta todos los tests."""
-    print("\n" + "="*70)
-    print("CHORD KNOWLEDGE TESTS - Suite Completa")
-    print("="*70)
+    global _emit
+    out = io.StringIO()
+    _emit = partial(print, file=out)
+    
+    _emit("\n" + "="*70)
+    _emit("CHORD KNOWLEDGE TESTS - Suite Completa")
+    _emit("="*70)
     
     try:
         test_chord_definitions()
@@ -276,16 +269,19 @@ def run_all_tests():
         test_progression_v7_to_i()
         test_incomplete_chord()
         
-        print("\n" + "="*70)
-        print("✅ TODOS LOS TESTS PASADOS")
-        print("="*70)
+        _emit("\n" + "="*70)
+        _emit("✅ TODOS LOS TESTS PASADOS")
+        _emit("="*70)
         
     except AssertionError as e:
-        print(f"\n❌ TEST FAILED: {e}")
+        _emit(f"\n❌ TEST FAILED: {e}")
         raise
     except Exception as e:
-        print(f"\n❌ ERROR: {e}")
+        _emit(f"\n❌ ERROR: {e}")
         raise
+    finally:
+        _emit = print
+        sys.stdout.write(out.getvalue())
 
 
 if __name__ == "__main__":
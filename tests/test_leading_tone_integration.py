@@ -2,14 +2,17 @@
 Test de integración para LeadingToneResolutionRule refactorizada
 """
 
+import os
 import sys
-sys.path.insert(0, '..')
+
+if __name__ == "__main__":
+    # Ejecución directa: raíz del repo en el path (con pytest lo hace conftest.py)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from harmonic_rules import RulesEngine
 
-def test_leading_tone_resolution():
+def test_leading_tone_resolution(c_engine):
     """Test sensible tonal que resuelve correctamente."""
-    engine = RulesEngine(key='C', mode='major')
     
     # V en Do: G-B-D-G (Tenor tiene sensible B)
     chord1 = {
@@ -23,16 +26,15 @@ def test_leading_tone_resolution():
         'root': 'C', 'quality': 'major', 'key': 'C major', 'inversion': 0
     }
     
-    errors = engine.validate_progression(chord1, chord2)
-    lt_errors = [e for e in errors if e['rule'] == 'leading_tone_resolution']
+    errors = c_engine.validate_progression(chord1, chord2)
+    lt_errors = errors.by_rule.get('leading_tone_resolution', [])
     
     assert len(lt_errors) == 0, f"Esperaba 0 errores, obtuvo {len(lt_errors)}"
     print("✅ TEST 1: Sensible resuelve correctamente (B → C)")
 
 
-def test_leading_tone_no_resolution():
+def test_leading_tone_no_resolution(c_engine):
     """Test sensible tonal que NO resuelve (error esperado)."""
-    engine = RulesEngine(key='C', mode='major')
     
     # V en Do: G-B-D-G
     chord1 = {
@@ -46,8 +48,8 @@ def test_leading_tone_no_resolution():
         'root': 'C', 'quality': 'major', 'key': 'C major', 'inversion': 0
     }
     
-    errors = engine.validate_progression(chord1, chord2_bad)
-    lt_errors = [e for e in errors if e['rule'] == 'leading_tone_resolution']
+    errors = c_engine.validate_progression(chord1, chord2_bad)
+    lt_errors = errors.by_rule.get('leading_tone_resolution', [])
     
     assert len(lt_errors) > 0, "Debería detectar error"
     assert 'T' in lt_errors[0]['voices'], f"Error debería estar en Tenor, obtuvo {lt_errors[0]['voices']}"
@@ -56,8 +58,10 @@ def test_leading_tone_no_resolution():
 
 if __name__ == "__main__":
     try:
-        test_leading_tone_resolution()
-        test_leading_tone_no_resolution()
+        # Fuera de pytest: el mismo motor que construye la fixture c_engine
+        engine = RulesEngine(key='C', mode='major')
+        test_leading_tone_resolution(engine)
+        test_leading_tone_no_resolution(engine)
         print("\n✅ TODOS LOS TESTS DE LEADING TONE PASADOS")
     except AssertionError as e:
         print(f"\n❌ TEST FALLIDO: {e}")
@@ -6,7 +6,9 @@ import music21
 import sys
 import os
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if __name__ == "__main__":
+    # Ejecución directa: raíz del repo en el path (con pytest lo hace conftest.py)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from harmonic_rules import RulesEngine
 
 print("=" * 80)
@@ -0,0 +1,52 @@
+"""
+Tests de RulesEngine: modo rápido (fast_mode) y motor compartido (get_engine).
+"""
+
+import pytest
+
+from harmonic_rules import RuleTier, RulesEngine, get_engine
+
+# I → ii en Do con quintas y octavas paralelas (CRITICAL) y un salto de
+# novena en el Soprano, G4 → A5 (excessive_melodic_motion, IMPORTANT)
+CHORD1 = {'S': 'G4', 'A': 'C4', 'T': 'E3', 'B': 'C3',
+          'root': 'C', 'quality': 'major', 'degree': 'I', 'key': 'C major'}
+CHORD2 = {'S': 'A5', 'A': 'D4', 'T': 'F3', 'B': 'D3',
+          'root': 'D', 'quality': 'minor', 'degree': 'ii', 'key': 'C major'}
+
+
+def test_full_mode_returns_every_tier():
+    errors = RulesEngine(key='C', mode='major').validate_progression(CHORD1, CHORD2)
+    assert set(errors.by_rule) == {'parallel_fifths', 'parallel_octaves',
+                                   'excessive_melodic_motion'}
+
+
+def test_fast_mode_stops_after_critical():
+    full = RulesEngine(key='C', mode='major').validate_progression(CHORD1, CHORD2)
+    fast = RulesEngine(key='C', mode='major', fast_mode=True).validate_progression(CHORD1, CHORD2)
+
+    assert 'excessive_melodic_motion' not in fast.by_rule
+    assert all(error['tier'] == RuleTier.CRITICAL.value for error in fast)
+    assert fast == [error for error in full if error['tier'] == RuleTier.CRITICAL.value]
+
+
+def test_fast_mode_without_critical_checks_lower_tiers():
+    # Solo el salto del Soprano: sin error CRITICAL se evalúan todos los tiers
+    chord2 = {**CHORD1, 'S': 'A5'}
+    fast = RulesEngine(key='C', mode='major', fast_mode=True).validate_progression(CHORD1, chord2)
+    assert 'excessive_melodic_motion' in fast.by_rule
+
+
+@pytest.mark.parametrize('toggle', ['enable_rule', 'disable_rule', 'enable_only'])
+def test_shared_engine_refuses_toggles(toggle):
+    engine = get_engine('C', 'major')
+    with pytest.raises(RuntimeError):
+        getattr(engine, toggle)('parallel_fifths')
+    assert all(rule.enabled for rule in engine.rules)
+    assert get_engine('C', 'major') is engine
+
+
+def test_own_engine_allows_toggles():
+    engine = RulesEngine(key='C', mode='major')
+    engine.enable_only('parallel_fifths')
+    assert [rule.name for rule in engine.get_active_rules()] == ['parallel_fifths']
+    assert all(rule.enabled for rule in get_engine('C', 'major').rules)